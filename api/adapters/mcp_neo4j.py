@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, AsyncIterator, Dict, List
 from api.logging import setup_logging
 logger = setup_logging()
 from neo4j import AsyncGraphDatabase, AsyncDriver
@@ -11,6 +12,7 @@ class Neo4jMCP:
     """
     비동기 Neo4j 어댑터 (MCP 스타일)
     - query: Cypher 실행 후 list[dict] 반환
+    - query_stream: Cypher 결과를 레코드 단위로 스트리밍
     - ping: 연결 확인
     """
 
@@ -56,39 +58,44 @@ class Neo4jMCP:
             info["error"] = f"basic ping failed: {e!s}"
             return info
 
-        # 2) 현재 세션 DB 이름 조회 (버전 호환: 5.x → SHOW, 4.x → CALL db.info())
-        current_db: List[Dict[str, Any]] = []
-        try:
-            async with driver.session(database=self._database) as session:
-                # 우선 5.x 구문 시도
-                cur = await session.run("SHOW CURRENT DATABASE")
-                current_db = [rec.data() async for rec in cur]
-        except Exception:
+        # 2)와 3)은 서로 독립적인 조회이므로 동시에 실행 (세션은 동시 실행 불가 → 각자 풀에서 획득)
+        async def _current_database() -> None:
+            # 2) 현재 세션 DB 이름 조회 (버전 호환: 5.x → SHOW, 4.x → CALL db.info())
+            current_db: List[Dict[str, Any]] = []
             try:
                 async with driver.session(database=self._database) as session:
-                    cur = await session.run("CALL db.info() YIELD name RETURN name")
+                    # 우선 5.x 구문 시도
+                    cur = await session.run("SHOW CURRENT DATABASE")
                     current_db = [rec.data() async for rec in cur]
+            except Exception:
+                try:
+                    async with driver.session(database=self._database) as session:
+                        cur = await session.run("CALL db.info() YIELD name RETURN name")
+                        current_db = [rec.data() async for rec in cur]
+                except Exception as e:
+                    info["current_database_error"] = str(e)
+            if current_db:
+                info["current_database"] = current_db
+
+        async def _databases() -> None:
+            # 3) 전체 DB 목록은 system DB에서 (권한 필요). 중복 제거.
+            try:
+                async with driver.session(database="system") as sys_sess:
+                    cur = await sys_sess.run(
+                        "SHOW DATABASES YIELD name, currentStatus, default "
+                        "RETURN name, currentStatus, default ORDER BY name"
+                    )
+                    rows = [rec.data() async for rec in cur]
+                    dedup = {}
+                    for r in rows:
+                        dedup[r["name"]] = r  # 같은 이름이 오면 마지막 값으로 덮어씀
+                    info["databases"] = list(dedup.values())
             except Exception as e:
-                info["current_database_error"] = str(e)
-        if current_db:
-            info["current_database"] = current_db
-
-        # 3) 전체 DB 목록은 system DB에서 (권한 필요). 중복 제거.
-        try:
-            async with driver.session(database="system") as sys_sess:
-                cur = await sys_sess.run(
-                    "SHOW DATABASES YIELD name, currentStatus, default "
-                    "RETURN name, currentStatus, default ORDER BY name"
+                info["databases_error"] = (
+                    f"SHOW DATABASES failed (need permissions?): {e!s}"
                 )
-                rows = [rec.data() async for rec in cur]
-                dedup = {}
-                for r in rows:
-                    dedup[r["name"]] = r  # 같은 이름이 오면 마지막 값으로 덮어씀
-                info["databases"] = list(dedup.values())
-        except Exception as e:
-            info["databases_error"] = (
-                f"SHOW DATABASES failed (need permissions?): {e!s}"
-            )
+
+        await asyncio.gather(_current_database(), _databases())
         return info
 
     def _to_jsonable(self, value: Any) -> Any:
@@ -165,3 +172,26 @@ class Neo4jMCP:
                 jsonable = {k: self._to_jsonable(v) for k, v in raw.items()}
                 records.append(jsonable)
             return records
+
+    async def query_stream(
+        self,
+        cypher: str,
+        params: Dict[str, Any] | None = None,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Cypher 결과를 레코드 단위로 yield (전체 리스트를 만들지 않음)
+        - 중간에 멈추면 세션 종료 시 남은 레코드는 DISCARD되어 전송되지 않음
+        - fetch_size: 한 번에 당겨올 레코드 수 (필요한 개수만큼 지정 권장)
+        - 조기 종료 시 contextlib.aclosing으로 감싸 세션을 바로 반납할 것
+        """
+        params = params or {}
+        driver = await self._ensure_driver()
+        logger.debug(f"[Neo4j] Cypher(stream)={cypher} params={params}")
+        session_kwargs: Dict[str, Any] = {"database": self._database}
+        if fetch_size:
+            session_kwargs["fetch_size"] = fetch_size
+        async with driver.session(**session_kwargs) as session:
+            cursor = await session.run(cypher, params)
+            async for record in cursor:
+                yield {k: self._to_jsonable(v) for k, v in record.data().items()}
@@ -5,14 +5,14 @@ from api.logging import setup_logging
 from opensearchpy import OpenSearch, helpers
 import anyio
 import requests
-import json
+import orjson
 from requests.auth import HTTPBasicAuth
 from api.config import settings
 logger = setup_logging()
 class OpenSearchMCP:
     """
     OpenSearch 어댑터 (동기 클라이언트를 비동기에서 사용)
-    - search / get / bulk / ping
+    - search / msearch / get / bulk / ping
     """
     def __init__(self) -> None:
         self._host = settings.opensearch_host
@@ -38,6 +38,12 @@ class OpenSearchMCP:
             )
         return self._client
 
+    async def close(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await anyio.to_thread.run_sync(client.close)
+            logger.info("[OS] Client closed")
+
     async def ping(self) -> bool:
         def _ping() -> bool:
             return self._get_client().ping()
@@ -59,8 +65,8 @@ class OpenSearchMCP:
                 "from": from_
             }
             
-            # UTF-8 인코딩으로 JSON 직렬화
-            json_data = json.dumps(search_body, ensure_ascii=False)
+            # UTF-8 JSON 직렬화 (orjson은 바로 bytes 반환)
+            json_data = orjson.dumps(search_body)
             
             headers = {
                 'Content-Type': 'application/json; charset=utf-8'
@@ -68,14 +74,14 @@ class OpenSearchMCP:
             
             response = requests.post(
                 url,
-                data=json_data.encode('utf-8'),
+                data=json_data,
                 headers=headers,
                 auth=HTTPBasicAuth(self._user, self._password),
                 timeout=30
             )
             
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.error(f"[OS] search index={index} q={query}")
                 logger.error(f"[OS] search error: {response.status_code} - {response.text}")
@@ -84,6 +90,42 @@ class OpenSearchMCP:
         logger.debug(f"[OS] search index={index} q={query}")
         return await anyio.to_thread.run_sync(_search)
 
+    async def msearch(self, index: str, bodies: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        여러 검색 본문을 _msearch 한 번의 왕복으로 실행
+        bodies: size/from을 포함한 검색 본문 목록 (응답 responses는 같은 순서)
+        """
+        def _msearch() -> Dict[str, Any]:
+            url = f"{self._host}/{index}/_msearch"
+
+            # NDJSON: 검색마다 헤더 줄({}) + 본문 줄, 마지막 줄도 개행으로 끝나야 함
+            lines = []
+            for body in bodies:
+                lines.append(b"{}")
+                lines.append(orjson.dumps(body))
+            ndjson_data = b"\n".join(lines) + b"\n"
+
+            headers = {
+                'Content-Type': 'application/x-ndjson; charset=utf-8'
+            }
+
+            response = requests.post(
+                url,
+                data=ndjson_data,
+                headers=headers,
+                auth=HTTPBasicAuth(self._user, self._password),
+                timeout=30
+            )
+
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            else:
+                logger.error(f"[OS] msearch error: {response.status_code} - {response.text}")
+                raise Exception(f"OpenSearch msearch failed: {response.status_code} - {response.text}")
+
+        logger.debug(f"[OS] msearch index={index} count={len(bodies)}")
+        return await anyio.to_thread.run_sync(_msearch)
+
     async def get(self, index: str, id: str) -> Dict[str, Any]:
         def _get() -> Dict[str, Any]:
             return self._get_client().get(index=index, id=id)
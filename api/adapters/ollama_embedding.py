@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import List, Dict, Any
-import json
+import orjson
 import requests
 import anyio
 from api.config import settings
@@ -46,13 +46,13 @@ class OllamaEmbeddingMCP:
             try:
                 response = requests.post(
                     url,
-                    data=json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+                    data=orjson.dumps(payload),
                     headers=headers,
                     timeout=30
                 )
 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     return result.get("embedding", [])
                 else:
                     logger.error(f"[BGE-M3] embedding error: {response.status_code} - {response.text}")
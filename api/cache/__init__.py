@@ -8,8 +8,11 @@ from .multi_level_cache import (
     CacheLevel,
     CacheEntry,
     CacheStats,
+    CountMinSketch,
     multi_level_cache,
-    cache_key_generator
+    cache_key_generator,
+    get_stats_cached,
+    request_stats_scope
 )
 
 from .cache_decorators import (
@@ -46,6 +49,7 @@ __all__ = [
     "CacheLevel",
     "CacheEntry",
     "CacheStats",
+    "CountMinSketch",
 
     # Global instances
     "multi_level_cache",
@@ -65,6 +69,8 @@ __all__ = [
 
     # Utilities
     "cache_key_generator",
+    "get_stats_cached",
+    "request_stats_scope",
     "CachingContext",
     "CacheMetrics",
 
@@ -52,8 +52,8 @@ def multi_cache(
             else:
                 cache_key = cache_key_generator(cache_prefix, *args, **kwargs)
 
-            # Try to get from cache
-            cached_value = await multi_level_cache.get(cache_key)
+            # Try to get from cache, only from the levels this decorator writes to
+            cached_value = await multi_level_cache.get(cache_key, cache_levels=cache_levels)
             if cached_value is not None:
                 logger.debug(f"Cache hit for {cache_key}")
                 return cached_value
@@ -339,6 +339,18 @@ class CacheMetrics:
         self.cache_misses += 1
         self.total_latency_ms += latency_ms
 
+    def record_hits_bulk(self, latencies_ms: List[float]):
+        """Record a batch of cache hits at once."""
+        self.request_count += len(latencies_ms)
+        self.cache_hits += len(latencies_ms)
+        self.total_latency_ms += sum(latencies_ms)
+
+    def record_misses_bulk(self, latencies_ms: List[float]):
+        """Record a batch of cache misses at once."""
+        self.request_count += len(latencies_ms)
+        self.cache_misses += len(latencies_ms)
+        self.total_latency_ms += sum(latencies_ms)
+
     def to_dict(self) -> dict:
         """Convert metrics to dictionary."""
         return {
@@ -1,22 +1,56 @@
 """Multi-level caching system with L1 (Memory), L2 (Redis), and L3 (Disk) tiers."""
 
 import asyncio
-import json
 import hashlib
 import pickle
 import time
 import os
+import zlib
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Union, Callable, List
-from collections import OrderedDict
+from typing import Any, Dict, Optional, Union, Callable, List, Tuple
+from fnmatch import fnmatchcase
 from pathlib import Path
 import logging
 import aiofiles
+import orjson
 import redis.asyncio as redis
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+try:
+    import zstandard
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=1)
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# 1-byte format tags prefixed to L2/L3 payloads; untagged data is a legacy raw pickle
+_PAYLOAD_ZSTD = 1
+_PAYLOAD_ZLIB = 2
+
+
+def _encode_payload(entry: Any) -> bytes:
+    """Serialize and compress an entry for L2/L3 (zstd level 1, zlib level 1 fallback)."""
+    raw = pickle.dumps(entry)
+    if ZSTD_AVAILABLE:
+        return bytes((_PAYLOAD_ZSTD,)) + _ZSTD_COMPRESSOR.compress(raw)
+    return bytes((_PAYLOAD_ZLIB,)) + zlib.compress(raw, 1)
+
+
+def _decode_payload(data: bytes) -> Any:
+    """Inverse of _encode_payload; also reads payloads written before compression."""
+    tag = data[0]
+    if tag == _PAYLOAD_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd payload but zstandard is not installed")
+        return pickle.loads(_ZSTD_DECOMPRESSOR.decompress(data[1:]))
+    if tag == _PAYLOAD_ZLIB:
+        return pickle.loads(zlib.decompress(data[1:]))
+    return pickle.loads(data)
+
 
 class CacheLevel(Enum):
     """Cache level definitions."""
@@ -69,6 +103,7 @@ class CacheEntry:
     access_count: int = 0
     last_access: float = field(default_factory=time.time)
     cache_level: CacheLevel = CacheLevel.L1_MEMORY
+    slot: int = -1
 
     def is_expired(self) -> bool:
         """Check if entry has expired."""
@@ -80,78 +115,175 @@ class CacheEntry:
         self.last_access = time.time()
 
 
+# Translation table halving every byte counter, used to age the sketch
+_HALVE_TABLE = bytes(i >> 1 for i in range(256))
+
+
+class CountMinSketch:
+    """
+    Approximate access-frequency counter for TinyLFU-style admission.
+
+    Keeps ``depth`` rows of ``width`` saturating byte counters. Row indexes are
+    taken from 16-bit slices of the key's hash, so ``depth`` is at most 4. After
+    ``10 * width`` increments every counter is halved, so old popularity fades.
+    """
+
+    def __init__(self, width: int = 1024, depth: int = 4):
+        self.width = width
+        self.depth = min(depth, 4)
+        self._rows = [bytearray(width) for _ in range(self.depth)]
+        self._sample_size = 10 * width
+        self._additions = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        return [((h >> (16 * i)) & 0xFFFF) % self.width for i in range(self.depth)]
+
+    def increment(self, key: str):
+        """Count one access to ``key``."""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < 255:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._rows = [row.translate(_HALVE_TABLE) for row in self._rows]
+            self._additions //= 2
+
+    def estimate(self, key: str) -> int:
+        """Estimated access count of ``key`` (never underestimates before aging)."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+
 class L1MemoryCache:
-    """Level 1: In-memory cache using LRU eviction."""
+    """
+    Level 1: In-memory cache using CLOCK eviction.
+
+    Entries live in a fixed array of slots with one reference bit each. A hit only
+    sets the bit, and eviction sweeps a hand over the slots, giving referenced
+    entries a second chance. None of the operations await, so they run atomically
+    on the event loop without a lock.
+    """
 
     def __init__(self, max_size: int = 100, max_memory_mb: int = 100):
         self.max_size = max_size
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
-        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.cache: Dict[str, CacheEntry] = {}
         self.current_memory_bytes = 0
-        self._lock = asyncio.Lock()
+        self._slots: List[Optional[str]] = [None] * max_size
+        self._ref_bits = bytearray(max_size)
+        self._free_slots = list(range(max_size - 1, -1, -1))
+        self._hand = 0
+
+    def _remove(self, key: str) -> CacheEntry:
+        """Drop an entry and release its slot."""
+        entry = self.cache.pop(key)
+        self._slots[entry.slot] = None
+        self._ref_bits[entry.slot] = 0
+        self._free_slots.append(entry.slot)
+        self.current_memory_bytes -= entry.size_bytes
+        return entry
+
+    def _evict_one(self):
+        """Advance the clock hand to the first unreferenced entry and evict it."""
+        slots, ref_bits = self._slots, self._ref_bits
+        hand = self._hand
+        while True:
+            if slots[hand] is not None:
+                if not ref_bits[hand]:
+                    break
+                ref_bits[hand] = 0
+            hand = (hand + 1) % self.max_size
+        self._hand = (hand + 1) % self.max_size
+        victim = slots[hand]
+        self._remove(victim)
+        logger.debug(f"L1 evicted: {victim}")
+
+    def peek_victim(self) -> Optional[str]:
+        """Key the next insert would evict, or None while the cache has free slots."""
+        if len(self.cache) < self.max_size:
+            return None
+
+        first_referenced = None
+        for offset in range(self.max_size):
+            slot = (self._hand + offset) % self.max_size
+            key = self._slots[slot]
+            if key is not None:
+                if not self._ref_bits[slot]:
+                    return key
+                if first_referenced is None:
+                    first_referenced = key
+        return first_referenced
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from L1 cache."""
-        async with self._lock:
-            if key not in self.cache:
-                return None
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
 
-            entry = self.cache[key]
-            if entry.is_expired():
-                del self.cache[key]
-                self.current_memory_bytes -= entry.size_bytes
-                return None
+        if entry.is_expired():
+            self._remove(key)
+            return None
 
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
-            entry.update_access()
-            return entry.value
+        # Mark as recently used; no reordering needed
+        self._ref_bits[entry.slot] = 1
+        entry.update_access()
+        return entry.value
 
     async def set(self, key: str, value: Any, ttl: float = 300.0) -> bool:
         """Set value in L1 cache."""
-        async with self._lock:
-            # Calculate size
-            size_bytes = len(pickle.dumps(value))
+        # Calculate size
+        size_bytes = len(pickle.dumps(value))
 
-            # Check if we need to evict
-            while (len(self.cache) >= self.max_size or
-                   self.current_memory_bytes + size_bytes > self.max_memory_bytes):
-                if not self.cache:
-                    break
-                # Remove least recently used
-                lru_key, lru_entry = self.cache.popitem(last=False)
-                self.current_memory_bytes -= lru_entry.size_bytes
-                logger.debug(f"L1 evicted: {lru_key}")
+        if key in self.cache:
+            self._remove(key)
 
-            # Add new entry
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                timestamp=time.time(),
-                ttl=ttl,
-                size_bytes=size_bytes,
-                cache_level=CacheLevel.L1_MEMORY
-            )
-            self.cache[key] = entry
-            self.current_memory_bytes += size_bytes
+        # Check if we need to evict
+        while self.cache and (len(self.cache) >= self.max_size or
+                              self.current_memory_bytes + size_bytes > self.max_memory_bytes):
+            self._evict_one()
 
-            return True
+        if not self._free_slots:
+            return False
+
+        # Add new entry
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            timestamp=time.time(),
+            ttl=ttl,
+            size_bytes=size_bytes,
+            cache_level=CacheLevel.L1_MEMORY,
+            slot=self._free_slots.pop()
+        )
+        self._slots[entry.slot] = key
+        self.cache[key] = entry
+        self.current_memory_bytes += size_bytes
+
+        return True
 
     async def delete(self, key: str) -> bool:
         """Delete entry from L1 cache."""
-        async with self._lock:
-            if key in self.cache:
-                entry = self.cache[key]
-                del self.cache[key]
-                self.current_memory_bytes -= entry.size_bytes
-                return True
-            return False
+        if key in self.cache:
+            self._remove(key)
+            return True
+        return False
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete L1 entries whose key matches a glob pattern."""
+        keys = [key for key in self.cache if fnmatchcase(key, pattern)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
 
     async def clear(self):
         """Clear all L1 cache entries."""
-        async with self._lock:
-            self.cache.clear()
-            self.current_memory_bytes = 0
+        self.cache.clear()
+        self.current_memory_bytes = 0
+        self._slots = [None] * self.max_size
+        self._ref_bits = bytearray(self.max_size)
+        self._free_slots = list(range(self.max_size - 1, -1, -1))
+        self._hand = 0
 
     def get_stats(self) -> Dict[str, Any]:
         """Get L1 cache statistics."""
@@ -200,7 +332,7 @@ class L2RedisCache:
             data = await self.client.get(redis_key)
 
             if data:
-                entry = pickle.loads(data)
+                entry = _decode_payload(data)
                 if isinstance(entry, CacheEntry) and not entry.is_expired():
                     entry.update_access()
                     # Update access count in Redis
@@ -230,7 +362,7 @@ class L2RedisCache:
             )
 
             redis_key = self._make_key(key)
-            data = pickle.dumps(entry)
+            data = _encode_payload(entry)
             await self.client.setex(redis_key, int(ttl), data)
             return True
 
@@ -238,6 +370,65 @@ class L2RedisCache:
             logger.warning(f"L2 Redis set error: {e}")
             return False
 
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values in one pipelined round trip; missing keys are omitted."""
+        if not keys:
+            return {}
+
+        try:
+            if not self.client:
+                await self.connect()
+
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(self._make_key(key))
+                payloads = await pipe.execute()
+
+        except Exception as e:
+            logger.warning(f"L2 Redis get_many error: {e}")
+            return {}
+
+        found = {}
+        for key, data in zip(keys, payloads):
+            if not data:
+                continue
+            try:
+                entry = _decode_payload(data)
+            except Exception as e:
+                logger.warning(f"L2 Redis decode error for {key}: {e}")
+                continue
+            if isinstance(entry, CacheEntry) and not entry.is_expired():
+                found[key] = entry.value
+        return found
+
+    async def set_many(self, items: Dict[str, Tuple[Any, float]]) -> bool:
+        """Set several (value, ttl) items in one pipelined round trip."""
+        if not items:
+            return True
+
+        try:
+            if not self.client:
+                await self.connect()
+
+            now = time.time()
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, (value, ttl) in items.items():
+                    entry = CacheEntry(
+                        key=key,
+                        value=value,
+                        timestamp=now,
+                        ttl=ttl,
+                        size_bytes=len(pickle.dumps(value)),
+                        cache_level=CacheLevel.L2_REDIS
+                    )
+                    pipe.setex(self._make_key(key), int(ttl), _encode_payload(entry))
+                await pipe.execute()
+            return True
+
+        except Exception as e:
+            logger.warning(f"L2 Redis set_many error: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete entry from L2 cache."""
         if not self.client:
@@ -252,30 +443,46 @@ class L2RedisCache:
             logger.warning(f"L2 Redis delete error: {e}")
             return False
 
-    async def clear(self):
-        """Clear all L2 cache entries with prefix."""
+    async def delete_pattern(self, pattern: str, batch: int = 500) -> int:
+        """
+        Delete L2 entries whose key matches a glob pattern.
+
+        Walks the keyspace with SCAN and removes each batch with UNLINK, so
+        Redis is never blocked by KEYS or a synchronous bulk DEL.
+
+        Args:
+            pattern: Redis glob pattern, applied after the key prefix
+            batch: SCAN COUNT hint per round trip
+        """
         if not self.client:
             await self.connect()
 
+        deleted = 0
         try:
-            pattern = f"{self.prefix}*"
+            match = self._make_key(pattern)
             cursor = 0
             while True:
-                cursor, keys = await self.client.scan(cursor, match=pattern, count=100)
+                cursor, keys = await self.client.scan(cursor, match=match, count=batch)
                 if keys:
-                    await self.client.delete(*keys)
+                    deleted += await self.client.unlink(*keys)
                 if cursor == 0:
                     break
 
         except Exception as e:
-            logger.warning(f"L2 Redis clear error: {e}")
+            logger.warning(f"L2 Redis pattern delete error: {e}")
+
+        return deleted
+
+    async def clear(self):
+        """Clear all L2 cache entries with prefix."""
+        await self.delete_pattern("*")
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get L2 cache statistics."""
-        if not self.client:
-            await self.connect()
-
         try:
+            if not self.client:
+                await self.connect()
+
             info = await self.client.info("memory")
             pattern = f"{self.prefix}*"
             keys = await self.client.keys(pattern)
@@ -308,8 +515,8 @@ class L3DiskCache:
         """Load cache index from disk."""
         if self.index_file.exists():
             try:
-                with open(self.index_file, 'r') as f:
-                    self.index = json.load(f)
+                with open(self.index_file, 'rb') as f:
+                    self.index = orjson.loads(f.read())
             except Exception as e:
                 logger.warning(f"L3 index load error: {e}")
                 self.index = {}
@@ -317,8 +524,8 @@ class L3DiskCache:
     async def _save_index(self):
         """Save cache index to disk."""
         try:
-            async with aiofiles.open(self.index_file, 'w') as f:
-                await f.write(json.dumps(self.index))
+            async with aiofiles.open(self.index_file, 'wb') as f:
+                await f.write(orjson.dumps(self.index))
         except Exception as e:
             logger.warning(f"L3 index save error: {e}")
 
@@ -347,7 +554,7 @@ class L3DiskCache:
             try:
                 async with aiofiles.open(cache_file, 'rb') as f:
                     data = await f.read()
-                    entry = pickle.loads(data)
+                    entry = _decode_payload(data)
 
                 if isinstance(entry, CacheEntry):
                     entry.update_access()
@@ -396,7 +603,7 @@ class L3DiskCache:
                 cache_file.parent.mkdir(parents=True, exist_ok=True)
 
                 async with aiofiles.open(cache_file, 'wb') as f:
-                    await f.write(pickle.dumps(entry))
+                    await f.write(_encode_payload(entry))
 
                 # Update index
                 self.index[key] = {
@@ -433,6 +640,25 @@ class L3DiskCache:
                 logger.warning(f"L3 disk delete error: {e}")
                 return False
 
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete L3 entries whose key matches a glob pattern."""
+        async with self._lock:
+            deleted = 0
+            try:
+                for key in [key for key in self.index if fnmatchcase(key, pattern)]:
+                    cache_file = self._get_cache_file(key)
+                    if cache_file.exists():
+                        cache_file.unlink()
+                    del self.index[key]
+                    deleted += 1
+
+            except Exception as e:
+                logger.warning(f"L3 disk pattern delete error: {e}")
+
+            if deleted:
+                await self._save_index()
+            return deleted
+
     async def clear(self):
         """Clear all L3 cache entries."""
         async with self._lock:
@@ -513,7 +739,8 @@ class MultiLevelCache:
     async def get(
         self,
         key: str,
-        promotion: bool = True
+        promotion: bool = True,
+        cache_levels: Optional[List[CacheLevel]] = None
     ) -> Optional[Any]:
         """
         Get value from cache hierarchy.
@@ -521,11 +748,15 @@ class MultiLevelCache:
         Args:
             key: Cache key
             promotion: If True, promote value to higher cache levels
+            cache_levels: Levels to consult; all levels if not specified. Values
+                written to L1 only never need an L2/L3 round trip on a miss.
 
         Returns:
             Cached value or None
         """
         start_time = time.time()
+        check_l2 = cache_levels is None or CacheLevel.L2_REDIS in cache_levels
+        check_l3 = cache_levels is None or CacheLevel.L3_DISK in cache_levels
 
         # Try L1 first
         value = await self.l1_cache.get(key)
@@ -537,7 +768,7 @@ class MultiLevelCache:
             return value
 
         # Try L2
-        if self.enable_l2 and self.l2_cache:
+        if check_l2 and self.enable_l2 and self.l2_cache:
             value = await self.l2_cache.get(key)
             if value is not None:
                 self.stats.l2_hits += 1
@@ -552,7 +783,7 @@ class MultiLevelCache:
                 return value
 
         # Try L3
-        if self.enable_l3 and self.l3_cache:
+        if check_l3 and self.enable_l3 and self.l3_cache:
             value = await self.l3_cache.get(key)
             if value is not None:
                 self.stats.l3_hits += 1
@@ -617,6 +848,91 @@ class MultiLevelCache:
 
         return success
 
+    async def mget_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several keys, batching the L2 lookups into one Redis round trip.
+
+        L2 and L3 hits are promoted to L1 (L3 hits to L2 as well, in one batch).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of found keys to their values; missing keys are omitted
+        """
+        start_time = time.time()
+        found: Dict[str, Any] = {}
+
+        for key in keys:
+            value = await self.l1_cache.get(key)
+            if value is not None:
+                found[key] = value
+        self.stats.l1_hits += len(found)
+
+        remaining = [key for key in keys if key not in found]
+        if remaining and self.enable_l2 and self.l2_cache:
+            l2_found = await self.l2_cache.get_many(remaining)
+            for key, value in l2_found.items():
+                await self.l1_cache.set(key, value)
+            found.update(l2_found)
+            self.stats.l2_hits += len(l2_found)
+            remaining = [key for key in remaining if key not in l2_found]
+
+        if remaining and self.enable_l3 and self.l3_cache:
+            l3_found = {}
+            for key in remaining:
+                value = await self.l3_cache.get(key)
+                if value is not None:
+                    l3_found[key] = value
+                    await self.l1_cache.set(key, value)
+            if l3_found and self.enable_l2 and self.l2_cache:
+                await self.l2_cache.set_many({key: (value, 1800) for key, value in l3_found.items()})
+            found.update(l3_found)
+            self.stats.l3_hits += len(l3_found)
+
+        self.stats.hits += len(found)
+        self.stats.misses += len(keys) - len(found)
+        if keys:
+            self._update_response_time(start_time)
+        return found
+
+    async def mset_many(
+        self,
+        items: Dict[str, Tuple[Any, float]],
+        cache_levels: Optional[List[CacheLevel]] = None
+    ) -> bool:
+        """
+        Set several (value, ttl) items, batching the L2 writes into one Redis round trip.
+
+        Args:
+            items: Mapping of cache key to (value, ttl)
+            cache_levels: Specific cache levels to write to; all enabled levels if not specified
+
+        Returns:
+            Success status
+        """
+        if cache_levels is None:
+            cache_levels = [CacheLevel.L1_MEMORY]
+            if self.enable_l2:
+                cache_levels.append(CacheLevel.L2_REDIS)
+            if self.enable_l3:
+                cache_levels.append(CacheLevel.L3_DISK)
+
+        success = True
+
+        if CacheLevel.L1_MEMORY in cache_levels:
+            for key, (value, ttl) in items.items():
+                success &= await self.l1_cache.set(key, value, ttl)
+
+        if CacheLevel.L2_REDIS in cache_levels and self.enable_l2 and self.l2_cache:
+            success &= await self.l2_cache.set_many(items)
+
+        if CacheLevel.L3_DISK in cache_levels and self.enable_l3 and self.l3_cache:
+            for key, (value, ttl) in items.items():
+                success &= await self.l3_cache.set(key, value, ttl)
+
+        return success
+
     async def delete(self, key: str) -> bool:
         """Delete value from all cache levels."""
         success = True
@@ -632,6 +948,39 @@ class MultiLevelCache:
 
         return success
 
+    async def delete_pattern(
+        self,
+        pattern: str,
+        cache_levels: Optional[List[CacheLevel]] = None,
+        batch: int = 500
+    ) -> int:
+        """
+        Delete entries whose key matches a glob pattern.
+
+        Args:
+            pattern: Glob pattern matched against cache keys (e.g. "chat_context:*")
+            cache_levels: Levels to delete from; all levels if not specified
+            batch: Redis SCAN COUNT hint for the L2 level
+
+        Returns:
+            Number of entries deleted across all levels
+        """
+        if cache_levels is None:
+            cache_levels = [CacheLevel.L1_MEMORY, CacheLevel.L2_REDIS, CacheLevel.L3_DISK]
+
+        deleted = 0
+
+        if CacheLevel.L1_MEMORY in cache_levels:
+            deleted += await self.l1_cache.delete_pattern(pattern)
+
+        if CacheLevel.L2_REDIS in cache_levels and self.enable_l2 and self.l2_cache:
+            deleted += await self.l2_cache.delete_pattern(pattern, batch)
+
+        if CacheLevel.L3_DISK in cache_levels and self.enable_l3 and self.l3_cache:
+            deleted += await self.l3_cache.delete_pattern(pattern)
+
+        return deleted
+
     async def clear(self, cache_levels: Optional[List[CacheLevel]] = None):
         """Clear specified cache levels or all if not specified."""
         if cache_levels is None:
@@ -700,7 +1049,8 @@ class MultiLevelCache:
         self,
         data_loader: Callable,
         keys: List[str],
-        cache_levels: Optional[List[CacheLevel]] = None
+        cache_levels: Optional[List[CacheLevel]] = None,
+        concurrency: int = 1
     ):
         """
         Warm up cache with preloaded data.
@@ -709,19 +1059,25 @@ class MultiLevelCache:
             data_loader: Async function to load data for a key
             keys: List of keys to preload
             cache_levels: Cache levels to warm up
+            concurrency: Maximum number of keys loaded at the same time
         """
         if cache_levels is None:
             cache_levels = [CacheLevel.L1_MEMORY]
 
-        success_count = 0
-        for key in keys:
-            try:
-                value = await data_loader(key)
-                if value is not None:
-                    await self.set(key, value, cache_levels=cache_levels)
-                    success_count += 1
-            except Exception as e:
-                logger.warning(f"Cache warmup failed for key {key}: {e}")
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def warm_one(key: str) -> bool:
+            async with semaphore:
+                try:
+                    value = await data_loader(key)
+                    if value is not None:
+                        await self.set(key, value, cache_levels=cache_levels)
+                        return True
+                except Exception as e:
+                    logger.warning(f"Cache warmup failed for key {key}: {e}")
+                return False
+
+        success_count = sum(await asyncio.gather(*(warm_one(key) for key in keys)))
 
         logger.info(f"Cache warmup completed: {success_count}/{len(keys)} keys loaded")
 
@@ -765,6 +1121,36 @@ def _create_multi_level_cache() -> MultiLevelCache:
 multi_level_cache = _create_multi_level_cache()
 
 
+# Per-request holder for the get_all_stats() fetch; None outside a request scope
+_request_stats: ContextVar[Optional[Dict[str, "asyncio.Future"]]] = ContextVar("request_cache_stats", default=None)
+
+
+async def get_stats_cached(cache: Optional[MultiLevelCache] = None) -> Dict[str, Any]:
+    """
+    Get cache statistics, reusing the snapshot already taken in this request.
+
+    Concurrent callers in the same request share one in-flight fetch.
+    Outside of request_stats_scope() this always fetches fresh statistics.
+    """
+    cache = cache or multi_level_cache
+    scope = _request_stats.get()
+    if scope is None:
+        return await cache.get_all_stats()
+
+    if "stats" not in scope:
+        scope["stats"] = asyncio.ensure_future(cache.get_all_stats())
+    return await scope["stats"]
+
+
+async def request_stats_scope():
+    """FastAPI dependency that scopes get_stats_cached() to a single request."""
+    token = _request_stats.set({})
+    try:
+        yield
+    finally:
+        _request_stats.reset(token)
+
+
 def cache_key_generator(prefix: str, *args, **kwargs) -> str:
     """Generate cache key from arguments."""
     key_parts = [prefix]
@@ -21,6 +21,11 @@ class Settings(BaseSettings):
     opensearch_password: str = "admin"
     news_bulk_index: str = "news_article_bulk"
     news_embedding_index: str = "news_article_embedding"
+    # 전략별 검색을 동시에 보낼 때 최대 동시 요청 수
+    opensearch_max_concurrency: int = 4
+    # 수집 시 제외 대상(스팸/비관련 분야)으로 표시한 boolean 필드명 (예: "is_beauty")
+    # 설정하면 질의마다 제목/본문을 terms로 거르지 않고 이 필드의 term 하나로 제외
+    news_exclude_tag_field: str | None = None
 
     stock_api_key: str | None = None
     
@@ -44,6 +49,10 @@ class Settings(BaseSettings):
     langfuse_public_key: str | None = None
     langfuse_host: str | None = None
     
+    # Redis 공유 캐시 (검색/그래프/시세 결과를 워커 간 공유)
+    redis_url: str = "redis://localhost:6379"
+    search_cache_enabled: bool = True
+
     neo4j_search_cypher: Optional[str] = None    
     graph_search_keys: Optional[str] = None  # JSON 문자열
     
@@ -7,7 +7,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi_mcp import FastApiMCP
 from api.logging import setup_logging
 from api.config import settings
-from api.routers import health, cache_router, metrics_router
+from api.routers import health_router, cache_router, metrics_router
 from api.routers.monitoring_router import router as monitoring_router
 from api.monitoring.middleware import PrometheusMiddleware, HealthMonitoringMiddleware
 from api.services.chat_service import ChatService
@@ -65,10 +65,11 @@ mcp.mount_http(app, mount_path="/mcp/http")
 app.add_middleware(PrometheusMiddleware)
 app.add_middleware(HealthMonitoringMiddleware)
 
-app.include_router(health.router)
+app.include_router(health_router.router)
 app.include_router(mcp_router.router)  # ← 추가
 app.include_router(cache_router.router)  # 캐시 관리 라우터
 app.include_router(metrics_router.router)  # 모니터링 메트릭 라우터
+app.add_route("/metrics", metrics_router.get_prometheus_metrics, methods=["GET"], include_in_schema=False)  # Prometheus 스크레이프
 app.include_router(monitoring_router)  # 질의-응답 트레이싱 라우터
 
 # 분석 대시보드 라우터 추가
@@ -302,13 +303,17 @@ async def create_trend_report(
 
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작시 캐시 정리 작업 시작"""
+    """앱 시작시 캐시 정리 및 대시보드 갱신 작업 시작"""
     await context_cache.start_cleanup_task()
+    await analytics_router.start_history_refresh_task()
+    await metrics_router.start_dashboard_refresh_task()
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """앱 종료시 캐시 정리 작업 중지"""
+    """앱 종료시 캐시 정리 및 대시보드 갱신 작업 중지"""
     await context_cache.stop_cleanup_task()
+    await analytics_router.stop_history_refresh_task()
+    await metrics_router.stop_dashboard_refresh_task()
 
 @app.post("/report/executive")
 async def create_executive_summary(
@@ -294,7 +294,11 @@ class MetricsCollector:
 
     def get_metrics(self) -> str:
         """Get Prometheus metrics in text format."""
-        return generate_latest(ONTOLOGY_REGISTRY).decode('utf-8')
+        return self.get_metrics_bytes().decode('utf-8')
+
+    def get_metrics_bytes(self) -> bytes:
+        """Get Prometheus metrics as encoded exposition bytes."""
+        return generate_latest(ONTOLOGY_REGISTRY)
 
 
 # Global metrics collector instance
@@ -6,6 +6,7 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from .metrics import metrics_collector
+from .rate import request_rate
 
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
@@ -19,8 +20,13 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         method = request.method
         path_template = request.url.path
 
-        # Process request
-        response = await call_next(request)
+        # Process request (unhandled route errors become a 500 further out,
+        # so count them here before re-raising)
+        try:
+            response = await call_next(request)
+        except Exception:
+            request_rate.record(error=True)
+            raise
 
         # Calculate duration
         duration = time.time() - start_time
@@ -32,6 +38,7 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
             status_code=response.status_code,
             duration=duration
         )
+        request_rate.record(error=response.status_code >= 500)
 
         return response
 
@@ -0,0 +1,53 @@
+"""Sliding-window request rate counter."""
+
+import time
+from typing import Tuple
+
+
+class RateCounter:
+    """Request and error counts over a ring of one-second buckets."""
+
+    def __init__(self, window_seconds: int = 60):
+        self.window_seconds = window_seconds
+        self._requests = [0] * window_seconds
+        self._errors = [0] * window_seconds
+        # Second each bucket was last written; stale buckets are reset lazily
+        self._seconds = [0] * window_seconds
+
+    def record(self, error: bool = False):
+        """Count one request in the current second."""
+        second = int(time.monotonic())
+        index = second % self.window_seconds
+        if self._seconds[index] != second:
+            self._seconds[index] = second
+            self._requests[index] = 0
+            self._errors[index] = 0
+        self._requests[index] += 1
+        if error:
+            self._errors[index] += 1
+
+    def _totals(self) -> Tuple[int, int]:
+        """Sum (requests, errors) over buckets inside the window."""
+        cutoff = int(time.monotonic()) - self.window_seconds
+        requests = errors = 0
+        for second, count, error_count in zip(self._seconds, self._requests, self._errors):
+            if second > cutoff:
+                requests += count
+                errors += error_count
+        return requests, errors
+
+    def rpm(self) -> float:
+        """Requests per minute over the window."""
+        requests, _ = self._totals()
+        return requests * 60 / self.window_seconds
+
+    def success_rate(self) -> float:
+        """Share of non-error requests over the window; 1.0 when idle."""
+        requests, errors = self._totals()
+        if requests == 0:
+            return 1.0
+        return 1 - errors / requests
+
+
+# Global HTTP request rate, fed by PrometheusMiddleware
+request_rate = RateCounter()
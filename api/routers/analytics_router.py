@@ -1,21 +1,148 @@
 """Performance analytics dashboard API endpoints."""
 
 import asyncio
+import hashlib
+import logging
 import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
-from api.cache import multi_level_cache
+import numpy as np
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+
+from api.cache import multi_level_cache, get_stats_cached, request_stats_scope
 from api.services.cached_chat_service import cached_chat_service
 from api.monitoring.metrics import metrics_collector
 
-router = APIRouter(prefix="/analytics", tags=["Performance Analytics"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["Performance Analytics"],
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(request_stats_scope)]
+)
+
+# History period -> historical data key
+_PERIOD_KEYS = {
+    "1h": "last_1h",
+    "6h": "last_6h",
+    "24h": "last_24h",
+    "7d": "last_7d",
+    "30d": "last_30d"
+}
+
+# Random source for the mock historical series
+_rng = np.random.default_rng()
+
+# History key -> (window hours, sampling interval minutes)
+_HISTORY_WINDOWS = {
+    "last_1h": (1, 5),
+    "last_6h": (6, 15),
+    "last_24h": (24, 60),
+    "last_7d": (24 * 7, 360),
+    "last_30d": (24 * 30, 1440)
+}
+
+# History windows shown on the dashboard, and how often the background
+# task regenerates them
+_DASHBOARD_HISTORY_WINDOWS = ("last_24h", "last_7d")
+_HISTORY_REFRESH_SECONDS = 30
+
+# Latest dashboard history published by the refresh task; "hist" is absent
+# until the first refresh completes
+_history_snapshot: Dict[str, Dict[str, Any]] = {}
+_history_refresh_task: Optional[asyncio.Task] = None
+
+# Seconds a generated history period is served unchanged. Pollers that send
+# back its ETag inside this window get 304 Not Modified.
+_HISTORY_TTL_SECONDS = 30
+_HISTORY_CACHE_CONTROL = f"max-age={_HISTORY_TTL_SECONDS}"
+
+# History period -> (expires_at monotonic, data_points, summary, etag)
+_history_cache: Dict[str, Tuple[float, List[Dict[str, Any]], Dict[str, float], str]] = {}
+
+# Static response fragments, built once at import and shared read-only
+# across requests. Lists are stored as tuples so they cannot be mutated.
+_STATIC_CONTRIBUTING_FACTORS = {
+    "cache_performance": 0.25,
+    "response_speed": 0.15,
+    "content_relevance": 0.30,
+    "system_reliability": 0.30
+}
+
+_STATIC_QUALITY_BREAKDOWN = {
+    "context_quality": 0.95,
+    "response_accuracy": 0.94,
+    "processing_speed": 0.96,
+    "system_stability": 0.98
+}
+
+_STATIC_USAGE_PATTERNS = {
+    "peak_hours": (9, 10, 11, 14, 15, 16),
+    "popular_queries": (
+        {"query": "AI technology", "count": 45, "avg_quality": 0.952},
+        {"query": "machine learning", "count": 38, "avg_quality": 0.947},
+        {"query": "삼성전자", "count": 32, "avg_quality": 0.951}
+    ),
+    "query_categories": {
+        "technology": 35,
+        "finance": 28,
+        "general": 20,
+        "research": 17
+    }
+}
+
+_STATIC_QUALITY_ANALYSIS = {
+    "a_grade_maintenance": {
+        "current_score": 0.949,
+        "target_threshold": 0.900,
+        "margin": 0.049,
+        "trend": "stable",
+        "contributing_factors": _STATIC_CONTRIBUTING_FACTORS
+    },
+    "quality_breakdown": _STATIC_QUALITY_BREAKDOWN
+}
+
+_STATIC_ALERT_RECOMMENDATIONS = (
+    "Cache performance is optimal",
+    "A-grade quality maintained",
+    "System operating within normal parameters"
+)
+
+# Threshold status tables: ascending thresholds and one more label than
+# thresholds. A value strictly above a threshold maps past it, matching the
+# "> threshold" checks these replace.
+_CACHE_SYSTEM_STATUS = ((0.3,), ("degraded", "healthy"))
+_CACHE_STATUS = ((0.6,), ("suboptimal", "optimal"))
+_HIT_RATE_STATUS = ((0.8,), ("good", "excellent"))
+
+# L1 recommendation hit-rate bucket boundaries (strict "> threshold")
+_L1_HIT_RATE_BUCKETS = (0.6, 0.8)
+
+# Two-way status labels indexed by a boolean condition
+_REDIS_STATUS = ("disconnected", "healthy")
+_RESPONSE_SPEED_STATUS = ("good", "excellent")
+_OVERALL_STATUS = ("degraded", "healthy")
+_QUALITY_STATUS = ("at_risk", "optimal")
+
+
+def _grade(value: float, table: Tuple[Tuple[float, ...], Tuple[str, ...]]) -> str:
+    """Map a value to its status label using a threshold table."""
+    thresholds, labels = table
+    return labels[bisect_left(thresholds, value)]
 
 
 class PerformanceSnapshot(BaseModel):
     """Performance metrics snapshot."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     timestamp: str
     quality_score: float
     response_time_ms: float
@@ -27,6 +154,8 @@ class PerformanceSnapshot(BaseModel):
 
 class AnalyticsSummary(BaseModel):
     """Analytics summary response."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     period: str
     total_requests: int
     avg_quality_score: float
@@ -36,156 +165,123 @@ class AnalyticsSummary(BaseModel):
     trends: Dict[str, Any]
 
 
-@router.get("/dashboard")
-async def get_analytics_dashboard() -> Dict[str, Any]:
-    """
-    Get comprehensive analytics dashboard data.
+class DashboardSummary(BaseModel):
+    """Dashboard headline status."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-    Returns real-time and historical performance metrics for visualization.
-    """
-    try:
-        # Get current cache statistics
-        cache_stats = await multi_level_cache.get_all_stats()
+    timestamp: str
+    status: str
+    quality_score: float
+    uptime_hours: float
+    total_requests_today: int
+    avg_response_time_ms: float
 
-        # Get service metrics
-        service_metrics = await cached_chat_service.get_cache_metrics()
 
-        # Calculate current performance indicators
-        current_time = datetime.now()
+class DashboardRealTimeMetrics(BaseModel):
+    """Dashboard live metrics."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-        # Mock some historical data for demonstration
-        historical_data = await _generate_historical_performance_data()
-
-        dashboard_data = {
-            "summary": {
-                "timestamp": current_time.isoformat(),
-                "status": "operational",
-                "quality_score": 0.949,  # Current A-grade quality
-                "uptime_hours": 24.5,
-                "total_requests_today": 1250,
-                "avg_response_time_ms": 45.2
-            },
+    quality_score: float
+    response_time_ms: float
+    cache_hit_rate: float
+    cache_effectiveness: float
+    requests_per_minute: float
+    error_rate: float
+    active_connections: int
 
-            "real_time_metrics": {
-                "quality_score": 0.949,
-                "response_time_ms": cache_stats["overall"].get("avg_response_time_ms", 50),
-                "cache_hit_rate": cache_stats["overall"].get("hit_rate", 0),
-                "cache_effectiveness": service_metrics.get("quality_impact", {}).get("total_quality_boost", 0),
-                "requests_per_minute": 12.5,  # Should calculate from actual metrics
-                "error_rate": 0.008,  # Should calculate from actual metrics
-                "active_connections": 15
-            },
 
-            "cache_analytics": {
-                "overall_stats": cache_stats["overall"],
-                "level_breakdown": {
-                    "l1_memory": {
-                        "hit_rate": cache_stats.get("l1", {}).get("hit_rate", 0),
-                        "size": cache_stats.get("l1", {}).get("size", 0),
-                        "memory_usage_mb": cache_stats.get("l1", {}).get("memory_bytes", 0) / (1024 * 1024),
-                        "efficiency_score": 0.85
-                    },
-                    "l2_redis": {
-                        "hit_rate": cache_stats.get("l2", {}).get("hit_rate", 0),
-                        "connected": cache_stats.get("l2", {}).get("connected", False),
-                        "size": cache_stats.get("l2", {}).get("size", 0),
-                        "efficiency_score": 0.72
-                    },
-                    "l3_disk": {
-                        "hit_rate": cache_stats.get("l3", {}).get("hit_rate", 0),
-                        "size_mb": cache_stats.get("l3", {}).get("total_size_mb", 0),
-                        "size": cache_stats.get("l3", {}).get("size", 0),
-                        "efficiency_score": 0.68
-                    }
-                },
-                "recommendations": service_metrics.get("recommendations", [])
-            },
+class DashboardCacheAnalytics(BaseModel):
+    """Dashboard cache statistics per level."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-            "performance_trends": {
-                "last_24h": historical_data["last_24h"],
-                "last_7d": historical_data["last_7d"],
-                "quality_trend": historical_data["quality_trend"],
-                "response_time_trend": historical_data["response_time_trend"],
-                "cache_performance_trend": historical_data["cache_trend"]
-            },
+    overall_stats: Dict[str, Any]
+    level_breakdown: Dict[str, Dict[str, Any]]
+    recommendations: List[Any]
 
-            "system_health": {
-                "components": {
-                    "cache_system": {
-                        "status": "healthy" if cache_stats["overall"]["hit_rate"] > 0.3 else "degraded",
-                        "uptime": "99.8%",
-                        "last_restart": (current_time - timedelta(days=1)).isoformat()
-                    },
-                    "llm_service": {
-                        "status": "healthy",
-                        "model": "llama3.1:8b",
-                        "avg_response_time": "2.1s"
-                    },
-                    "databases": {
-                        "neo4j": {"status": "healthy", "query_time_avg": "0.8s"},
-                        "opensearch": {"status": "healthy", "search_time_avg": "0.5s"},
-                        "redis": {"status": "healthy" if cache_stats.get("l2", {}).get("connected", False) else "disconnected"}
-                    }
-                },
-                "alerts": await _get_active_alerts(),
-                "degradation_level": 0  # 0=full, 1=degraded, 2=minimal, 3=emergency
-            },
 
-            "quality_analysis": {
-                "a_grade_maintenance": {
-                    "current_score": 0.949,
-                    "target_threshold": 0.900,
-                    "margin": 0.049,
-                    "trend": "stable",
-                    "contributing_factors": {
-                        "cache_performance": 0.25,
-                        "response_speed": 0.15,
-                        "content_relevance": 0.30,
-                        "system_reliability": 0.30
-                    }
-                },
-                "quality_breakdown": {
-                    "context_quality": 0.95,
-                    "response_accuracy": 0.94,
-                    "processing_speed": 0.96,
-                    "system_stability": 0.98
-                }
-            },
+class DashboardPerformanceTrends(BaseModel):
+    """Dashboard historical series and trend labels."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-            "usage_patterns": {
-                "peak_hours": [9, 10, 11, 14, 15, 16],
-                "popular_queries": [
-                    {"query": "AI technology", "count": 45, "avg_quality": 0.952},
-                    {"query": "machine learning", "count": 38, "avg_quality": 0.947},
-                    {"query": "삼성전자", "count": 32, "avg_quality": 0.951}
-                ],
-                "query_categories": {
-                    "technology": 35,
-                    "finance": 28,
-                    "general": 20,
-                    "research": 17
-                }
-            }
-        }
+    last_24h: List[Dict[str, Any]]
+    last_7d: List[Dict[str, Any]]
+    quality_trend: str
+    response_time_trend: str
+    cache_performance_trend: str
+
+
+class DashboardSystemHealth(BaseModel):
+    """Dashboard component health and active alerts."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    components: Dict[str, Any]
+    alerts: List[Dict[str, Any]]
+    degradation_level: int
+
+
+class DashboardResponse(BaseModel):
+    """Analytics dashboard response. Field order is the response order."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    summary: DashboardSummary
+    real_time_metrics: DashboardRealTimeMetrics
+    cache_analytics: DashboardCacheAnalytics
+    performance_trends: DashboardPerformanceTrends
+    system_health: DashboardSystemHealth
+    quality_analysis: Dict[str, Any]
+    usage_patterns: Dict[str, Any]
+
+
+@router.get("/dashboard")
+async def get_analytics_dashboard() -> DashboardResponse:
+    """
+    Get comprehensive analytics dashboard data.
 
-        return dashboard_data
+    Returns real-time and historical performance metrics for visualization.
+    """
+    try:
+        return DashboardResponse(**{
+            key: value
+            async for key, value in _iter_dashboard_sections(datetime.now())
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Dashboard data generation failed: {str(e)}")
 
 
+@router.get("/dashboard/stream")
+async def stream_analytics_dashboard() -> StreamingResponse:
+    """
+    Stream the analytics dashboard as a single JSON object.
+
+    Each top-level section is written as soon as its inputs are available,
+    so clients can start parsing before the slowest section is built. Errors
+    after the first chunk truncate the stream instead of returning a 500.
+    """
+    async def body() -> AsyncIterator[bytes]:
+        separator = b"{"
+        async with _stats_scope():
+            async for key, value in _iter_dashboard_sections(datetime.now()):
+                yield separator + orjson.dumps(key) + b":" + orjson.dumps(value)
+                separator = b","
+        yield b"}" if separator == b"," else b"{}"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
 @router.get("/performance/snapshot")
 async def get_performance_snapshot() -> PerformanceSnapshot:
     """Get current performance snapshot."""
     try:
-        cache_stats = await multi_level_cache.get_all_stats()
+        cache_stats = await get_stats_cached(multi_level_cache)
         service_metrics = await cached_chat_service.get_cache_metrics()
+        overall = cache_stats["overall"]
 
         return PerformanceSnapshot(
             timestamp=datetime.now().isoformat(),
             quality_score=0.949,
-            response_time_ms=cache_stats["overall"].get("avg_response_time_ms", 50.0),
-            cache_hit_rate=cache_stats["overall"].get("hit_rate", 0.0),
+            response_time_ms=overall.get("avg_response_time_ms", 50.0),
+            cache_hit_rate=overall.get("hit_rate", 0.0),
             cache_effectiveness=service_metrics.get("quality_impact", {}).get("total_quality_boost", 0.0),
             error_rate=0.008,  # Should calculate from actual metrics
             throughput_rpm=12.5  # Should calculate from actual metrics
@@ -197,8 +293,10 @@ async def get_performance_snapshot() -> PerformanceSnapshot:
 
 @router.get("/performance/history")
 async def get_performance_history(
+    response: Response,
     period: str = Query(default="24h", regex="^(1h|6h|24h|7d|30d)$"),
-    metric: Optional[str] = Query(default=None)
+    metric: Optional[str] = Query(default=None),
+    if_none_match: Optional[str] = Header(default=None)
 ) -> Dict[str, Any]:
     """
     Get historical performance data.
@@ -206,84 +304,110 @@ async def get_performance_history(
     Args:
         period: Time period (1h, 6h, 24h, 7d, 30d)
         metric: Specific metric to focus on (optional)
+        if_none_match: ETag from a previous poll; answered with 304 while
+            the period's data is unchanged
     """
     try:
-        historical_data = await _generate_historical_performance_data()
-
-        if period == "1h":
-            data_points = historical_data["last_1h"]
-        elif period == "6h":
-            data_points = historical_data["last_6h"]
-        elif period == "24h":
-            data_points = historical_data["last_24h"]
-        elif period == "7d":
-            data_points = historical_data["last_7d"]
-        else:  # 30d
-            data_points = historical_data["last_30d"]
-
-        response = {
+        data_points, summary, etag = await _get_history_period(period)
+
+        headers = {"ETag": etag, "Cache-Control": _HISTORY_CACHE_CONTROL}
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+        result = {
             "period": period,
             "data_points": data_points,
-            "summary": {
-                "avg_quality_score": sum(p["quality_score"] for p in data_points) / len(data_points),
-                "avg_response_time": sum(p["response_time_ms"] for p in data_points) / len(data_points),
-                "avg_cache_hit_rate": sum(p["cache_hit_rate"] for p in data_points) / len(data_points)
-            }
+            "summary": summary
         }
 
         if metric:
-            response["focused_metric"] = metric
-            response["metric_data"] = [{"timestamp": p["timestamp"], "value": p.get(metric, 0)} for p in data_points]
+            result["focused_metric"] = metric
+            result["metric_data"] = [{"timestamp": p["timestamp"], "value": p.get(metric, 0)} for p in data_points]
 
-        return response
+        return result
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Historical data retrieval failed: {str(e)}")
 
 
+async def _get_history_period(
+    period: str
+) -> Tuple[List[Dict[str, Any]], Dict[str, float], str]:
+    """
+    Return (data_points, summary, etag) for a history period.
+
+    The series is regenerated at most once per _HISTORY_TTL_SECONDS. The
+    ETag is hashed from the serialized series once per refresh, so
+    conditional polls never re-serialize it.
+    """
+    now = time.monotonic()
+    cached = _history_cache.get(period)
+    if cached is not None and cached[0] > now:
+        return cached[1], cached[2], cached[3]
+
+    key = _PERIOD_KEYS[period]
+    data_points = (await _generate_historical_performance_data((key,)))[key]
+    count = len(data_points)
+    summary = {
+        "avg_quality_score": sum(p["quality_score"] for p in data_points) / count,
+        "avg_response_time": sum(p["response_time_ms"] for p in data_points) / count,
+        "avg_cache_hit_rate": sum(p["cache_hit_rate"] for p in data_points) / count
+    }
+    digest = hashlib.blake2b(orjson.dumps((data_points, summary)), digest_size=8).hexdigest()
+    etag = f'"{digest}"'
+
+    _history_cache[period] = (now + _HISTORY_TTL_SECONDS, data_points, summary, etag)
+    return data_points, summary, etag
+
+
 @router.get("/cache/analysis")
 async def get_cache_analysis() -> Dict[str, Any]:
     """Detailed cache performance analysis."""
     try:
-        cache_stats = await multi_level_cache.get_all_stats()
+        cache_stats = await get_stats_cached(multi_level_cache)
         service_metrics = await cached_chat_service.get_cache_metrics()
+        l1 = cache_stats.get("l1") or {}
+        l2 = cache_stats.get("l2") or {}
+        l3 = cache_stats.get("l3") or {}
+        quality_impact = service_metrics.get("quality_impact") or {}
 
         # Calculate cache efficiency scores
-        l1_efficiency = _calculate_cache_efficiency(cache_stats.get("l1", {}), "memory")
-        l2_efficiency = _calculate_cache_efficiency(cache_stats.get("l2", {}), "redis")
-        l3_efficiency = _calculate_cache_efficiency(cache_stats.get("l3", {}), "disk")
+        l1_efficiency = _calculate_cache_efficiency(l1, "memory")
+        l2_efficiency = _calculate_cache_efficiency(l2, "redis")
+        l3_efficiency = _calculate_cache_efficiency(l3, "disk")
 
         analysis = {
             "overall_performance": {
                 "hit_rate": cache_stats["overall"]["hit_rate"],
-                "effectiveness_score": service_metrics.get("quality_impact", {}).get("total_quality_boost", 0),
+                "effectiveness_score": quality_impact.get("total_quality_boost", 0),
                 "response_time_improvement": "65%",  # Should calculate from actual baseline
-                "quality_contribution": service_metrics.get("quality_impact", {}).get("speed_contribution", 0)
+                "quality_contribution": quality_impact.get("speed_contribution", 0)
             },
 
             "level_analysis": {
                 "l1_memory": {
-                    "hit_rate": cache_stats.get("l1", {}).get("hit_rate", 0),
+                    "hit_rate": l1.get("hit_rate", 0),
                     "efficiency_score": l1_efficiency,
-                    "memory_utilization": cache_stats.get("l1", {}).get("memory_usage_percent", 0),
+                    "memory_utilization": l1.get("memory_usage_percent", 0),
                     "avg_access_time_ms": 0.5,
-                    "recommendation": _get_l1_recommendation(cache_stats.get("l1", {}))
+                    "recommendation": _get_l1_recommendation(l1)
                 },
 
                 "l2_redis": {
-                    "hit_rate": cache_stats.get("l2", {}).get("hit_rate", 0),
+                    "hit_rate": l2.get("hit_rate", 0),
                     "efficiency_score": l2_efficiency,
-                    "connection_status": cache_stats.get("l2", {}).get("connected", False),
+                    "connection_status": l2.get("connected", False),
                     "avg_access_time_ms": 8.5,
-                    "recommendation": _get_l2_recommendation(cache_stats.get("l2", {}))
+                    "recommendation": _get_l2_recommendation(l2)
                 },
 
                 "l3_disk": {
-                    "hit_rate": cache_stats.get("l3", {}).get("hit_rate", 0),
+                    "hit_rate": l3.get("hit_rate", 0),
                     "efficiency_score": l3_efficiency,
-                    "disk_utilization": cache_stats.get("l3", {}).get("usage_percent", 0),
+                    "disk_utilization": l3.get("usage_percent", 0),
                     "avg_access_time_ms": 45.2,
-                    "recommendation": _get_l3_recommendation(cache_stats.get("l3", {}))
+                    "recommendation": _get_l3_recommendation(l3)
                 }
             },
 
@@ -309,8 +433,11 @@ async def get_cache_analysis() -> Dict[str, Any]:
 async def get_quality_analysis() -> Dict[str, Any]:
     """A-grade quality analysis and breakdown."""
     try:
-        cache_stats = await multi_level_cache.get_all_stats()
+        cache_stats = await get_stats_cached(multi_level_cache)
         service_metrics = await cached_chat_service.get_cache_metrics()
+        overall = cache_stats["overall"]
+        hit_rate = overall["hit_rate"]
+        avg_response_time_ms = overall.get("avg_response_time_ms", 50)
 
         quality_analysis = {
             "current_score": 0.949,  # Should come from actual calculation
@@ -323,13 +450,13 @@ async def get_quality_analysis() -> Dict[str, Any]:
                 "cache_performance": {
                     "score": service_metrics.get("quality_impact", {}).get("speed_contribution", 0),
                     "weight": 0.25,
-                    "status": "excellent" if cache_stats["overall"]["hit_rate"] > 0.8 else "good"
+                    "status": _grade(hit_rate, _HIT_RATE_STATUS)
                 },
                 "response_speed": {
                     "score": 0.15,
                     "weight": 0.15,
-                    "avg_time_ms": cache_stats["overall"].get("avg_response_time_ms", 50),
-                    "status": "excellent" if cache_stats["overall"].get("avg_response_time_ms", 50) < 100 else "good"
+                    "avg_time_ms": avg_response_time_ms,
+                    "status": _RESPONSE_SPEED_STATUS[avg_response_time_ms < 100]
                 },
                 "content_relevance": {
                     "score": 0.30,
@@ -352,14 +479,14 @@ async def get_quality_analysis() -> Dict[str, Any]:
             "improvement_opportunities": [
                 {
                     "area": "Cache Hit Rate",
-                    "current": cache_stats["overall"]["hit_rate"],
+                    "current": hit_rate,
                     "target": 0.85,
                     "potential_gain": 0.02,
                     "priority": "medium"
                 },
                 {
                     "area": "Response Time",
-                    "current_ms": cache_stats["overall"].get("avg_response_time_ms", 50),
+                    "current_ms": avg_response_time_ms,
                     "target_ms": 40,
                     "potential_gain": 0.01,
                     "priority": "low"
@@ -377,26 +504,23 @@ async def get_quality_analysis() -> Dict[str, Any]:
 async def get_active_alerts() -> Dict[str, Any]:
     """Get active alerts and system status."""
     try:
-        alerts = await _get_active_alerts()
-        cache_stats = await multi_level_cache.get_all_stats()
+        cache_stats = await get_stats_cached(multi_level_cache)
+        alerts = await _get_active_alerts(cache_stats, now_iso=datetime.now().isoformat())
+        critical_count = sum(1 for a in alerts if a["severity"] == "critical")
 
         return {
             "active_alerts": alerts,
             "alert_summary": {
-                "critical": len([a for a in alerts if a["severity"] == "critical"]),
+                "critical": critical_count,
                 "warning": len([a for a in alerts if a["severity"] == "warning"]),
                 "info": len([a for a in alerts if a["severity"] == "info"])
             },
             "system_status": {
-                "overall": "healthy" if len([a for a in alerts if a["severity"] == "critical"]) == 0 else "degraded",
-                "quality_status": "optimal" if 0.949 >= 0.900 else "at_risk",
-                "cache_status": "optimal" if cache_stats["overall"]["hit_rate"] > 0.6 else "suboptimal"
+                "overall": _OVERALL_STATUS[critical_count == 0],
+                "quality_status": _QUALITY_STATUS[0.949 >= 0.900],
+                "cache_status": _grade(cache_stats["overall"]["hit_rate"], _CACHE_STATUS)
             },
-            "recommendations": [
-                "Cache performance is optimal",
-                "A-grade quality maintained",
-                "System operating within normal parameters"
-            ]
+            "recommendations": _STATIC_ALERT_RECOMMENDATIONS
         }
 
     except Exception as e:
@@ -404,43 +528,267 @@ async def get_active_alerts() -> Dict[str, Any]:
 
 
 # Helper functions
-async def _generate_historical_performance_data() -> Dict[str, Any]:
-    """Generate mock historical performance data."""
-    import random
+_stats_scope = asynccontextmanager(request_stats_scope)
 
-    def generate_datapoints(hours: int, interval_minutes: int):
-        points = []
-        current_time = datetime.now()
 
-        for i in range(hours * (60 // interval_minutes)):
-            timestamp = current_time - timedelta(minutes=i * interval_minutes)
-
-            # Generate realistic performance data with some variance
-            base_quality = 0.949
-            quality_variance = random.uniform(-0.02, 0.01)
-
-            points.append({
-                "timestamp": timestamp.isoformat(),
-                "quality_score": min(1.0, max(0.0, base_quality + quality_variance)),
-                "response_time_ms": random.uniform(40, 80),
-                "cache_hit_rate": random.uniform(0.7, 0.9),
-                "cache_effectiveness": random.uniform(0.6, 0.9),
-                "error_rate": random.uniform(0.001, 0.02),
-                "requests_count": random.randint(8, 25)
-            })
+def _dashboard_summary(current_time: datetime) -> Dict[str, Any]:
+    """Build the dashboard summary section."""
+    return {
+        "timestamp": current_time.isoformat(),
+        "status": "operational",
+        "quality_score": 0.949,  # Current A-grade quality
+        "uptime_hours": 24.5,
+        "total_requests_today": 1250,
+        "avg_response_time_ms": 45.2
+    }
+
+
+def _dashboard_real_time_metrics(
+    cache_stats: Dict[str, Any],
+    service_metrics: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the dashboard real-time metrics section."""
+    overall = cache_stats["overall"]
+    quality_impact = service_metrics.get("quality_impact") or {}
+    return {
+        "quality_score": 0.949,
+        "response_time_ms": overall.get("avg_response_time_ms", 50),
+        "cache_hit_rate": overall.get("hit_rate", 0),
+        "cache_effectiveness": quality_impact.get("total_quality_boost", 0),
+        "requests_per_minute": 12.5,  # Should calculate from actual metrics
+        "error_rate": 0.008,  # Should calculate from actual metrics
+        "active_connections": 15
+    }
 
-        return points
 
+def _dashboard_cache_analytics(
+    cache_stats: Dict[str, Any],
+    service_metrics: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the dashboard cache analytics section."""
+    l1 = cache_stats.get("l1") or {}
+    l2 = cache_stats.get("l2") or {}
+    l3 = cache_stats.get("l3") or {}
     return {
-        "last_1h": generate_datapoints(1, 5),
-        "last_6h": generate_datapoints(6, 15),
-        "last_24h": generate_datapoints(24, 60),
-        "last_7d": generate_datapoints(24 * 7, 360),
-        "last_30d": generate_datapoints(24 * 30, 1440),
+        "overall_stats": cache_stats["overall"],
+        "level_breakdown": {
+            "l1_memory": {
+                "hit_rate": l1.get("hit_rate", 0),
+                "size": l1.get("size", 0),
+                "memory_usage_mb": l1.get("memory_bytes", 0) / (1024 * 1024),
+                "efficiency_score": 0.85
+            },
+            "l2_redis": {
+                "hit_rate": l2.get("hit_rate", 0),
+                "connected": l2.get("connected", False),
+                "size": l2.get("size", 0),
+                "efficiency_score": 0.72
+            },
+            "l3_disk": {
+                "hit_rate": l3.get("hit_rate", 0),
+                "size_mb": l3.get("total_size_mb", 0),
+                "size": l3.get("size", 0),
+                "efficiency_score": 0.68
+            }
+        },
+        "recommendations": service_metrics.get("recommendations", [])
+    }
+
+
+def _dashboard_performance_trends(historical_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the dashboard performance trends section."""
+    return {
+        "last_24h": historical_data["last_24h"],
+        "last_7d": historical_data["last_7d"],
+        "quality_trend": historical_data["quality_trend"],
+        "response_time_trend": historical_data["response_time_trend"],
+        "cache_performance_trend": historical_data["cache_trend"]
+    }
+
+
+async def _dashboard_system_health(
+    cache_stats: Dict[str, Any],
+    current_time: datetime
+) -> Dict[str, Any]:
+    """Build the dashboard system health section."""
+    l2 = cache_stats.get("l2") or {}
+    return {
+        "components": {
+            "cache_system": {
+                "status": _grade(cache_stats["overall"]["hit_rate"], _CACHE_SYSTEM_STATUS),
+                "uptime": "99.8%",
+                "last_restart": (current_time - timedelta(days=1)).isoformat()
+            },
+            "llm_service": {
+                "status": "healthy",
+                "model": "llama3.1:8b",
+                "avg_response_time": "2.1s"
+            },
+            "databases": {
+                "neo4j": {"status": "healthy", "query_time_avg": "0.8s"},
+                "opensearch": {"status": "healthy", "search_time_avg": "0.5s"},
+                "redis": {"status": _REDIS_STATUS[bool(l2.get("connected", False))]}
+            }
+        },
+        "alerts": await _get_active_alerts(cache_stats, now_iso=current_time.isoformat()),
+        "degradation_level": 0  # 0=full, 1=degraded, 2=minimal, 3=emergency
+    }
+
+
+async def _iter_dashboard_sections(current_time: datetime) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Yield (section, payload) pairs for the dashboard as each becomes ready.
+
+    Cache stats, service metrics and historical data are fetched concurrently;
+    a section is built as soon as the sources it depends on have resolved.
+    """
+    # Sections that need no I/O go out first
+    yield "summary", _dashboard_summary(current_time)
+    yield "quality_analysis", _STATIC_QUALITY_ANALYSIS
+    yield "usage_patterns", _STATIC_USAGE_PATTERNS
+
+    # section -> (builder, source names, extra args)
+    builders = {
+        "real_time_metrics": (_dashboard_real_time_metrics, ("cache_stats", "service_metrics"), ()),
+        "cache_analytics": (_dashboard_cache_analytics, ("cache_stats", "service_metrics"), ()),
+        "performance_trends": (_dashboard_performance_trends, ("historical_data",), ()),
+        "system_health": (_dashboard_system_health, ("cache_stats",), (current_time,))
+    }
+
+    sources: Dict[str, asyncio.Future] = {}
+    try:
+        sources["cache_stats"] = asyncio.ensure_future(get_stats_cached(multi_level_cache))
+        sources["service_metrics"] = asyncio.ensure_future(cached_chat_service.get_cache_metrics())
+        sources["historical_data"] = asyncio.ensure_future(_get_dashboard_history())
+
+        pending = set(sources.values())
+        while builders:
+            if pending:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            ready = [
+                key for key, (_, deps, _) in builders.items()
+                if all(sources[dep].done() for dep in deps)
+            ]
+            for key in ready:
+                builder, deps, extra = builders.pop(key)
+                value = builder(*(sources[dep].result() for dep in deps), *extra)
+                if asyncio.iscoroutine(value):
+                    value = await value
+                yield key, value
+    finally:
+        for task in sources.values():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Retrieve failures from sources nobody consumed so asyncio
+                # does not log them as never retrieved
+                task.exception()
+
+
+async def _get_dashboard_history() -> Dict[str, Any]:
+    """Return the published dashboard history, generating it if none exists yet."""
+    snapshot = _history_snapshot.get("hist")
+    if snapshot is None:
+        return await _generate_historical_performance_data(_DASHBOARD_HISTORY_WINDOWS)
+    return snapshot
+
+
+async def start_history_refresh_task() -> None:
+    """Start regenerating the dashboard history snapshot in the background."""
+    global _history_refresh_task
+
+    async def refresh_loop():
+        while True:
+            try:
+                _history_snapshot["hist"] = await _generate_historical_performance_data(
+                    _DASHBOARD_HISTORY_WINDOWS
+                )
+            except Exception as e:
+                logger.warning(f"Dashboard history refresh failed: {e}")
+            await asyncio.sleep(_HISTORY_REFRESH_SECONDS)
+
+    if not _history_refresh_task:
+        _history_refresh_task = asyncio.create_task(refresh_loop())
+
+
+async def stop_history_refresh_task() -> None:
+    """Stop the background history refresh."""
+    global _history_refresh_task
+    if _history_refresh_task:
+        _history_refresh_task.cancel()
+        try:
+            await _history_refresh_task
+        except asyncio.CancelledError:
+            pass
+        _history_refresh_task = None
+
+
+def _generate_metric_columns(n: int) -> Tuple[np.ndarray, ...]:
+    """
+    Draw ``n`` mock samples for each history metric as parallel arrays.
+
+    Returns (quality_score, response_time_ms, cache_hit_rate,
+    cache_effectiveness, error_rate, requests_count). Timestamps are built
+    by the caller since they are not numeric.
+    """
+    # Generate realistic performance data with some variance, one
+    # vectorized draw per metric
+    base_quality = 0.949
+    return (
+        np.clip(base_quality + _rng.uniform(-0.02, 0.01, n), 0.0, 1.0),
+        _rng.uniform(40, 80, n),
+        _rng.uniform(0.7, 0.9, n),
+        _rng.uniform(0.6, 0.9, n),
+        _rng.uniform(0.001, 0.02, n),
+        _rng.integers(8, 25, n, endpoint=True)
+    )
+
+
+async def _generate_historical_performance_data(
+    windows: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """
+    Generate mock historical performance data.
+
+    Args:
+        windows: History keys to materialize (e.g. "last_24h"). All windows
+            are generated when omitted.
+    """
+    def generate_datapoints(hours: int, interval_minutes: int):
+        n = hours * 60 // interval_minutes
+        current_time = datetime.now()
+        step = timedelta(minutes=interval_minutes)
+        columns = zip(*(column.tolist() for column in _generate_metric_columns(n)))
+
+        return [
+            {
+                "timestamp": (current_time - i * step).isoformat(),
+                "quality_score": quality_score,
+                "response_time_ms": response_time_ms,
+                "cache_hit_rate": cache_hit_rate,
+                "cache_effectiveness": cache_effectiveness,
+                "error_rate": error_rate,
+                "requests_count": requests_count
+            }
+            for i, (
+                quality_score, response_time_ms, cache_hit_rate,
+                cache_effectiveness, error_rate, requests_count
+            ) in enumerate(columns)
+        ]
+
+    if windows is None:
+        windows = _HISTORY_WINDOWS.keys()
+
+    historical_data: Dict[str, Any] = {
+        key: generate_datapoints(*_HISTORY_WINDOWS[key]) for key in windows
+    }
+    historical_data.update({
         "quality_trend": "stable",
         "response_time_trend": "improving",
         "cache_trend": "optimal"
-    }
+    })
+    return historical_data
 
 
 def _calculate_cache_efficiency(cache_data: Dict, cache_type: str) -> float:
@@ -469,12 +817,17 @@ def _get_l1_recommendation(l1_data: Dict) -> str:
 
     hit_rate = l1_data.get("hit_rate", 0)
     usage_percent = l1_data.get("memory_usage_percent", 0)
+    return _l1_recommendation(bisect_left(_L1_HIT_RATE_BUCKETS, hit_rate), usage_percent > 90)
+
 
-    if hit_rate > 0.8:
+@lru_cache(maxsize=64)
+def _l1_recommendation(hit_bucket: int, memory_pressure: bool) -> str:
+    """L1 recommendation for a hit-rate bucket (0: <=0.6, 1: <=0.8, 2: >0.8)."""
+    if hit_bucket == 2:
         return "Excellent performance"
-    elif hit_rate > 0.6:
+    elif hit_bucket == 1:
         return "Good performance, consider increasing cache size"
-    elif usage_percent > 90:
+    elif memory_pressure:
         return "Memory pressure detected, increase cache size"
     else:
         return "Consider cache warming strategies"
@@ -485,12 +838,17 @@ def _get_l2_recommendation(l2_data: Dict) -> str:
     if not l2_data:
         return "L2 cache not available"
 
-    connected = l2_data.get("connected", False)
+    connected = bool(l2_data.get("connected", False))
+    return _l2_recommendation(connected, connected and l2_data.get("hit_rate", 0) > 0.4)
+
+
+@lru_cache(maxsize=64)
+def _l2_recommendation(connected: bool, good_hit_rate: bool) -> str:
+    """L2 recommendation for a connection state and hit-rate bucket."""
     if not connected:
         return "Redis connection issue - check configuration"
 
-    hit_rate = l2_data.get("hit_rate", 0)
-    if hit_rate > 0.4:
+    if good_hit_rate:
         return "Good distributed cache performance"
     else:
         return "Low hit rate, consider TTL adjustment"
@@ -501,27 +859,45 @@ def _get_l3_recommendation(l3_data: Dict) -> str:
     if not l3_data:
         return "L3 cache not available"
 
-    usage_percent = l3_data.get("usage_percent", 0)
-    if usage_percent > 85:
+    return _l3_recommendation(l3_data.get("usage_percent", 0) > 85)
+
+
+@lru_cache(maxsize=64)
+def _l3_recommendation(disk_pressure: bool) -> str:
+    """L3 recommendation for a disk usage bucket."""
+    if disk_pressure:
         return "Disk space pressure - consider cleanup or expansion"
     else:
         return "Healthy disk cache utilization"
 
 
-async def _get_active_alerts() -> List[Dict[str, Any]]:
-    """Get current active alerts."""
+async def _get_active_alerts(
+    cache_stats: Optional[Dict[str, Any]] = None,
+    now_iso: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get current active alerts.
+
+    Args:
+        cache_stats: Cache statistics already fetched by the caller; fetched
+            here when omitted.
+        now_iso: Timestamp to stamp on every alert.
+    """
     alerts = []
+    ts = now_iso or datetime.now().isoformat()
 
     try:
-        cache_stats = await multi_level_cache.get_all_stats()
+        if cache_stats is None:
+            cache_stats = await get_stats_cached(multi_level_cache)
+        hit_rate = cache_stats["overall"]["hit_rate"]
 
         # Check cache hit rate
-        if cache_stats["overall"]["hit_rate"] < 0.3:
+        if hit_rate < 0.3:
             alerts.append({
                 "id": "low_cache_hit_rate",
                 "severity": "warning",
-                "message": f"Low cache hit rate: {cache_stats['overall']['hit_rate']:.1%}",
-                "timestamp": datetime.now().isoformat(),
+                "message": f"Low cache hit rate: {hit_rate:.1%}",
+                "timestamp": ts,
                 "category": "performance"
             })
 
@@ -531,7 +907,7 @@ async def _get_active_alerts() -> List[Dict[str, Any]]:
                 "id": "redis_disconnected",
                 "severity": "warning",
                 "message": "Redis L2 cache disconnected",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": ts,
                 "category": "infrastructure"
             })
 
@@ -542,7 +918,7 @@ async def _get_active_alerts() -> List[Dict[str, Any]]:
                 "id": "memory_pressure",
                 "severity": "warning",
                 "message": f"L1 cache memory pressure: {l1_usage:.1f}%",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": ts,
                 "category": "resource"
             })
 
@@ -551,7 +927,7 @@ async def _get_active_alerts() -> List[Dict[str, Any]]:
             "id": "monitoring_error",
             "severity": "warning",
             "message": "Unable to retrieve cache statistics",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts,
             "category": "monitoring"
         })
 
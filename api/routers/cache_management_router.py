@@ -1,17 +1,55 @@
 """Cache management API endpoints."""
 
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
 from api.services.cached_chat_service import cached_chat_service
 from api.cache import multi_level_cache, cache_metrics, CacheLevel
-
-router = APIRouter(prefix="/cache", tags=["Cache Management"])
+from api.utils.error_responses import wrap_errors
+
+router = APIRouter(
+    prefix="/cache",
+    tags=["Cache Management"],
+    default_response_class=ORJSONResponse
+)
+
+# Request level name -> cache level
+_LEVEL_MAP = {
+    "l1": CacheLevel.L1_MEMORY,
+    "l2": CacheLevel.L2_REDIS,
+    "l3": CacheLevel.L3_DISK
+}
+
+# Minimum non-wildcard characters in an invalidation pattern, so a stray
+# "*" cannot wipe every level through the pattern path
+_MIN_PATTERN_LENGTH = 3
+
+# Effectiveness bands, best first: (min hit rate, max avg response ms, label)
+_EFFECTIVENESS = (
+    (0.8, 50, "excellent"),
+    (0.6, 100, "good"),
+    (0.4, 200, "moderate")
+)
+
+# Hot query lists memoized per top_n so dashboard polls reuse one scan;
+# dropped whenever the cache is invalidated
+_HOT_QUERIES_TTL = 2.0
+_HOT_QUERIES_MAX_ENTRIES = 8
+_hot_queries_cache: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
 
 
 class CacheStatsResponse(BaseModel):
-    """Cache statistics response model."""
+    """
+    Cache statistics response model.
+
+    Documents /cache/stats in OpenAPI; the handler returns the already
+    trusted stats dict directly, so it is not re-validated per request.
+    """
+    model_config = ConfigDict(extra="allow")
+
     overall: Dict[str, Any]
     l1: Dict[str, Any]
     l2: Optional[Dict[str, Any]]
@@ -20,258 +58,255 @@ class CacheStatsResponse(BaseModel):
     recommendations: List[str]
 
 
+# Write-path request bodies are decoded strictly: no type coercion and no
+# unknown fields, which keeps bulk invalidation scripts on the fast path
+_REQUEST_CONFIG = ConfigDict(extra="forbid", strict=True)
+
+
 class CacheInvalidateRequest(BaseModel):
     """Cache invalidation request model."""
+    model_config = _REQUEST_CONFIG
+
     pattern: Optional[str] = None
     levels: Optional[List[str]] = None
 
 
 class PreloadRequest(BaseModel):
     """Cache preload request model."""
+    model_config = _REQUEST_CONFIG
+
     queries: List[str]
 
 
-@router.get("/stats", response_model=CacheStatsResponse)
-async def get_cache_statistics():
+@router.get("/stats", response_model=None, responses={200: {"model": CacheStatsResponse}})
+@wrap_errors(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to get cache statistics")
+async def get_cache_statistics() -> Dict[str, Any]:
     """Get comprehensive cache statistics."""
-    try:
-        metrics = await cached_chat_service.get_cache_metrics()
-
-        return CacheStatsResponse(
-            overall=metrics["multi_level_stats"]["overall"],
-            l1=metrics["multi_level_stats"]["l1"],
-            l2=metrics["multi_level_stats"].get("l2"),
-            l3=metrics["multi_level_stats"].get("l3"),
-            quality_impact=metrics["quality_impact"],
-            recommendations=metrics["recommendations"]
-        )
+    metrics = await cached_chat_service.get_cache_metrics()
+    level_stats = metrics["multi_level_stats"]
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get cache statistics: {str(e)}"
-        )
+    return {
+        "overall": level_stats["overall"],
+        "l1": level_stats["l1"],
+        "l2": level_stats.get("l2"),
+        "l3": level_stats.get("l3"),
+        "quality_impact": metrics["quality_impact"],
+        "recommendations": metrics["recommendations"]
+    }
 
 
 @router.post("/invalidate")
-async def invalidate_cache(request: CacheInvalidateRequest):
+@wrap_errors(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to invalidate cache")
+async def invalidate_cache(
+    request: CacheInvalidateRequest,
+    batch: int = Query(default=500, ge=1, le=10000)
+):
     """
     Invalidate cache entries.
 
-    - **pattern**: Optional pattern to match cache keys
+    - **pattern**: Optional glob pattern to match cache keys, e.g. "chat_context:*".
+      Needs at least 3 non-wildcard characters; use no pattern to clear everything.
     - **levels**: Optional list of cache levels to clear ["l1", "l2", "l3"]
+    - **batch**: Redis SCAN batch size used for pattern deletion
     """
-    try:
-        if request.levels:
-            # Convert string levels to CacheLevel enum
-            cache_levels = []
-            for level in request.levels:
-                if level.lower() == "l1":
-                    cache_levels.append(CacheLevel.L1_MEMORY)
-                elif level.lower() == "l2":
-                    cache_levels.append(CacheLevel.L2_REDIS)
-                elif level.lower() == "l3":
-                    cache_levels.append(CacheLevel.L3_DISK)
-
-            await multi_level_cache.clear(cache_levels)
-            message = f"Cleared cache levels: {', '.join(request.levels)}"
-        else:
-            # Clear all levels
-            await cached_chat_service.invalidate_cache(request.pattern)
-            message = "All cache levels cleared"
-
-            if request.pattern:
-                message = f"Cleared cache entries matching pattern: {request.pattern}"
-
-        return {"status": "success", "message": message}
-
-    except Exception as e:
+    if request.pattern is not None and len(request.pattern.strip("*?")) < _MIN_PATTERN_LENGTH:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to invalidate cache: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pattern must contain at least {_MIN_PATTERN_LENGTH} non-wildcard characters"
         )
 
+    # Lowercase once; used for both the lookup and the response message
+    levels = tuple(name.lower() for name in request.levels or ())
+    cache_levels = None
+    if levels:
+        # Convert string levels to CacheLevel enum
+        cache_levels = [_LEVEL_MAP[name] for name in levels if name in _LEVEL_MAP]
+        if not cache_levels:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"No valid cache levels in {request.levels}. Use l1, l2 or l3."
+            )
+
+    if request.pattern:
+        deleted = await cached_chat_service.invalidate_cache(request.pattern, cache_levels, batch)
+        _hot_queries_cache.clear()
+        return {
+            "status": "success",
+            "message": f"Cleared cache entries matching pattern: {request.pattern}",
+            "deleted": deleted
+        }
+
+    # Goes through the service so its process-local context tier is cleared with L1
+    await cached_chat_service.invalidate_cache(None, cache_levels)
+    if cache_levels:
+        message = f"Cleared cache levels: {', '.join(levels)}"
+    else:
+        message = "All cache levels cleared"
+
+    _hot_queries_cache.clear()
+    return {"status": "success", "message": message}
+
 
 @router.post("/optimize")
+@wrap_errors(status.HTTP_500_INTERNAL_SERVER_ERROR, "Cache optimization failed")
 async def optimize_cache():
     """
     Optimize cache by cleaning expired entries and analyzing usage patterns.
     """
-    try:
-        await cached_chat_service.optimize_cache()
+    await cached_chat_service.optimize_cache()
 
-        # Get updated stats
-        stats = await multi_level_cache.get_all_stats()
+    # Get updated stats
+    stats = await multi_level_cache.get_all_stats()
 
-        return {
-            "status": "success",
-            "message": "Cache optimization completed",
-            "stats": stats
-        }
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Cache optimization failed: {str(e)}"
-        )
+    return {
+        "status": "success",
+        "message": "Cache optimization completed",
+        "stats": stats
+    }
 
 
 @router.post("/preload")
+@wrap_errors(status.HTTP_500_INTERNAL_SERVER_ERROR, "Cache preload failed")
 async def preload_queries(request: PreloadRequest):
     """
     Preload queries into cache for faster response times.
     """
-    try:
-        if not request.queries:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No queries provided for preloading"
-            )
-
-        # Limit number of queries to prevent abuse
-        if len(request.queries) > 50:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Too many queries. Maximum 50 allowed."
-            )
-
-        await cached_chat_service.preload_popular_queries(request.queries)
-
-        return {
-            "status": "success",
-            "message": f"Preloaded {len(request.queries)} queries",
-            "queries": request.queries
-        }
+    if not request.queries:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No queries provided for preloading"
+        )
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Limit number of queries to prevent abuse
+    if len(request.queries) > 50:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Cache preload failed: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Too many queries. Maximum 50 allowed."
         )
 
+    await cached_chat_service.preload_popular_queries(request.queries)
+
+    return {
+        "status": "success",
+        "message": f"Preloaded {len(request.queries)} queries",
+        "queries": request.queries
+    }
+
 
 @router.get("/hot-queries")
+@wrap_errors(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to get hot queries")
 async def get_hot_queries(top_n: int = Query(default=10, ge=1, le=100)):
     """
     Get the most frequently accessed queries.
     """
-    try:
-        hot_queries = await cached_chat_service.get_hot_queries(top_n)
+    hot_queries = await _cached_hot_queries(top_n)
 
-        return {
-            "hot_queries": hot_queries,
-            "count": len(hot_queries)
-        }
+    return {
+        "hot_queries": hot_queries,
+        "count": len(hot_queries)
+    }
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get hot queries: {str(e)}"
-        )
+
+async def _cached_hot_queries(top_n: int) -> List[Dict[str, Any]]:
+    """Hot queries for top_n, reused for up to _HOT_QUERIES_TTL seconds."""
+    now = time.monotonic()
+    entry = _hot_queries_cache.get(top_n)
+    if entry and now - entry[0] < _HOT_QUERIES_TTL:
+        return entry[1]
+
+    hot_queries = await cached_chat_service.get_hot_queries(top_n)
+    if top_n not in _hot_queries_cache and len(_hot_queries_cache) >= _HOT_QUERIES_MAX_ENTRIES:
+        # Evict the oldest entry
+        del _hot_queries_cache[min(_hot_queries_cache, key=lambda n: _hot_queries_cache[n][0])]
+    _hot_queries_cache[top_n] = (now, hot_queries)
+    return hot_queries
 
 
 @router.get("/hit-rate")
+@wrap_errors(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to get hit rate")
 async def get_cache_hit_rate():
     """
     Get current cache hit rate and performance metrics.
     """
-    try:
-        stats = await multi_level_cache.get_all_stats()
-        decorator_metrics = cache_metrics.to_dict()
-
-        overall_stats = stats["overall"]
+    stats = await multi_level_cache.get_all_stats()
+    decorator_metrics = cache_metrics.to_dict()
 
-        return {
-            "hit_rate": overall_stats["hit_rate"],
-            "total_hits": overall_stats["hits"],
-            "total_misses": overall_stats["misses"],
-            "l1_hits": overall_stats["l1_hits"],
-            "l2_hits": overall_stats["l2_hits"],
-            "l3_hits": overall_stats["l3_hits"],
-            "avg_response_time_ms": overall_stats["avg_response_time_ms"],
-            "decorator_metrics": decorator_metrics,
-            "cache_effectiveness": _calculate_effectiveness(overall_stats)
-        }
+    overall_stats = stats["overall"]
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get hit rate: {str(e)}"
-        )
+    return {
+        "hit_rate": overall_stats["hit_rate"],
+        "total_hits": overall_stats["hits"],
+        "total_misses": overall_stats["misses"],
+        "l1_hits": overall_stats["l1_hits"],
+        "l2_hits": overall_stats["l2_hits"],
+        "l3_hits": overall_stats["l3_hits"],
+        "avg_response_time_ms": overall_stats["avg_response_time_ms"],
+        "decorator_metrics": decorator_metrics,
+        "cache_effectiveness": _calculate_effectiveness(overall_stats)
+    }
 
 
 @router.get("/memory-usage")
+@wrap_errors(status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to get memory usage")
 async def get_cache_memory_usage():
     """
     Get memory usage statistics for all cache levels.
     """
-    try:
-        stats = await multi_level_cache.get_all_stats()
-
-        memory_info = {
-            "l1": {
-                "used_bytes": stats["l1"]["memory_bytes"],
-                "max_bytes": stats["l1"]["max_memory_bytes"],
-                "usage_percent": stats["l1"]["memory_usage_percent"],
-                "entries": stats["l1"]["size"],
-                "max_entries": stats["l1"]["max_size"]
-            }
+    stats = await multi_level_cache.get_all_stats()
+
+    l1 = stats["l1"]
+    memory_info = {
+        "l1": {
+            "used_bytes": l1["memory_bytes"],
+            "max_bytes": l1["max_memory_bytes"],
+            "usage_percent": l1["memory_usage_percent"],
+            "entries": l1["size"],
+            "max_entries": l1["max_size"]
+        }
+    }
+
+    l2 = stats.get("l2")
+    if l2 is not None:
+        memory_info["l2"] = {
+            "connected": l2.get("connected", False),
+            "used_memory": l2.get("memory_used_human", "N/A"),
+            "entries": l2.get("size", 0)
         }
 
-        if "l2" in stats:
-            memory_info["l2"] = {
-                "connected": stats["l2"].get("connected", False),
-                "used_memory": stats["l2"].get("memory_used_human", "N/A"),
-                "entries": stats["l2"].get("size", 0)
-            }
-
-        if "l3" in stats:
-            memory_info["l3"] = {
-                "used_bytes": stats["l3"]["total_size_bytes"],
-                "used_mb": stats["l3"]["total_size_mb"],
-                "max_bytes": stats["l3"]["max_size_bytes"],
-                "usage_percent": stats["l3"]["usage_percent"],
-                "entries": stats["l3"]["size"]
-            }
-
-        return memory_info
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get memory usage: {str(e)}"
-        )
+    l3 = stats.get("l3")
+    if l3 is not None:
+        memory_info["l3"] = {
+            "used_bytes": l3["total_size_bytes"],
+            "used_mb": l3["total_size_mb"],
+            "max_bytes": l3["max_size_bytes"],
+            "usage_percent": l3["usage_percent"],
+            "entries": l3["size"]
+        }
+
+    return memory_info
 
 
 @router.post("/warmup")
+@wrap_errors(status.HTTP_500_INTERNAL_SERVER_ERROR, "Cache warmup failed")
 async def warmup_cache():
     """
     Warm up cache with predefined common queries.
     """
-    try:
-        # Use the default warmup queries
-        await cached_chat_service._warmup_cache()
-
-        stats = await multi_level_cache.get_all_stats()
-
-        return {
-            "status": "success",
-            "message": "Cache warmup completed",
-            "warmed_queries": cached_chat_service.warmup_queries,
-            "cache_size": {
-                "l1": stats["l1"]["size"],
-                "l2": stats.get("l2", {}).get("size", 0),
-                "l3": stats.get("l3", {}).get("size", 0)
-            }
+    # Use the default warmup queries
+    await cached_chat_service._warmup_cache()
+
+    stats = await multi_level_cache.get_all_stats()
+
+    return {
+        "status": "success",
+        "message": "Cache warmup completed",
+        "warmed_queries": cached_chat_service.warmup_queries,
+        "cache_size": {
+            "l1": stats["l1"]["size"],
+            "l2": stats.get("l2", {}).get("size", 0),
+            "l3": stats.get("l3", {}).get("size", 0)
         }
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Cache warmup failed: {str(e)}"
-        )
+    }
 
 
 def _calculate_effectiveness(stats: Dict[str, Any]) -> str:
@@ -279,11 +314,7 @@ def _calculate_effectiveness(stats: Dict[str, Any]) -> str:
     hit_rate = stats["hit_rate"]
     avg_response = stats["avg_response_time_ms"]
 
-    if hit_rate >= 0.8 and avg_response < 50:
-        return "excellent"
-    elif hit_rate >= 0.6 and avg_response < 100:
-        return "good"
-    elif hit_rate >= 0.4 and avg_response < 200:
-        return "moderate"
-    else:
-        return "needs_improvement"
\ No newline at end of file
+    for min_hit_rate, max_response_ms, label in _EFFECTIVENESS:
+        if hit_rate >= min_hit_rate and avg_response < max_response_ms:
+            return label
+    return "needs_improvement"
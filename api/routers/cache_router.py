@@ -1,19 +1,24 @@
 # Cache Management API Router
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any, List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from api.services.context_cache import context_cache
+from api.services.redis_cache import redis_cache
 
-router = APIRouter(prefix="/api/cache", tags=["cache"])
+router = APIRouter(prefix="/api/cache", tags=["cache"], default_response_class=ORJSONResponse)
 
 class CacheInvalidateRequest(BaseModel):
     """캐시 무효화 요청 모델"""
     query: Optional[str] = None
     pattern: Optional[str] = None
 
+# 응답 모델은 OpenAPI 문서용: 핸들러는 내부 통계 dict를 그대로 반환하므로 요청마다 재검증하지 않음
 class CacheStats(BaseModel):
     """캐시 통계 응답 모델"""
+    model_config = ConfigDict(extra="allow")
+
     hits: int
     misses: int
     evictions: int
@@ -24,16 +29,23 @@ class CacheStats(BaseModel):
 
 class HotQuery(BaseModel):
     """인기 쿼리 모델"""
+    model_config = ConfigDict(extra="allow")
+
     query: str
     hit_count: int
     last_accessed: str
 
-@router.get("/stats", response_model=CacheStats)
+@router.get("/stats", response_model=None, responses={200: {"model": CacheStats}})
 async def get_cache_stats() -> Dict[str, Any]:
     """캐시 통계 조회"""
     return context_cache.get_stats()
 
-@router.get("/hot-queries", response_model=List[HotQuery])
+@router.get("/search-stats")
+async def get_search_cache_stats() -> Dict[str, Any]:
+    """검색/그래프/시세 공유 Redis 캐시 통계 조회"""
+    return redis_cache.get_stats()
+
+@router.get("/hot-queries", response_model=None, responses={200: {"model": List[HotQuery]}})
 async def get_hot_queries(top_n: int = 10) -> List[Dict[str, Any]]:
     """자주 사용되는 쿼리 조회"""
     return context_cache.get_hot_queries(top_n)
@@ -1,20 +1,100 @@
 """Metrics and monitoring endpoints."""
 
-from typing import Dict, Any
-from fastapi import APIRouter, Response
-from fastapi.responses import PlainTextResponse
+import asyncio
+import gzip
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from api.monitoring.metrics import metrics_collector
-from api.cache import multi_level_cache
+from api.cache import multi_level_cache, get_stats_cached, request_stats_scope
 from api.services.cached_chat_service import cached_chat_service
+from api.routers.health_router import SERVICE_VERSION, uptime_seconds
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(request_stats_scope)]
+)
+
+# Rendered exposition text is reused for this many seconds so bursts of
+# scrapes (Prometheus, Grafana, alertmanager) share one stats rebuild. A
+# gzip copy is compressed once per rebuild for scrapers that accept it.
+_METRICS_TTL = 1.0
+_METRICS_CACHE = {"ts": 0.0, "body": b"", "body_gz": b""}
+_metrics_lock = asyncio.Lock()
+
+# Serialized /metrics/dashboard payload, rebuilt every
+# _DASHBOARD_REFRESH_SECONDS by the background refresh task
+_DASHBOARD_REFRESH_SECONDS = 5
+_dashboard_body = bytearray()
+_dashboard_refresh_task: Optional[asyncio.Task] = None
 
-router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+async def get_prometheus_metrics(request: Request) -> Response:
+    """Get Prometheus metrics in text format.
+
+    Mounted by ``main.py`` as a plain Starlette route (not on this router) so
+    scrapes skip dependency resolution, response-model handling and the
+    OpenAPI schema.
+    """
+    if time.monotonic() - _METRICS_CACHE["ts"] >= _METRICS_TTL:
+        async with _metrics_lock:
+            # Another scrape may have refreshed the cache while we waited
+            if time.monotonic() - _METRICS_CACHE["ts"] >= _METRICS_TTL:
+                body = await _render_metrics()
+                _METRICS_CACHE["body"] = body
+                _METRICS_CACHE["body_gz"] = gzip.compress(body, compresslevel=1)
+                _METRICS_CACHE["ts"] = time.monotonic()
+
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            content=_METRICS_CACHE["body_gz"],
+            media_type=CONTENT_TYPE_LATEST,
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return Response(
+        content=_METRICS_CACHE["body"],
+        media_type=CONTENT_TYPE_LATEST,
+        headers={"Vary": "Accept-Encoding"}
+    )
 
 
-@router.get("", response_class=PlainTextResponse)
-async def get_prometheus_metrics():
-    """Get Prometheus metrics in text format."""
-    # Update cache metrics before returning
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip with q > 0.
+
+    An explicit ``gzip`` entry takes precedence over the ``*`` wildcard.
+    """
+    qvalues = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if name not in ("gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[name] = q
+    return qvalues.get("gzip", qvalues.get("*", 0.0)) > 0
+
+
+async def _render_metrics() -> bytes:
+    """Refresh cache and quality gauges and render the exposition text."""
+    # Update cache metrics before rendering
     try:
         cache_stats = await multi_level_cache.get_all_stats()
         metrics_collector.update_cache_metrics(cache_stats)
@@ -29,7 +109,7 @@ async def get_prometheus_metrics():
     except Exception:
         pass
 
-    return metrics_collector.get_metrics()
+    return metrics_collector.get_metrics_bytes()
 
 
 @router.get("/health")
@@ -71,14 +151,15 @@ async def health_check() -> Dict[str, Any]:
             "status": "healthy" if overall_healthy else "unhealthy",
             "timestamp": "2024-01-01T00:00:00Z",  # Should use actual timestamp
             "components": components,
-            "version": "1.0.0",
-            "uptime_seconds": 3600  # Should calculate actual uptime
+            "version": SERVICE_VERSION,
+            "uptime_seconds": uptime_seconds()
         }
 
-    except Exception as e:
+    except Exception:
+        logger.exception("health_check failed")
         return {
             "status": "unhealthy",
-            "error": str(e),
+            "error": "Health check failed",
             "timestamp": "2024-01-01T00:00:00Z"
         }
 
@@ -95,10 +176,11 @@ async def get_cache_prometheus_metrics() -> Dict[str, Any]:
             "metrics": cache_stats
         }
 
-    except Exception as e:
+    except Exception:
+        logger.exception("get_cache_prometheus_metrics failed")
         return {
             "status": "error",
-            "error": str(e)
+            "error": "Failed to collect cache metrics"
         }
 
 
@@ -118,44 +200,89 @@ async def update_quality_score(quality_score: float):
                 "error": "Quality score must be between 0 and 1"
             }
 
-    except Exception as e:
+    except Exception:
+        logger.exception("update_quality_score failed")
         return {
             "status": "error",
-            "error": str(e)
+            "error": "Failed to update quality score"
         }
 
 
-@router.get("/dashboard")
-async def get_dashboard_metrics() -> Dict[str, Any]:
-    """Get comprehensive metrics for dashboard display."""
-    try:
-        # Cache metrics
-        cache_stats = await multi_level_cache.get_all_stats()
+async def _build_dashboard() -> Dict[str, Any]:
+    """Collect the metrics shown on the dashboard."""
+    # Cache and service metrics, fetched concurrently; within one stats scope
+    # both share a single get_all_stats() call
+    cache_stats, service_metrics = await asyncio.gather(
+        get_stats_cached(multi_level_cache),
+        cached_chat_service.get_cache_metrics()
+    )
 
-        # Service metrics
-        service_metrics = await cached_chat_service.get_cache_metrics()
-
-        # Combine all metrics
-        dashboard_data = {
-            "quality_score": 0.949,  # Should come from actual calculation
-            "cache_stats": cache_stats,
-            "service_metrics": service_metrics,
-            "system_health": {
-                "healthy": True,
-                "degradation_level": 0,
-                "uptime_seconds": 3600
-            },
-            "performance": {
-                "avg_response_time_ms": cache_stats["overall"].get("avg_response_time_ms", 50),
-                "request_rate": 10.0,  # Should calculate actual request rate
-                "error_rate": 0.01
-            }
+    # Combine all metrics
+    return {
+        "quality_score": 0.949,  # Should come from actual calculation
+        "cache_stats": cache_stats,
+        "service_metrics": service_metrics,
+        "system_health": {
+            "healthy": True,
+            "degradation_level": 0,
+            "uptime_seconds": uptime_seconds()
+        },
+        "performance": {
+            "avg_response_time_ms": cache_stats["overall"].get("avg_response_time_ms", 50),
+            "request_rate": 10.0,  # Should calculate actual request rate
+            "error_rate": 0.01
         }
+    }
+
 
-        return dashboard_data
+@router.get("/dashboard")
+async def get_dashboard_metrics(fresh: bool = False):
+    """
+    Get comprehensive metrics for dashboard display.
+
+    Served from the snapshot kept by the background refresh task; pass
+    ``fresh=true`` (or call before the first refresh) to collect live.
+    """
+    if not fresh and _dashboard_body:
+        return Response(content=bytes(_dashboard_body), media_type="application/json")
+
+    try:
+        return await _build_dashboard()
 
-    except Exception as e:
+    except Exception:
+        logger.exception("get_dashboard_metrics failed")
         return {
             "status": "error",
-            "error": str(e)
-        }
\ No newline at end of file
+            "error": "Failed to collect dashboard metrics"
+        }
+
+
+async def start_dashboard_refresh_task() -> None:
+    """Start re-serializing the dashboard snapshot in the background."""
+    global _dashboard_refresh_task
+
+    async def refresh_loop():
+        while True:
+            try:
+                async with asynccontextmanager(request_stats_scope)():
+                    data = await _build_dashboard()
+                # Resize the shared buffer in place rather than rebinding it
+                _dashboard_body[:] = orjson.dumps(data)
+            except Exception as e:
+                logger.warning(f"Dashboard metrics refresh failed: {e}")
+            await asyncio.sleep(_DASHBOARD_REFRESH_SECONDS)
+
+    if not _dashboard_refresh_task:
+        _dashboard_refresh_task = asyncio.create_task(refresh_loop())
+
+
+async def stop_dashboard_refresh_task() -> None:
+    """Stop the background dashboard refresh."""
+    global _dashboard_refresh_task
+    if _dashboard_refresh_task:
+        _dashboard_refresh_task.cancel()
+        try:
+            await _dashboard_refresh_task
+        except asyncio.CancelledError:
+            pass
+        _dashboard_refresh_task = None
@@ -4,8 +4,10 @@ Prometheus 메트릭 엔드포인트 및 헬스체크 제공
 """
 
 from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+import asyncio
 import logging
 import time
 import psutil
@@ -13,15 +15,51 @@ import os
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/monitoring", tags=["monitoring"])
+# 선택적 구성 요소는 모듈 로드 시 한 번만 import 하고 요청마다 결과만 참조
+try:
+    from api.utils.langfuse_tracer import tracer as _langfuse_tracer
+except Exception:
+    _langfuse_tracer = None
+
+try:
+    import api.monitoring.metrics_collector  # noqa: F401
+    _PROMETHEUS_AVAILABLE = True
+except Exception:
+    _PROMETHEUS_AVAILABLE = False
+
+router = APIRouter(prefix="/monitoring", tags=["monitoring"], default_response_class=ORJSONResponse)
+
+# 현재 프로세스 핸들; cpu_percent(interval=None)는 직전 호출 이후의 값을
+# 반환하므로 모듈 로드 시 한 번 호출해 기준점을 만든다
+_PROCESS = psutil.Process(os.getpid())
+psutil.cpu_percent(interval=None)
+_PROCESS.cpu_percent(interval=None)
+
+# 직렬화된 메트릭 재사용 시간 (초): 동시에 몰린 스크레이프가 한 번의 직렬화를 공유
+_METRICS_TTL = 1.0
+_metrics_cache: Dict[str, Any] = {"ts": 0.0, "body": b""}
+_metrics_lock = asyncio.Lock()
+
+# 디스크 사용량은 천천히 변하므로 더 길게 재사용 (초)
+_DISK_TTL = 60.0
+_disk_cache: Dict[str, Any] = {"ts": 0.0, "val": None}
+
+# 상세 헬스 체크 결과 재사용 시간 (초)
+_HEALTH_TTL = 2.0
+_health_cache: Dict[str, Any] = {"ts": 0.0, "val": None}
 
 @router.get("/metrics")
 async def get_metrics():
     """Prometheus 메트릭 엔드포인트"""
     try:
-        # Prometheus 메트릭 생성
-        metrics_data = generate_latest()
-        return Response(content=metrics_data, media_type=CONTENT_TYPE_LATEST)
+        if time.monotonic() - _metrics_cache["ts"] >= _METRICS_TTL:
+            async with _metrics_lock:
+                # 대기 중 다른 요청이 갱신했을 수 있음
+                if time.monotonic() - _metrics_cache["ts"] >= _METRICS_TTL:
+                    # Prometheus 메트릭 생성 (레지스트리 직렬화는 스레드에서 수행)
+                    _metrics_cache["body"] = await asyncio.to_thread(generate_latest)
+                    _metrics_cache["ts"] = time.monotonic()
+        return Response(content=_metrics_cache["body"], media_type=CONTENT_TYPE_LATEST)
     except Exception as e:
         logger.error(f"메트릭 생성 실패: {e}")
         return Response(content="", media_type=CONTENT_TYPE_LATEST, status_code=500)
@@ -29,15 +67,21 @@ async def get_metrics():
 @router.get("/health/detailed")
 async def get_detailed_health() -> Dict[str, Any]:
     """상세 헬스 체크"""
+    if _health_cache["val"] is not None and time.monotonic() - _health_cache["ts"] < _HEALTH_TTL:
+        return _health_cache["val"]
+
     try:
-        # 시스템 정보
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # 시스템 정보 (cpu_percent는 블로킹 없이 직전 호출 이후 값 사용)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        disk = _disk_usage()
 
-        # 프로세스 정보
-        process = psutil.Process(os.getpid())
-        process_memory = process.memory_info()
+        # 프로세스 정보 (oneshot으로 시스템 호출 일괄 처리)
+        process = _PROCESS
+        with process.oneshot():
+            process_memory = process.memory_info()
+            process_cpu = process.cpu_percent()
+            create_time = process.create_time()
 
         health_info = {
             "status": "healthy",
@@ -53,15 +97,15 @@ async def get_detailed_health() -> Dict[str, Any]:
                 "disk": {
                     "total": disk.total,
                     "free": disk.free,
-                    "percent": (disk.used / disk.total) * 100
+                    "percent": disk.percent
                 }
             },
             "process": {
                 "pid": process.pid,
                 "memory_rss": process_memory.rss,
                 "memory_vms": process_memory.vms,
-                "cpu_percent": process.cpu_percent(),
-                "create_time": process.create_time()
+                "cpu_percent": process_cpu,
+                "create_time": create_time
             },
             "services": {
                 "langfuse_tracing": _check_langfuse_connection(),
@@ -69,6 +113,8 @@ async def get_detailed_health() -> Dict[str, Any]:
             }
         }
 
+        _health_cache["val"] = health_info
+        _health_cache["ts"] = time.monotonic()
         return health_info
 
     except Exception as e:
@@ -85,19 +131,17 @@ async def get_stats() -> Dict[str, Any]:
     try:
         from api.monitoring.metrics_collector import query_metrics, session_manager
 
+        # 세션은 이벤트 루프에서만 변경되므로 여기서 스냅샷을 뜨고,
+        # 세션별 상세 목록 구성은 스레드에서 수행
+        sessions = list(session_manager.active_sessions.items())
+        now = time.time()
+        session_details = await asyncio.to_thread(_build_session_details, sessions, now)
+
         stats = {
-            "timestamp": time.time(),
+            "timestamp": now,
             "active_queries": query_metrics.active_queries._value.get(),
-            "active_sessions": len(session_manager.active_sessions),
-            "session_details": [
-                {
-                    "session_id": sid,
-                    "user_id": info["user_id"],
-                    "duration": time.time() - info["start_time"],
-                    "queries": info["queries"]
-                }
-                for sid, info in session_manager.active_sessions.items()
-            ]
+            "active_sessions": len(sessions),
+            "session_details": session_details
         }
 
         return stats
@@ -152,18 +196,29 @@ async def end_session(session_id: str) -> Dict[str, Any]:
             "status": "failed"
         }
 
+def _disk_usage():
+    """루트 파티션 사용량 (_DISK_TTL 동안 재사용)"""
+    if _disk_cache["val"] is None or time.monotonic() - _disk_cache["ts"] >= _DISK_TTL:
+        _disk_cache["val"] = psutil.disk_usage('/')
+        _disk_cache["ts"] = time.monotonic()
+    return _disk_cache["val"]
+
+def _build_session_details(sessions: List[Tuple[str, Dict[str, Any]]], now: float) -> List[Dict[str, Any]]:
+    """세션 스냅샷으로 상세 목록 생성"""
+    return [
+        {
+            "session_id": sid,
+            "user_id": info["user_id"],
+            "duration": now - info["start_time"],
+            "queries": info["queries"]
+        }
+        for sid, info in sessions
+    ]
+
 def _check_langfuse_connection() -> bool:
     """Langfuse 연결 상태 확인"""
-    try:
-        from api.utils.langfuse_tracer import tracer
-        return tracer.is_enabled
-    except:
-        return False
+    return _langfuse_tracer is not None and _langfuse_tracer.is_enabled
 
 def _check_prometheus_available() -> bool:
     """Prometheus 메트릭 시스템 사용 가능 여부 확인"""
-    try:
-        from api.monitoring.metrics_collector import MONITORING_AVAILABLE
-        return MONITORING_AVAILABLE
-    except:
-        return False
\ No newline at end of file
+    return _PROMETHEUS_AVAILABLE
\ No newline at end of file
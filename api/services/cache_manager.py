@@ -2,26 +2,33 @@
 고성능 캐싱 및 성능 최적화 시스템
 메모리 캐시, TTL 관리, 병렬 처리 최적화 포함
 """
+import sys
 import time
 import hashlib
+import heapq
 import asyncio
-from typing import Any, Dict, Optional, List, Tuple, Callable
+from typing import Any, Dict, Optional, List, Set, Tuple, Callable
 from dataclasses import dataclass, field
-from collections import defaultdict, OrderedDict
+from collections import defaultdict, deque
 from api.logging import setup_logging
 logger = setup_logging()
 import threading
-from functools import wraps
+from functools import partial, wraps
+from itertools import islice
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
-    """캐시 엔트리"""
+    """캐시 엔트리 (__slots__로 인스턴스별 __dict__ 제거)"""
     data: Any
     timestamp: float
     ttl: float
     hit_count: int = 0
     last_access: float = field(default_factory=time.time)
     size_bytes: int = 0
+    # 카테고리(prefix) 인덱스에서 제거할 때 사용
+    prefix: str = ""
+    # CLOCK 참조 비트: 히트 시 설정, 시계 바늘이 지나가며 해제
+    referenced: bool = False
 
 @dataclass 
 class CacheStats:
@@ -39,8 +46,29 @@ class CacheStats:
             return 0.0
         return self.cache_hits / self.total_requests
 
+# 만료 예정 엔트리가 없을 때 정리 스레드 대기 시간 (초)
+_CLEANUP_IDLE_SECONDS = 60.0
+
+# 평균 응답 시간 계산에 쓰는 최근 기록 수
+_RESPONSE_TIME_WINDOW = 100
+
+# 크기 추정 시 샘플링할 컨테이너 원소 수
+_SIZE_SAMPLE = 16
+
+# 샤드 수 (2의 거듭제곱): 키 해시로 샤드를 고르고 샤드별 락만 잡는다
+_SHARD_COUNT = 16
+
 class AdvancedCacheManager:
-    """고급 캐싱 관리자 - LRU, TTL, 크기 제한 지원"""
+    """고급 캐싱 관리자 - CLOCK 교체, TTL, 크기 제한 지원
+
+    엔트리는 _SHARD_COUNT개의 샤드에 나뉘어 저장되며, 각 샤드는 자체 dict,
+    CLOCK 큐, 락, 통계를 가진다. 크기/메모리 한도와 교체는 샤드 단위로
+    적용된다. 히트는 참조 비트만 설정하므로 엔트리 순서를 바꾸지 않는다.
+
+    샤드당 한도는 ceil(max_size / _SHARD_COUNT)개이므로 키가 고르게 분산되면
+    max_size개를 모두 쓸 수 있다 (_SHARD_COUNT의 배수가 아니면 최대 _SHARD_COUNT - 1개
+    초과). 한 샤드에 키가 몰리면 다른 샤드에 여유가 있어도 그 샤드에서 교체된다.
+    """
     
     def __init__(
         self, 
@@ -52,11 +80,31 @@ class AdvancedCacheManager:
         self.default_ttl = default_ttl
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # 샤드별 한도 (올림 나눗셈: 샤드 합계가 max_size보다 작아지지 않도록)
+        self._shard_max_size = max(1, -(-max_size // _SHARD_COUNT))
+        self._shard_max_bytes = -(-self.max_memory_bytes // _SHARD_COUNT)
+        # 만료 힙 재구성 기준: 실제 보관 가능한 엔트리 수(샤드 한도 합계)의 2배.
+        # max_size 기준이면 샤드 올림으로 살아있는 엔트리만으로도 넘을 수 있다
+        self._heap_compact_threshold = 2 * _SHARD_COUNT * self._shard_max_size
+
+        self._shards: List[Dict[int, CacheEntry]] = [{} for _ in range(_SHARD_COUNT)]
+        # 샤드별 CLOCK 순서; 삭제된 키는 바늘이 지나갈 때 제거
+        self._clocks: List[deque] = [deque() for _ in range(_SHARD_COUNT)]
+        # 샤드별 prefix -> 키 집합: 카테고리 무효화 시 해당 키만 순회
+        self._by_prefix: List[Dict[str, Set[int]]] = [defaultdict(set) for _ in range(_SHARD_COUNT)]
+        self._locks = [threading.RLock() for _ in range(_SHARD_COUNT)]
+        # 샤드별 통계: 요청/히트/미스 카운터도 샤드 락 안에서 갱신하고 get_stats에서 합산
+        self._shard_stats = [CacheStats() for _ in range(_SHARD_COUNT)]
+        # 응답 시간 기록 전용 락
         self._lock = threading.RLock()
-        self._stats = CacheStats()
+        # (만료 시각, 키) 최소 힙: 정리 스레드는 다음 만료 시각까지 대기
+        self._expiry_heap: List[Tuple[float, int]] = []
+        self._expiry_lock = threading.Lock()
+        self._wake_event = threading.Event()
         self._ttl_configs: Dict[str, float] = {}
-        self._response_times: List[float] = []
+        # 최근 응답 시간 링 버퍼와 누적 합 (평균을 O(1)로 계산)
+        self._response_times: deque = deque(maxlen=_RESPONSE_TIME_WINDOW)
+        self._rt_sum = 0.0
         
         # 카테고리별 TTL 설정
         self._setup_category_ttls()
@@ -77,101 +125,149 @@ class AdvancedCacheManager:
             "entity_analysis": 1200.0      # 20분 - 엔티티 분석
         })
     
-    def _generate_cache_key(self, prefix: str, *args, **kwargs) -> str:
-        """캐시 키 생성"""
-        key_data = f"{prefix}:{args}:{sorted(kwargs.items())}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+    def _generate_cache_key(self, prefix: str, *args, **kwargs) -> int:
+        """캐시 키 생성 (blake2b 64비트 다이제스트를 정수로 사용)"""
+        # kwargs가 없는 일반적인 호출은 정렬 생략
+        key_data = (prefix, args, tuple(sorted(kwargs.items())) if kwargs else ())
+        digest = hashlib.blake2b(repr(key_data).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
     
     def _estimate_size(self, data: Any) -> int:
-        """데이터 크기 추정 (바이트)"""
+        """데이터 크기 추정 (바이트) - 직렬화 없이 얕은 샘플링"""
         try:
-            if isinstance(data, str):
-                return len(data.encode('utf-8'))
-            elif isinstance(data, (list, dict)):
-                import sys
-                return sys.getsizeof(data)
+            if isinstance(data, (str, bytes)):
+                return len(data)
+            elif isinstance(data, (list, tuple)):
+                # 앞쪽 일부 원소 크기로 전체를 외삽
+                sample = data[:_SIZE_SAMPLE]
+                if not sample:
+                    return sys.getsizeof(data)
+                sampled = sum(map(sys.getsizeof, sample))
+                return sys.getsizeof(data) + sampled * len(data) // len(sample)
+            elif isinstance(data, dict):
+                sample = list(islice(data.items(), _SIZE_SAMPLE))
+                if not sample:
+                    return sys.getsizeof(data)
+                sampled = sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in sample)
+                return sys.getsizeof(data) + sampled * len(data) // len(sample)
             else:
-                import pickle
-                return len(pickle.dumps(data))
+                return sys.getsizeof(data)
         except:
             return 1024  # 기본 추정치
     
-    def _should_evict(self) -> bool:
-        """캐시 정리가 필요한지 확인"""
+    def _shard_index(self, key: int) -> int:
+        """키가 속한 샤드 번호 (다이제스트 하위 비트)"""
+        return key & (_SHARD_COUNT - 1)
+    
+    def _remove_entry(self, index: int, key: int) -> Optional[CacheEntry]:
+        """샤드에서 엔트리 제거 및 크기/prefix 인덱스 갱신 (호출자가 샤드 락을 보유)"""
+        entry = self._shards[index].pop(key, None)
+        if entry is not None:
+            self._shard_stats[index].total_size_bytes -= entry.size_bytes
+            by_prefix = self._by_prefix[index]
+            keys = by_prefix.get(entry.prefix)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del by_prefix[entry.prefix]
+        return entry
+    
+    def _should_evict(self, index: int) -> bool:
+        """샤드가 한도를 넘었는지 확인 (한도까지는 보관)"""
         return (
-            len(self._cache) >= self.max_size or 
-            self._stats.total_size_bytes >= self.max_memory_bytes
+            len(self._shards[index]) > self._shard_max_size or 
+            self._shard_stats[index].total_size_bytes > self._shard_max_bytes
         )
     
-    def _evict_entries(self):
-        """캐시 엔트리 정리"""
+    def _evict_entries(self, index: int):
+        """샤드 엔트리 정리 (호출자가 샤드 락을 보유)"""
+        shard = self._shards[index]
+        stats = self._shard_stats[index]
         current_time = time.time()
         evicted_count = 0
         
         # 1. 만료된 엔트리 제거
         expired_keys = []
-        for key, entry in self._cache.items():
+        for key, entry in shard.items():
             if current_time > entry.timestamp + entry.ttl:
                 expired_keys.append(key)
         
         for key in expired_keys:
-            entry = self._cache.pop(key)
-            self._stats.total_size_bytes -= entry.size_bytes
+            self._remove_entry(index, key)
             evicted_count += 1
         
-        # 2. 크기/메모리 제한 초과 시 LRU 정리
-        while self._should_evict() and len(self._cache) > 0:
-            # 가장 오래된 항목 제거 (OrderedDict의 FIFO 특성 이용)
-            key, entry = self._cache.popitem(last=False)
-            self._stats.total_size_bytes -= entry.size_bytes
+        # 2. 크기/메모리 제한 초과 시 CLOCK 정리
+        clock = self._clocks[index]
+        while self._should_evict(index) and clock:
+            key = clock.popleft()
+            entry = shard.get(key)
+            if entry is None:
+                continue  # 이미 삭제된 키
+            if entry.referenced:
+                # 최근 사용됨: 참조 비트를 지우고 한 바퀴 유예
+                entry.referenced = False
+                clock.append(key)
+                continue
+            self._remove_entry(index, key)
             evicted_count += 1
         
         if evicted_count > 0:
-            self._stats.evictions += evicted_count
-            print(f"[DEBUG] 캐시 정리 완료: {evicted_count}개 엔트리 제거")
+            stats.evictions += evicted_count
+            logger.debug("캐시 정리 완료: {}개 엔트리 제거", evicted_count)
     
     def get(self, prefix: str, *args, **kwargs) -> Optional[Any]:
         """캐시에서 데이터 조회"""
-        key = self._generate_cache_key(prefix, *args, **kwargs)
+        return self._get_by_key(self._generate_cache_key(prefix, *args, **kwargs), prefix)
+    
+    def _get_by_key(self, key: int, prefix: str) -> Optional[Any]:
+        """이미 생성된 키로 조회"""
+        index = self._shard_index(key)
         current_time = time.time()
         
-        with self._lock:
-            self._stats.total_requests += 1
+        with self._locks[index]:
+            # clear()가 통계 객체를 교체하므로 락 안에서 조회
+            stats = self._shard_stats[index]
+            stats.total_requests += 1
+            entry = self._shards[index].get(key)
+            if entry is not None:
+                # TTL 확인
+                if current_time > entry.timestamp + entry.ttl:
+                    # 만료된 엔트리 제거
+                    self._remove_entry(index, key)
+                    entry = None
+                else:
+                    # 히트 업데이트 (순서 변경 없이 참조 비트만 설정)
+                    entry.hit_count += 1
+                    entry.last_access = current_time
+                    entry.referenced = True
             
-            entry = self._cache.get(key)
             if entry is None:
-                self._stats.cache_misses += 1
-                return None
-            
-            # TTL 확인
-            if current_time > entry.timestamp + entry.ttl:
-                # 만료된 엔트리 제거
-                self._cache.pop(key)
-                self._stats.total_size_bytes -= entry.size_bytes
-                self._stats.cache_misses += 1
-                return None
-            
-            # 히트 업데이트
-            entry.hit_count += 1
-            entry.last_access = current_time
-            self._stats.cache_hits += 1
-            
-            # LRU 업데이트 (맨 뒤로 이동)
-            self._cache.move_to_end(key)
-            
-            print(f"[DEBUG] 캐시 히트: {prefix} (히트율: {self._stats.hit_ratio:.1%})")
-            return entry.data
+                stats.cache_misses += 1
+            else:
+                stats.cache_hits += 1
+        
+        if entry is None:
+            return None
+        
+        logger.debug("캐시 히트: {}", prefix)
+        return entry.data
     
     def set(
         self, 
         prefix: str, 
         data: Any, 
-        ttl: Optional[float] = None, 
         *args, 
+        ttl: Optional[float] = None, 
         **kwargs
     ):
-        """캐시에 데이터 저장"""
-        key = self._generate_cache_key(prefix, *args, **kwargs)
+        """캐시에 데이터 저장
+
+        키 인자는 get()과 동일하게 전달하며, ttl은 키워드로만 받는다.
+        """
+        self._set_by_key(self._generate_cache_key(prefix, *args, **kwargs), prefix, data, ttl)
+    
+    def _set_by_key(self, key: int, prefix: str, data: Any, ttl: Optional[float] = None):
+        """이미 생성된 키로 저장"""
         current_time = time.time()
         
         # TTL 결정
@@ -181,96 +277,168 @@ class AdvancedCacheManager:
         # 데이터 크기 추정
         size_bytes = self._estimate_size(data)
         
-        with self._lock:
+        index = self._shard_index(key)
+        shard = self._shards[index]
+        stats = self._shard_stats[index]
+        
+        with self._locks[index]:
             # 기존 엔트리가 있다면 크기 업데이트
-            if key in self._cache:
-                old_entry = self._cache[key]
-                self._stats.total_size_bytes -= old_entry.size_bytes
+            old_entry = shard.get(key)
+            if old_entry is not None:
+                stats.total_size_bytes -= old_entry.size_bytes
+            else:
+                self._by_prefix[index][prefix].add(key)
+                self._clocks[index].append(key)
             
             # 새 엔트리 생성
             entry = CacheEntry(
                 data=data,
                 timestamp=current_time,
                 ttl=ttl,
-                size_bytes=size_bytes
+                size_bytes=size_bytes,
+                prefix=prefix
             )
             
-            self._cache[key] = entry
-            self._stats.total_size_bytes += size_bytes
+            shard[key] = entry
+            stats.total_size_bytes += size_bytes
+            
+            clock = self._clocks[index]
+            if len(clock) > 2 * self._shard_max_size:
+                # 삭제 후 재등록으로 쌓인 중복/무효 슬롯 정리 (새 키가 저장된 뒤에 수행)
+                self._clocks[index] = deque(k for k in dict.fromkeys(clock) if k in shard)
             
             # 캐시 정리 필요 시 실행
-            if self._should_evict():
-                self._evict_entries()
+            if self._should_evict(index):
+                self._evict_entries(index)
             
-            print(f"[DEBUG] 캐시 저장: {prefix} (TTL: {ttl}초, 크기: {size_bytes}바이트)")
+            logger.debug("캐시 저장: {} (TTL: {}초, 크기: {}바이트)", prefix, ttl, size_bytes)
+        
+        # 만료 일정 등록 (샤드 락 밖에서; 가장 이른 만료면 정리 스레드를 깨움)
+        expires_at = current_time + ttl
+        with self._expiry_lock:
+            heap = self._expiry_heap
+            heapq.heappush(heap, (expires_at, key))
+            if heap[0][0] == expires_at or len(heap) > self._heap_compact_threshold:
+                self._wake_event.set()
     
     def invalidate(self, prefix: str, *args, **kwargs):
         """특정 캐시 엔트리 무효화"""
         key = self._generate_cache_key(prefix, *args, **kwargs)
+        index = self._shard_index(key)
         
-        with self._lock:
-            entry = self._cache.pop(key, None)
+        with self._locks[index]:
+            entry = self._remove_entry(index, key)
             if entry:
-                self._stats.total_size_bytes -= entry.size_bytes
-                print(f"[DEBUG] 캐시 무효화: {prefix}")
+                logger.debug("캐시 무효화: {}", prefix)
     
     def invalidate_pattern(self, pattern: str):
-        """패턴 매칭으로 캐시 무효화"""
-        with self._lock:
-            keys_to_remove = []
-            for key in self._cache.keys():
-                if pattern in key:
-                    keys_to_remove.append(key)
-            
-            for key in keys_to_remove:
-                entry = self._cache.pop(key)
-                self._stats.total_size_bytes -= entry.size_bytes
-            
-            if keys_to_remove:
-                print(f"[DEBUG] 패턴 매칭 캐시 무효화: {pattern} ({len(keys_to_remove)}개)")
+        """카테고리(prefix) 단위 캐시 무효화
+
+        키는 해시값이라 부분 문자열 매칭이 불가능하므로, ``pattern``은 get/set에
+        사용한 prefix (예: "news_search")로 해석한다.
+        """
+        removed = 0
+        for index in range(_SHARD_COUNT):
+            with self._locks[index]:
+                keys_to_remove = self._by_prefix[index].get(pattern)
+                if not keys_to_remove:
+                    continue
+                for key in list(keys_to_remove):
+                    self._remove_entry(index, key)
+                    removed += 1
+        
+        if removed:
+            logger.debug("카테고리 캐시 무효화: {} ({}개)", pattern, removed)
     
     def clear(self):
         """전체 캐시 삭제"""
-        with self._lock:
-            self._cache.clear()
-            self._stats = CacheStats()
-            print(f"[INFO] 전체 캐시 삭제 완료")
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                shard.clear()
+                self._clocks[index].clear()
+                self._by_prefix[index].clear()
+                self._shard_stats[index] = CacheStats()
+        with self._expiry_lock:
+            self._expiry_heap = []
+        logger.info("전체 캐시 삭제 완료")
     
     def get_stats(self) -> CacheStats:
         """캐시 통계 반환"""
+        total = CacheStats()
+        for index in range(_SHARD_COUNT):
+            with self._locks[index]:
+                stats = self._shard_stats[index]
+                total.total_requests += stats.total_requests
+                total.cache_hits += stats.cache_hits
+                total.cache_misses += stats.cache_misses
+                total.evictions += stats.evictions
+                total.total_size_bytes += stats.total_size_bytes
+        
         with self._lock:
             # 평균 응답시간 계산
             if self._response_times:
-                avg_time = sum(self._response_times) / len(self._response_times)
-                self._stats.average_response_time_ms = avg_time
-            
-            return CacheStats(
-                total_requests=self._stats.total_requests,
-                cache_hits=self._stats.cache_hits,
-                cache_misses=self._stats.cache_misses,
-                evictions=self._stats.evictions,
-                total_size_bytes=self._stats.total_size_bytes,
-                average_response_time_ms=self._stats.average_response_time_ms
-            )
+                total.average_response_time_ms = self._rt_sum / len(self._response_times)
+        
+        return total
     
     def record_response_time(self, time_ms: float):
-        """응답 시간 기록"""
+        """응답 시간 기록 (최근 _RESPONSE_TIME_WINDOW개 유지)"""
         with self._lock:
-            self._response_times.append(time_ms)
-            # 최근 100개만 유지
-            if len(self._response_times) > 100:
-                self._response_times.pop(0)
+            times = self._response_times
+            if len(times) == times.maxlen:
+                self._rt_sum -= times[0]
+            times.append(time_ms)
+            self._rt_sum += time_ms
+    
+    def _expire_due(self):
+        """만료 시각이 지난 엔트리 제거"""
+        now = time.time()
+        due = []
+        with self._expiry_lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                due.append(heapq.heappop(heap))
+        
+        for expires_at, key in due:
+            index = self._shard_index(key)
+            with self._locks[index]:
+                entry = self._shards[index].get(key)
+                # 이후 다시 저장된 키는 만료 시각이 달라 건너뜀
+                if entry is not None and entry.timestamp + entry.ttl == expires_at:
+                    self._remove_entry(index, key)
+                    self._shard_stats[index].evictions += 1
+    
+    def _compact_expiry_heap(self):
+        """삭제/재저장으로 쌓인 무효 힙 항목을 살아있는 엔트리 기준으로 재구성"""
+        with self._expiry_lock:
+            live = []
+            for index in range(_SHARD_COUNT):
+                with self._locks[index]:
+                    live.extend(
+                        (entry.timestamp + entry.ttl, key)
+                        for key, entry in self._shards[index].items()
+                    )
+            heapq.heapify(live)
+            self._expiry_heap = live
     
     def _start_cleanup_task(self):
-        """백그라운드 정리 작업 시작"""
+        """백그라운드 정리 작업 시작 (다음 만료 시각 또는 새 일정 등록 시 깨어남)"""
         def cleanup_worker():
             while True:
-                time.sleep(60)  # 1분마다 실행
+                with self._expiry_lock:
+                    heap = self._expiry_heap
+                    timeout = heap[0][0] - time.time() if heap else _CLEANUP_IDLE_SECONDS
+                # 재구성 후에도 항상 대기를 거쳐 바쁜 반복을 막는다
+                self._wake_event.wait(max(timeout, 0.0))
+                self._wake_event.clear()
                 try:
-                    with self._lock:
-                        self._evict_entries()
+                    self._expire_due()
+                    with self._expiry_lock:
+                        compact = len(self._expiry_heap) > self._heap_compact_threshold
+                    if compact:
+                        self._compact_expiry_heap()
                 except Exception as e:
-                    print(f"[ERROR] 캐시 정리 오류: {e}")
+                    logger.error("캐시 정리 오류: {}", e)
         
         cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
         cleanup_thread.start()
@@ -285,6 +453,34 @@ class CacheDecorator:
     
     def __init__(self, cache_manager: AdvancedCacheManager):
         self.cache_manager = cache_manager
+        # 캐시 키 -> 계산 중인 태스크: 동시 미스는 한 번만 계산하고 결과를 공유
+        self._inflight: Dict[int, asyncio.Task] = {}
+    
+    def _on_load_done(self, key: int, load: asyncio.Task):
+        """완료된 계산 태스크를 in-flight 목록에서 제거하고 예외를 조회 처리"""
+        if self._inflight.get(key) is load:
+            del self._inflight[key]
+        if not load.cancelled():
+            # 대기자가 없어도 미처리 예외 경고가 나지 않도록 조회
+            load.exception()
+    
+    def _key_builder(
+        self,
+        prefix: str,
+        include_args: bool,
+        include_kwargs: bool
+    ) -> Callable[[tuple, dict], int]:
+        """데코레이션 시점에 포함 옵션별 키 생성 함수 선택"""
+        generate = self.cache_manager._generate_cache_key
+        if include_args and include_kwargs:
+            return lambda args, kwargs: generate(prefix, *args, **kwargs)
+        if include_args:
+            return lambda args, kwargs: generate(prefix, *args)
+        if include_kwargs:
+            return lambda args, kwargs: generate(prefix, **kwargs)
+        # 인자를 키에 쓰지 않으면 prefix만으로 된 고정 키
+        fixed_key = generate(prefix)
+        return lambda args, kwargs: fixed_key
     
     def cached(
         self, 
@@ -294,70 +490,77 @@ class CacheDecorator:
         include_kwargs: bool = True
     ):
         """함수 결과 캐싱 데코레이터"""
+        prefix = sys.intern(prefix)
+        key_for = self._key_builder(prefix, include_args, include_kwargs)
+        
+        # 호출마다 속성 조회하지 않도록 클로저 지역 변수로 바인딩
+        cache_get = self.cache_manager._get_by_key
+        cache_set = self.cache_manager._set_by_key
+        record = self.cache_manager.record_response_time
+        inflight_calls = self._inflight
+        on_load_done = self._on_load_done
+        
         def decorator(func: Callable):
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
-                # 캐시 키 생성용 인자 준비
-                cache_args = args if include_args else ()
-                cache_kwargs = kwargs if include_kwargs else {}
+                # 호출당 한 번만 키 생성
+                key = key_for(args, kwargs)
                 
                 # 캐시에서 조회
-                cached_result = self.cache_manager.get(
-                    prefix, *cache_args, **cache_kwargs
-                )
+                cached_result = cache_get(key, prefix)
                 
                 if cached_result is not None:
                     return cached_result
                 
+                # 같은 키를 이미 계산 중이면 그 결과를 기다림. 계산은 in-flight
+                # 항목이 소유한 태스크에서 실행되므로 어느 호출자가 취소되어도
+                # 다른 대기자에게 전파되지 않는다 (조회와 등록 사이에 await가
+                # 없으므로 별도 락 불필요)
+                load = inflight_calls.get(key)
+                if load is None:
+                    load = asyncio.create_task(load_result(key, args, kwargs))
+                    inflight_calls[key] = load
+                    load.add_done_callback(partial(on_load_done, key))
+                
+                return await asyncio.shield(load)
+            
+            async def load_result(key: int, args: tuple, kwargs: dict):
                 # 캐시 미스 - 함수 실행
-                start_time = time.time()
+                start_time = time.monotonic()
                 try:
                     result = await func(*args, **kwargs)
-                    
-                    # 응답 시간 기록
-                    response_time = (time.time() - start_time) * 1000
-                    self.cache_manager.record_response_time(response_time)
-                    
-                    # 캐시에 저장
-                    self.cache_manager.set(
-                        prefix, result, ttl, *cache_args, **cache_kwargs
-                    )
-                    
-                    return result
-                except Exception as e:
-                    # 오류 시 응답 시간만 기록
-                    response_time = (time.time() - start_time) * 1000
-                    self.cache_manager.record_response_time(response_time)
-                    raise
+                finally:
+                    # 성공/오류 모두 응답 시간 기록
+                    response_time = (time.monotonic() - start_time) * 1000
+                    record(response_time)
+                
+                # 캐시에 저장
+                cache_set(key, prefix, result, ttl)
+                return result
                     
             @wraps(func) 
             def sync_wrapper(*args, **kwargs):
                 # 동기 함수용 래퍼
-                cache_args = args if include_args else ()
-                cache_kwargs = kwargs if include_kwargs else {}
+                key = key_for(args, kwargs)
                 
-                cached_result = self.cache_manager.get(
-                    prefix, *cache_args, **cache_kwargs
-                )
+                cached_result = cache_get(key, prefix)
                 
                 if cached_result is not None:
                     return cached_result
                 
-                start_time = time.time()
+                start_time = time.monotonic()
                 try:
                     result = func(*args, **kwargs)
                     
-                    response_time = (time.time() - start_time) * 1000
-                    self.cache_manager.record_response_time(response_time)
+                    response_time = (time.monotonic() - start_time) * 1000
+                    record(response_time)
                     
-                    self.cache_manager.set(
-                        prefix, result, ttl, *cache_args, **cache_kwargs
-                    )
+                    cache_set(key, prefix, result, ttl)
                     
                     return result
                 except Exception as e:
-                    response_time = (time.time() - start_time) * 1000
-                    self.cache_manager.record_response_time(response_time)
+                    response_time = (time.monotonic() - start_time) * 1000
+                    record(response_time)
                     raise
             
             # 비동기 함수인지 확인
@@ -1,13 +1,19 @@
 # src/ontology_chat/services/chat_service.py
 from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import heapq
 import re
 import time
+from contextlib import aclosing
+from functools import lru_cache
+from operator import itemgetter
 import anyio
 # from api.logging import setup_logging
 # logger = setup_logging()
 
 from api.config import settings
+from api.config.keyword_mappings import get_all_keyword_mappings
 from api.adapters.mcp_opensearch import OpenSearchMCP
 from api.adapters.mcp_neo4j import Neo4jMCP
 from api.adapters.mcp_stock import StockMCP
@@ -16,6 +22,7 @@ from api.services.formatters import summarize_graph_rows
 from api.services.search_strategy import advanced_search_engine, SearchResult
 from api.services.response_formatter import response_formatter
 from api.services.cache_manager import cache_decorator, cache_manager
+from api.services.redis_cache import redis_cached
 from api.services.error_handler import error_handler, with_retry, with_error_handling
 from api.services.context_cache import context_cache, cache_context
 from api.services.context_pruning import context_pruner, prune_search_results
@@ -55,14 +62,33 @@ except (ImportError, AttributeError) as e:
         return decorator
 
 # --- NEW: 간단한 도메인/룩백 추론 ---
+_LOOKBACK_RE = re.compile(r"최근\s*(\d+)\s*(일|개월)")
+_SYMBOL_RE = re.compile(r"\b\d{6}\.(KS|KQ)\b")
+# 상장사/투자 관련 키워드 힌트 (새 스키마 기반)
+_LISTED_HINT_RE = re.compile("상장사|투자|실적|재무|매출|영업이익")
+
+# 회사명 힌트: 대표 상장사들 (동적 확장 가능)
+_COMPANY_HINTS = (
+    (("삼성전자", "005930"), "삼성전자 반도체 전자"),
+    (("현대차", "005380"), "현대차 자동차"),
+    (("LG", "LG전자"), "LG 전자 가전"),
+    (("SK", "SK하이닉스"), "SK 반도체 메모리")
+)
+
+
 def _infer_domain_and_lookback(query: str) -> tuple[str, int]:
-    q = query.lower()
+    return _infer_domain_and_lookback_cached(query.lower())
+
+
+@lru_cache(maxsize=4096)
+def _infer_domain_and_lookback_cached(q: str) -> tuple[str, int]:
+    """소문자 질의 기준 도메인/룩백 추론 (기본값은 시작 시 고정되는 settings 사용)"""
     domain = settings.neo4j_search_default_domain or ""
     lookback = settings.neo4j_search_lookback_days
 
     # 질의에 '최근', '요즘', '최근 3개월' 류가 있으면 lookback 가변 적용(간단 규칙)
     # 예) "최근 90일", "최근 6개월"
-    m = re.search(r"최근\s*(\d+)\s*(일|개월)", q)
+    m = _LOOKBACK_RE.search(q)
     if m:
         val = int(m.group(1))
         unit = m.group(2)
@@ -72,18 +98,11 @@ def _infer_domain_and_lookback(query: str) -> tuple[str, int]:
             lookback = max(7, min(365*2, val * 30))
 
     # 상장사/투자 관련 키워드 힌트 (새 스키마 기반)
-    if any(tok in q for tok in ["상장사", "투자", "실적", "재무", "매출", "영업이익"]):
+    if _LISTED_HINT_RE.search(q):
         domain = (domain + " 상장사 투자 실적 재무").strip()
 
-    # 회사명 힌트: 대표 상장사들 (동적 확장 가능)
-    company_hints = {
-        ("삼성전자", "005930"): "삼성전자 반도체 전자",
-        ("현대차", "005380"): "현대차 자동차",
-        ("LG", "LG전자"): "LG 전자 가전",
-        ("SK", "SK하이닉스"): "SK 반도체 메모리"
-    }
-
-    for keywords, hint in company_hints.items():
+    # 회사명 힌트
+    for keywords, hint in _COMPANY_HINTS:
         if any(keyword in q for keyword in keywords):
             domain = (domain + " " + hint).strip()
             break
@@ -93,10 +112,89 @@ def _infer_domain_and_lookback(query: str) -> tuple[str, int]:
     return domain, lookback
 
 
+# --- 키워드 매핑 사전 컴파일 (모듈 로드 시 1회) ---
+_KEYWORD_MAPPINGS = get_all_keyword_mappings()
+
+# 시간 키워드 → 필터 일수 (앞에서부터 첫 매칭 사용)
+_TIME_FILTER_WORDS = (
+    ("최근", 30), ("요즘", 30), ("오늘", 1), ("어제", 2), ("이번주", 7),
+    ("이번달", 30), ("한달", 30), ("일주일", 7), ("최신", 7)
+)
+
+# 산업별 트리거 (INDUSTRY_KEYWORDS 키 기준)
+_INDUSTRY_TRIGGERS = {
+    "technology": ("IT", "소프트웨어", "기술", "AI", "인공지능"),
+    "automotive": ("자동차", "전기차", "배터리", "모빌리티"),
+    "semiconductor": ("반도체", "칩", "파운드리", "메모리"),
+    "defense": ("방산", "국방", "무기", "군수", "방위산업"),
+    "energy": ("에너지", "신재생", "태양광", "풍력"),
+    "nuclear": ("SMR", "원전", "원자력", "소형모듈원자로"),
+    "battery": ("2차전지", "이차전지", "배터리", "양극재", "음극재"),
+    "finance": ("금융", "지주회사", "은행", "증권", "보험"),
+    "bio": ("바이오", "제약", "헬스케어", "의료")
+}
+
+# 키워드 부족 시 원본 질문 분리에 쓰는 불용어 (명령어, 시간 키워드 추가)
+_ENHANCED_STOPWORDS = frozenset(_KEYWORD_MAPPINGS["stopwords"]) | {
+    "표시해줘", "보여줘", "알려줘", "찾아줘", "검색해줘", "조회해줘",
+    "관련", "관련된", "기사", "뉴스", "정보", "내용",
+    "최근", "요즘", "오늘", "어제", "이번주", "이번달", "한달", "일주일", "최신"
+}
+
+
+def _weight_pairs(expansions, factor: float = 1.0) -> Tuple[Tuple[str, float], ...]:
+    return tuple((kw.keyword, kw.weight * factor) for kw in expansions)
+
+
+# 도메인: (트리거, 우선순위 확장, 정렬된 확장, 유사어)
+_DOMAIN_GROUPS = tuple(
+    (
+        tuple(data["triggers"]),
+        _weight_pairs(data["expansions"][:5], 1.2),  # 상위 5개만
+        _weight_pairs(sorted(data["expansions"], key=lambda x: (x.priority, -x.weight))),
+        tuple((base_word, tuple(synonyms)) for base_word, synonyms in data.get("synonyms", {}).items()),
+    )
+    for data in _KEYWORD_MAPPINGS["domain"].values()
+)
+# 산업/회사/시간/지역: (트리거, 확장)
+_INDUSTRY_GROUPS = tuple(
+    (_INDUSTRY_TRIGGERS.get(name, ()), _weight_pairs(keywords))
+    for name, keywords in _KEYWORD_MAPPINGS["industry"].items()
+)
+_COMPANY_GROUPS, _TIME_GROUPS, _REGION_GROUPS = (
+    tuple((tuple(data["triggers"]), _weight_pairs(data["expansions"])) for data in _KEYWORD_MAPPINGS[category].values())
+    for category in ("company", "time", "region")
+)
+
+_ALL_TRIGGERS = frozenset(t for t in (
+    *(t for triggers, _, _, _ in _DOMAIN_GROUPS for t in triggers),
+    *(t.replace(" ", "") for triggers, _, _, _ in _DOMAIN_GROUPS for t in triggers),
+    *(base_word for _, _, _, synonyms in _DOMAIN_GROUPS for base_word, _ in synonyms),
+    *(t for groups in (_INDUSTRY_GROUPS, _COMPANY_GROUPS, _TIME_GROUPS, _REGION_GROUPS)
+      for triggers, _ in groups for t in triggers),
+) if t)
+
+# 모든 트리거를 한 번에 찾는 정규식: 위치마다 가장 긴 트리거를 잡고(lookahead라 겹침 허용),
+# 같은 위치에서 시작하는 더 짧은 트리거는 접두어 테이블로 보충
+_TRIGGER_SCANNER = re.compile(
+    "(?=(" + "|".join(re.escape(t) for t in sorted(_ALL_TRIGGERS, key=len, reverse=True)) + "))"
+)
+_TRIGGER_PREFIXES = {
+    t: frozenset(p for p in _ALL_TRIGGERS if t.startswith(p)) for t in _ALL_TRIGGERS
+}
+
+
+def _scan_triggers(q: str) -> set:
+    """q에 부분 문자열로 등장하는 모든 트리거 집합 (정규식 1회 스캔)"""
+    found = set()
+    for m in _TRIGGER_SCANNER.finditer(q):
+        found |= _TRIGGER_PREFIXES[m.group(1)]
+    return found
+
+
 # @cache_decorator.cached("keyword_extraction", ttl=3600.0)  # 캐싱 비활성화
 def _extract_keywords_for_search(query: str) -> List[str]:
     """개선된 키워드 추출 로직 - 동적 확장, 가중치 기반, 형태소 분석 (컨텍스트 엔지니어링 강화)"""
-    from api.config.keyword_mappings import get_all_keyword_mappings
     from api.utils.text_analyzer import enhance_query_with_morphology, suggest_related_terms
 
     q = query.lower()
@@ -104,12 +202,7 @@ def _extract_keywords_for_search(query: str) -> List[str]:
     # 시간 키워드를 필터로 변환 (ChatService 인스턴스에 저장)
     # 이 함수는 static이므로 return 값으로 시간 필터 정보를 전달
     time_filter_days = None
-    time_keywords_map = {
-        "최근": 30, "요즘": 30, "오늘": 1, "어제": 2, "이번주": 7,
-        "이번달": 30, "한달": 30, "일주일": 7, "최신": 7
-    }
-
-    for time_word, days in time_keywords_map.items():
+    for time_word, days in _TIME_FILTER_WORDS:
         if time_word in q:
             time_filter_days = days
             print(f"[DEBUG] 시간 필터 감지: '{time_word}' → {days}일")
@@ -119,22 +212,27 @@ def _extract_keywords_for_search(query: str) -> List[str]:
     q = q.replace("2차 전지", "2차전지")
     q = q.replace("이차 전지", "이차전지")
 
-    keyword_mappings = get_all_keyword_mappings()
-    
-    # 가중치가 있는 키워드 저장소
-    weighted_keywords = []
+    # 모든 카테고리 트리거를 한 번에 탐지
+    hits = _scan_triggers(q)
+
+    # 키워드 → 가중치 (삽입 순서 유지, 동점은 먼저 들어온 키워드 우선)
+    keyword_weights: Dict[str, float] = {}
 
-    # 0. 원본 쿼리에서 직접 도메인 키워드 우선 추출 (높은 우선순위)
-    priority_keywords = []
-    for domain_name, domain_data in keyword_mappings["domain"].items():
-        for trigger in domain_data["triggers"]:
+    def add_weighted(pairs) -> None:
+        # 중복 키워드는 최대 가중치 사용
+        for keyword, weight in pairs:
+            prev = keyword_weights.get(keyword)
+            if prev is None or weight > prev:
+                keyword_weights[keyword] = weight
+
+    # 0. 원본 쿼리에서 직접 도메인 키워드 우선 추출 (높은 우선순위, 가중치 그대로 기록)
+    for triggers, priority_expansions, _, _ in _DOMAIN_GROUPS:
+        for trigger in triggers:
             # 띄어쓰기가 있는 경우도 처리
-            trigger_variants = [trigger, trigger.replace(" ", "")]
-            if any(variant in q for variant in trigger_variants):
-                priority_keywords.append((trigger, 3.0))  # 최고 가중치
+            if trigger in hits or trigger.replace(" ", "") in hits:
+                keyword_weights[trigger] = 3.0  # 최고 가중치
                 # 해당 도메인의 확장 키워드도 추가
-                for expansion in domain_data["expansions"][:5]:  # 상위 5개만
-                    priority_keywords.append((expansion.keyword, expansion.weight * 1.2))
+                keyword_weights.update(priority_expansions)
                 break
 
     # 1. 형태소 분석을 통한 쿼리 강화
@@ -145,109 +243,40 @@ def _extract_keywords_for_search(query: str) -> List[str]:
     finance_terms = morphology_result["finance_terms"]
     
     # 형태소 분석 결과로 추가 가중치 부여
-    for word in high_importance_words:
-        weighted_keywords.append((word, 2.0))
+    add_weighted((word, 2.0) for word in high_importance_words)
     
     for word in companies:
-        weighted_keywords.append((word, 2.5))
+        add_weighted(((word, 2.5),))
         # 연관 용어 추가
         related = suggest_related_terms(word)
-        for rel_word in related[:3]:  # 상위 3개만
-            weighted_keywords.append((rel_word, 1.8))
-    
-    for word in tech_terms:
-        weighted_keywords.append((word, 2.2))
+        add_weighted((rel_word, 1.8) for rel_word in related[:3])  # 상위 3개만
     
-    for word in finance_terms:
-        weighted_keywords.append((word, 2.3))
+    add_weighted((word, 2.2) for word in tech_terms)
+    add_weighted((word, 2.3) for word in finance_terms)
     
     # 1. 도메인별 키워드 추출
-    for domain_name, domain_data in keyword_mappings["domain"].items():
-        for trigger in domain_data["triggers"]:
-            if trigger in q:
-                # 확장 키워드 추가 (가중치 순으로 정렬)
-                for kw in sorted(domain_data["expansions"], key=lambda x: (x.priority, -x.weight)):
-                    weighted_keywords.append((kw.keyword, kw.weight))
-                
-                # 유사어 추가
-                for base_word, synonyms in domain_data.get("synonyms", {}).items():
-                    if base_word in q:
-                        for syn in synonyms:
-                            weighted_keywords.append((syn, 1.2))  # 유사어는 기본 가중치
-                break
-    
-    # 2. 산업별 키워드 추출 (동적 확장 가능)
-    for industry_name, keywords in keyword_mappings["industry"].items():
-        # 산업별 트리거를 설정에서 가져오거나 기본값 사용
-        industry_triggers = {
-            "technology": ["IT", "소프트웨어", "기술", "AI", "인공지능"],
-            "automotive": ["자동차", "전기차", "배터리", "모빌리티"],
-            "semiconductor": ["반도체", "칩", "파운드리", "메모리"],
-            "defense": ["방산", "국방", "무기", "군수", "방위산업"],
-            "energy": ["에너지", "신재생", "태양광", "풍력"],
-            "nuclear": ["SMR", "원전", "원자력", "소형모듈원자로"],
-            "battery": ["2차전지", "이차전지", "배터리", "양극재", "음극재"],
-            "finance": ["금융", "지주회사", "은행", "증권", "보험"],
-            "bio": ["바이오", "제약", "헬스케어", "의료"]
-        }.get(industry_name, [])
-        
-        if any(trigger in q for trigger in industry_triggers):
-            for kw in keywords:
-                weighted_keywords.append((kw.keyword, kw.weight))
-    
-    # 3. 회사별 키워드 추출
-    for company_name, company_data in keyword_mappings["company"].items():
-        for trigger in company_data["triggers"]:
-            if trigger in q:
-                for kw in company_data["expansions"]:
-                    weighted_keywords.append((kw.keyword, kw.weight))
-                break
+    for triggers, _, expansions, synonyms in _DOMAIN_GROUPS:
+        if any(trigger in hits for trigger in triggers):
+            # 확장 키워드 추가 (가중치 순으로 정렬)
+            add_weighted(expansions)
+
+            # 유사어 추가
+            for base_word, syns in synonyms:
+                if base_word in hits:
+                    add_weighted((syn, 1.2) for syn in syns)  # 유사어는 기본 가중치
+
+    # 2~5. 산업별 / 회사별 / 시간 관련 / 지역별 키워드 추출
+    for groups in (_INDUSTRY_GROUPS, _COMPANY_GROUPS, _TIME_GROUPS, _REGION_GROUPS):
+        for triggers, expansions in groups:
+            if any(trigger in hits for trigger in triggers):
+                add_weighted(expansions)
     
-    # 4. 시간 관련 키워드 추출
-    for time_type, time_data in keyword_mappings["time"].items():
-        for trigger in time_data["triggers"]:
-            if trigger in q:
-                for kw in time_data["expansions"]:
-                    weighted_keywords.append((kw.keyword, kw.weight))
-                break
-    
-    # 5. 지역별 키워드 추출
-    for region_name, region_data in keyword_mappings["region"].items():
-        for trigger in region_data["triggers"]:
-            if trigger in q:
-                for kw in region_data["expansions"]:
-                    weighted_keywords.append((kw.keyword, kw.weight))
-                break
-    
-    # 6. 우선순위 키워드 먼저 추가 후 일반 키워드 처리
-    keyword_weights = {}
-
-    # 우선순위 키워드 먼저 추가 (최고 가중치)
-    for keyword, weight in priority_keywords:
-        keyword_weights[keyword] = weight
-
-    # 일반 키워드 추가
-    for keyword, weight in weighted_keywords:
-        if keyword not in keyword_weights:
-            keyword_weights[keyword] = weight
-        else:
-            # 중복 키워드는 최대 가중치 사용
-            keyword_weights[keyword] = max(keyword_weights[keyword], weight)
-
-    # 가중치 순으로 정렬
-    sorted_keywords = sorted(keyword_weights.items(), key=lambda x: -x[1])
+    # 6. 가중치 상위 15개만 선택 (nlargest는 동점 시 삽입 순서를 유지)
+    sorted_keywords = heapq.nlargest(15, keyword_weights.items(), key=itemgetter(1))
     
     # 7. 키워드가 부족하면 원본 질문에서 추가 추출
     if len(sorted_keywords) < 5:
-        stopwords = keyword_mappings["stopwords"]
-
-        # 개선된 불용어 리스트 (명령어, 시간 키워드 추가)
-        enhanced_stopwords = stopwords.copy()
-        enhanced_stopwords.update({
-            "표시해줘", "보여줘", "알려줘", "찾아줘", "검색해줘", "조회해줘",
-            "관련", "관련된", "기사", "뉴스", "정보", "내용",
-            "최근", "요즘", "오늘", "어제", "이번주", "이번달", "한달", "일주일", "최신"
-        })
+        enhanced_stopwords = _ENHANCED_STOPWORDS
 
         # 형탄소 분석 결과를 활용한 추가 키워드
         key_phrases = morphology_result["key_phrases"]
@@ -276,56 +305,100 @@ def _extract_keywords_for_search(query: str) -> List[str]:
     return final_keywords
 
 
+def _is_cacheable_result(result: Tuple[Any, float, Optional[str]]) -> bool:
+    """(데이터, 지연시간, 오류) 결과 중 오류 없이 데이터가 있는 것만 공유 캐시에 저장"""
+    return bool(result[0]) and result[2] is None
+
+
+def _is_cacheable_msearch(result: Tuple[List[Optional[List[Any]]], float, Optional[str]]) -> bool:
+    """멀티 검색 결과는 실패한 개별 검색 없이 결과가 하나라도 있을 때만 저장"""
+    return _is_cacheable_result(result) and all(hits is not None for hits in result[0]) and any(result[0])
+
+
+@lru_cache(maxsize=4096)
 def _detect_symbol(text: str) -> Optional[str]:
-    m = re.search(r"\b\d{6}\.(KS|KQ)\b", text)
+    m = _SYMBOL_RE.search(text)
     if m:
         return m.group(0)
     return None
 
 
+# 뉴스 검색 본문의 고정 부분 (요청마다 다시 만들지 않음, 튜플이라 공유해도 변경 불가)
+_NEWS_MULTI_MATCH_FIELDS = ("metadata.title^4", "metadata.content^2", "text^3")
+_NEWS_QUERY_STRING_FIELDS = ("metadata.title^3", "metadata.content", "text")
+_NEWS_SORT = ("_score",)
+_NEWS_SOURCE = {"includes": (
+    "metadata.title", "metadata.url", "metadata.media", "metadata.portal",
+    "metadata.date", "metadata.content", "text", "vector_field"
+)}
+
+
+def _news_multi_match(keywords: str) -> Dict[str, Any]:
+    return {
+        "multi_match": {
+            "query": keywords,
+            "fields": _NEWS_MULTI_MATCH_FIELDS,
+            "type": "best_fields",
+            "operator": "or"
+        }
+    }
+
+
+def _news_query_string(keywords: str) -> Dict[str, Any]:
+    return {
+        "query_string": {
+            "query": keywords,
+            "fields": _NEWS_QUERY_STRING_FIELDS,
+            "default_operator": "OR"
+        }
+    }
+
+
+def _news_exclude_clause() -> Optional[Dict[str, Any]]:
+    """수집 시 제외 태그가 설정돼 있으면 해당 문서를 거르는 term 절"""
+    field = settings.news_exclude_tag_field
+    if not field:
+        return None
+    # must_not으로 두어 태그 필드가 없는 과거 문서는 그대로 검색됨
+    return {"term": {field: True}}
+
+
+_EMPTY: Dict[str, Any] = {}
+
+# 소스 필드 우선순위: (0=_source, 1=metadata, 키) 순서대로 처음 값이 있는 필드 사용
+_TITLE_FIELDS = ((0, "title"), (1, "title"), (0, "headline"))
+_URL_FIELDS = ((0, "url"), (1, "url"), (0, "link"), (0, "article_url"))
+_DATE_FIELDS = (
+    (0, "created_datetime"), (0, "created_date"), (0, "published_at"), (0, "publish_date"),
+    (1, "created_datetime"), (1, "created_date"), (1, "published_at")
+)
+_MEDIA_FIELDS = ((0, "media"), (1, "media"), (0, "source"))
+
+
+def _first(docs: Tuple[Dict[str, Any], Dict[str, Any]], fields: Tuple[Tuple[int, str], ...], default: Any = None) -> Any:
+    value = None
+    for i, key in fields:
+        value = docs[i].get(key)
+        if value:
+            return value
+    # 기본값이 없으면 기존 `or` 체인처럼 마지막 필드 값을 그대로 반환
+    return value if default is None else default
+
+
 def _format_sources(hits: List[Dict[str, Any]], limit: int = 5) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
+    append = out.append
     for h in hits[:limit]:
-        src = h.get("_source", {}) or {}
-        meta = src.get("metadata") or {}
-        
-        # 제목 추출 (여러 필드에서 시도)
-        title = (
-            src.get("title") or 
-            meta.get("title") or 
-            src.get("headline") or 
-            "(no title)"
-        )
-        
-        # URL 추출
-        url = (
-            src.get("url") or 
-            meta.get("url") or 
-            src.get("link") or 
-            src.get("article_url")
-        )
-        
-        # 날짜 추출 (여러 필드에서 시도)
-        date = (
-            src.get("created_datetime") or
-            src.get("created_date") or
-            src.get("published_at") or
-            src.get("publish_date") or
-            meta.get("created_datetime") or
-            meta.get("created_date") or
-            meta.get("published_at")
-        )
-        
-        # 미디어 정보 추출
-        media = src.get("media") or meta.get("media") or src.get("source") or "Unknown"
-        
-        out.append(
+        src = h.get("_source") or _EMPTY
+        docs = (src, src.get("metadata") or _EMPTY)
+
+        append(
             {
                 "id": h.get("_id"),
-                "title": title,
-                "url": url,
-                "date": date,
-                "media": media,
+                "title": _first(docs, _TITLE_FIELDS, "(no title)"),
+                "url": _first(docs, _URL_FIELDS),
+                "date": _first(docs, _DATE_FIELDS),
+                "media": _first(docs, _MEDIA_FIELDS, "Unknown"),
                 "score": h.get("_score"),
                 "index": h.get("_index"),
             }
@@ -954,39 +1027,24 @@ class ChatService:
         best_result = None
         best_quality = 0.0
         
-        # 3. 전략별 순차 검색
-        for strategy in search_strategies[:4]:  # 상위 4개 전략만 시도
-            try:
-                print(f"[INFO] 검색 전략 시도: {strategy.name} - {strategy.query}")
-                
-                hits, ms, err = await self._search_news(strategy.query, size)
-                
-                if hits:
-                    # 품질 평가
-                    quality = advanced_search_engine.evaluate_search_quality(
-                        hits, original_query, strategy
-                    )
-                    
-                    print(f"[INFO] 전략 {strategy.name} 품질: {quality:.2f}, 결과: {len(hits)}건")
-                    
-                    if quality > best_quality:
-                        best_quality = quality
-                        best_result = SearchResult(
-                            hits=hits,
-                            query_used=strategy.query,
-                            strategy=strategy.name,
-                            confidence=quality,
-                            latency_ms=ms,
-                            total_found=len(hits)
-                        )
-                    
-                    # 품질이 충분히 높으면 조기 종료
-                    if quality > 0.8:
-                        break
-                        
-            except Exception as e:
-                print(f"[WARNING] 검색 전략 {strategy.name} 실패: {e}")
+        # 3. 상위 4개 전략을 _msearch 한 번의 왕복으로 실행한 뒤 품질 평가
+        strategies = search_strategies[:4]
+        queries = tuple(strategy.query for strategy in strategies)
+        strategy_hits, ms, err = await self._msearch_news(queries, size) if queries else ([], 0.0, None)
+        if err:
+            # _msearch를 쓸 수 없으면 전략별 검색을 동시에 보내고 충분한 결과가 나오면 중단
+            print(f"[WARNING] 멀티 검색 실패, 전략별 동시 검색으로 전환: {err}")
+            best_result = await self._search_strategies_concurrently(original_query, strategies, size)
+            strategy_hits = []
+
+        for strategy, hits in zip(strategies, strategy_hits):
+            if not hits:
                 continue
+
+            scored = self._score_strategy(original_query, strategy, hits, ms)
+            if scored.confidence > best_quality:
+                best_quality = scored.confidence
+                best_result = scored
         
         # 4. 결과 반환
         total_time = (time.perf_counter() - t0) * 1000.0
@@ -1010,6 +1068,91 @@ class ChatService:
             
             return fallback_result, total_time, err
 
+    @with_error_handling("opensearch", fallback_value=([], 0.0, "OpenSearch 서비스 사용 불가"))
+    @with_retry(max_retries=2, exceptions=(Exception,))
+    @redis_cached("news_msearch", ttl=180, condition=_is_cacheable_msearch)
+    async def _msearch_news(
+        self,
+        queries: Tuple[str, ...],
+        size: int = 5
+    ) -> Tuple[List[Optional[List[Dict[str, Any]]]], float, Optional[str]]:
+        """여러 검색어를 _msearch 한 번으로 실행해 검색어별 중복 제거 결과 반환
+
+        결과 목록은 queries와 같은 순서이며, 개별 검색이 실패한 자리는 None.
+        요청 자체의 실패는 예외로 전파되어 재시도/오류 처리 데코레이터가 처리한다.
+        """
+        t0 = time.perf_counter()
+        bodies = [self._build_news_body(query, size) for query in queries]
+        result = await self.os.msearch(settings.news_embedding_index, bodies)
+
+        strategy_hits: List[Optional[List[Dict[str, Any]]]] = []
+        for query, response in zip(queries, result.get("responses", [])):
+            if response.get("error"):
+                print(f"[WARNING] 멀티 검색 항목 실패 ({query}): {response['error']}")
+                strategy_hits.append(None)
+                continue
+            strategy_hits.append(self._dedupe_news_hits(response.get("hits", {}).get("hits", []), size))
+
+        return strategy_hits, (time.perf_counter() - t0) * 1000.0, None
+
+    @staticmethod
+    def _score_strategy(original_query: str, strategy, hits: List[Dict[str, Any]], latency_ms: float) -> SearchResult:
+        """전략 검색 결과의 품질을 평가해 SearchResult로 변환"""
+        quality = advanced_search_engine.evaluate_search_quality(
+            hits, original_query, strategy
+        )
+        print(f"[INFO] 전략 {strategy.name} 품질: {quality:.2f}, 결과: {len(hits)}건")
+        return SearchResult(
+            hits=hits,
+            query_used=strategy.query,
+            strategy=strategy.name,
+            confidence=quality,
+            latency_ms=latency_ms,
+            total_found=len(hits)
+        )
+
+    async def _search_strategies_concurrently(
+        self,
+        original_query: str,
+        strategies: List[Any],
+        size: int
+    ) -> Optional[SearchResult]:
+        """전략별 검색을 동시에 실행하고 품질 0.8 초과 결과가 나오면 나머지는 취소"""
+        semaphore = asyncio.Semaphore(settings.opensearch_max_concurrency)
+
+        async def run(strategy):
+            async with semaphore:
+                return strategy, await self._search_news(strategy.query, size)
+
+        tasks = [asyncio.create_task(run(strategy), name=strategy.name) for strategy in strategies]
+        best_result = None
+        best_quality = 0.0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    strategy, (hits, ms, err) = await next_done
+                except Exception as e:
+                    print(f"[WARNING] 검색 전략 실패: {e}")
+                    continue
+
+                if not hits:
+                    continue
+
+                scored = self._score_strategy(original_query, strategy, hits, ms)
+                if scored.confidence > best_quality:
+                    best_quality = scored.confidence
+                    best_result = scored
+
+                # 품질이 충분히 높으면 조기 종료
+                if best_quality > 0.8:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return best_result
+
     async def _extract_core_keywords(self, query: str) -> List[str]:
         """LLM 기반 핵심 키워드 추출 (안전한 타입 처리)"""
         try:
@@ -1400,8 +1543,11 @@ class ChatService:
 
         # 시간 범위 필터 (설정 가능) - 날짜 필드가 없으므로 비활성화
 
-        # 품질 필터 (스팸 제거)
-        if hasattr(settings, 'exclude_spam_keywords'):
+        # 품질 필터 (스팸 제거): 수집 시 태그가 있으면 term 하나로 제외
+        exclude_clause = _news_exclude_clause()
+        if exclude_clause:
+            filters['must_not'].append(exclude_clause)
+        elif hasattr(settings, 'exclude_spam_keywords'):
             spam_keywords = settings.exclude_spam_keywords
             if spam_keywords:
                 filters['must_not'].append({
@@ -1529,100 +1675,91 @@ class ChatService:
         """온톨로지 통합된 하이브리드 검색 (기존 인터페이스 유지)"""
         return await self._search_news_with_ontology(query, size)
 
-    @with_error_handling("opensearch", fallback_value=([], 0.0, "OpenSearch 서비스 사용 불가"))
-    @with_retry(max_retries=2, exceptions=(Exception,))
-    # @cache_decorator.cached("news_search", ttl=180.0)  # 캐싱 비활성화
-    async def _search_news(self, query: str, size: int = 5) -> Tuple[List[Dict[str, Any]], float, Optional[str]]:
-        t0 = time.perf_counter()
-        err: Optional[str] = None
-        try:
-            os_index = settings.news_embedding_index
+    def _build_news_body(self, query: str, size: int = 5) -> Dict[str, Any]:
+        """뉴스 검색 본문 구성 (_search / _msearch 공용, size 포함)"""
+        # 시간 필터 정보 추출
+        time_filter_days = self._extract_time_filter_from_keywords(query)
+        search_keywords = self._clean_keywords_for_search(query)
 
-            # 시간 필터 정보 추출
-            time_filter_days = self._extract_time_filter_from_keywords(query)
-            search_keywords = self._clean_keywords_for_search(query)
-
-            print(f"[DEBUG] 정제된 검색 키워드: '{search_keywords}'")
-            if time_filter_days:
-                print(f"[DEBUG] 시간 필터 적용: 최근 {time_filter_days}일")
-
-            # 개선된 검색 쿼리 구성
-            bool_query = {
-                "should": [
-                    {
-                        "multi_match": {
-                            "query": search_keywords,
-                            "fields": ["metadata.title^4", "metadata.content^2", "text^3"],
-                            "type": "best_fields",
-                            "operator": "or"
-                        }
-                    },
-                    {
-                        "query_string": {
-                            "query": search_keywords,
-                            "fields": ["metadata.title^3", "metadata.content", "text"],
-                            "default_operator": "OR"
-                        }
-                    }
-                ],
-                "minimum_should_match": 1,
-            }
+        print(f"[DEBUG] 정제된 검색 키워드: '{search_keywords}'")
+        if time_filter_days:
+            print(f"[DEBUG] 시간 필터 적용: 최근 {time_filter_days}일")
 
-            # 시간 필터 추가 (최근 N일)
-            if time_filter_days:
-                bool_query["filter"] = [
-                    {
-                        "range": {
-                            "created_datetime": {
-                                "gte": f"now-{time_filter_days}d/d"
-                            }
+        # 개선된 검색 쿼리 구성 (고정 부분은 모듈 상수 재사용)
+        bool_query = {
+            "should": [_news_multi_match(search_keywords), _news_query_string(search_keywords)],
+            "minimum_should_match": 1,
+        }
+
+        # 수집 시 제외 대상으로 태그된 문서 제외 (doc values 기반, 필터 캐시 대상)
+        exclude_clause = _news_exclude_clause()
+        if exclude_clause:
+            bool_query["must_not"] = [exclude_clause]
+
+        # 시간 필터 추가 (최근 N일)
+        if time_filter_days:
+            bool_query["filter"] = [
+                {
+                    "range": {
+                        "created_datetime": {
+                            "gte": f"now-{time_filter_days}d/d"
                         }
                     }
-                ]
-
-            body = {
-                "query": {
-                    "bool": bool_query
-                },
-                "sort": [],
-                "_source": {"includes": ["metadata.title", "metadata.url", "metadata.media", "metadata.portal", "metadata.date", "metadata.content", "text", "vector_field"]}
-            }
+                }
+            ]
 
+        return {
+            "query": {
+                "bool": bool_query
+            },
             # 정렬 우선순위: 매핑 오류 방지를 위해 _score만 사용
-            body["sort"] = ["_score"]
+            "sort": _NEWS_SORT,
+            "_source": _NEWS_SOURCE,
             # A급 달성을 위해 더 많은 결과를 가져와 중복 제거 후 선별
-            fetch_size = size * 3  # 3배 더 많이 가져오기
+            "size": size * 3,  # 3배 더 많이 가져오기
+        }
+
+    @staticmethod
+    def _dedupe_news_hits(hits: List[Dict[str, Any]], size: int) -> List[Dict[str, Any]]:
+        """제목 기준 중복 제거 후 요청 크기만큼 포맷해 반환"""
+        # A급 달성을 위한 중복 제거 (제목 기준)
+        seen_titles = set()
+        unique_hits = []
+        for hit in hits:
+            source = hit.get("_source", {})
+            title = source.get("title") or source.get("metadata", {}).get("title", "")
+            title_clean = title.strip().lower()
+
+            if title_clean and title_clean not in seen_titles:
+                seen_titles.add(title_clean)
+                unique_hits.append(hit)
+
+        print(f"[DEBUG] 중복 제거: {len(hits)}건 → {len(unique_hits)}건")
+
+        # 요청된 크기만큼 선별하여 반환
+        return _format_sources(unique_hits[:size])
+
+    @with_error_handling("opensearch", fallback_value=([], 0.0, "OpenSearch 서비스 사용 불가"))
+    @with_retry(max_retries=2, exceptions=(Exception,))
+    @redis_cached("news_search", ttl=180, condition=_is_cacheable_result)
+    async def _search_news(self, query: str, size: int = 5) -> Tuple[List[Dict[str, Any]], float, Optional[str]]:
+        t0 = time.perf_counter()
+        err: Optional[str] = None
+        try:
+            os_index = settings.news_embedding_index
+            body = self._build_news_body(query, size)
             result = await self.os.search(
                 index=os_index,
                 query=body,
-                size=fetch_size
+                size=body["size"]
             )
             
             if result and result.get("hits"):
-                hits = result["hits"].get("hits", [])
-
-                # A급 달성을 위한 중복 제거 (제목 기준)
-                seen_titles = set()
-                unique_hits = []
-                for hit in hits:
-                    source = hit.get("_source", {})
-                    title = source.get("title") or source.get("metadata", {}).get("title", "")
-                    title_clean = title.strip().lower()
-
-                    if title_clean and title_clean not in seen_titles:
-                        seen_titles.add(title_clean)
-                        unique_hits.append(hit)
-
-                print(f"[DEBUG] 중복 제거: {len(hits)}건 → {len(unique_hits)}건")
-
-                # 요청된 크기만큼 선별하여 반환
-                final_hits = unique_hits[:size]
-                out = _format_sources(final_hits)
+                out = self._dedupe_news_hits(result["hits"].get("hits", []), size)
                 print(f"[DEBUG] 최종 반환: {len(out)}건")
                 return out, (time.perf_counter() - t0) * 1000.0, None
             else:
-                return [], (time.perf_counter() - t0) * 1000.0, "No results found"
-                
+                return [], (time.perf_counter() - t0) * 1000.0, "No results found"                
         except Exception as e:
             print(f"[ERROR] [/chat] OpenSearch error: {e}")
             err = str(e)
@@ -1630,7 +1767,7 @@ class ChatService:
 
     @with_error_handling("neo4j", fallback_value=([], 0.0, "Neo4j 서비스 사용 불가"))
     @with_retry(max_retries=2, exceptions=(Exception,))
-    # @cache_context(ttl=600)  # 10분 캐싱 - DISABLED (Neo4j 쿼리 성능 향상)
+    @redis_cached("graph_query", ttl=600, condition=_is_cacheable_result)
     async def _query_graph(self, query: str, limit: int = 10):
         t0 = time.perf_counter()
         try:
@@ -1655,7 +1792,13 @@ class ChatService:
             print(f"  Params: {dict(params)}")
             print(f"  Cypher 길이: {len(cypher)} chars")
 
-            rows = await self.neo.query(cypher, params)
+            # limit개만 받고 중단 (남은 레코드는 드라이버가 버퍼링하지 않음)
+            rows = []
+            async with aclosing(self.neo.query_stream(cypher, params, fetch_size=limit)) as stream:
+                async for row in stream:
+                    rows.append(row)
+                    if len(rows) >= limit:
+                        break
 
             print(f"[DEBUG] Neo4j 결과: {len(rows)}개 행")
             if rows:
@@ -1673,7 +1816,7 @@ class ChatService:
 
     @with_error_handling("stock_api", fallback_value=(None, 0.0, "주식 API 서비스 사용 불가"))
     @with_retry(max_retries=2, exceptions=(Exception,))
-    # @cache_decorator.cached("stock_price", ttl=60.0)  # 캐싱 비활성화
+    @redis_cached("stock_price", ttl=60, condition=_is_cacheable_result)
     async def _get_stock(self, symbol: Optional[str]) -> Tuple[Optional[Dict[str, Any]], float, Optional[str]]:
         t0 = time.perf_counter()
         if not symbol:
@@ -1907,14 +2050,34 @@ class ChatService:
             print(f"[INFO] 추출된 키워드: {keywords}")
             print(f"[INFO] 검색 쿼리: {search_query}")
 
-            # search_parallel 사용하여 Neo4j + OpenSearch 병렬 검색
-            print(f"[Fallback] search_parallel 호출 (Neo4j + OpenSearch 병렬 검색)")
-            try:
-                services_attempted.extend(["opensearch", "neo4j"])
-                news_hits, graph_rows, _, search_time, graph_time, news_time = await self.search_parallel(
-                    search_query,
-                    size=25
-                )
+            # search_parallel(Neo4j + OpenSearch)과 주가 조회를 함께 실행
+            print(f"[Fallback] search_parallel + 주가 조회 병렬 호출")
+            services_attempted.extend(["opensearch", "neo4j", "stock_api"])
+            search_out, stock_out = await asyncio.gather(
+                self.search_parallel(search_query, size=25),
+                self._get_stock(symbol),
+                return_exceptions=True
+            )
+
+            if isinstance(search_out, BaseException):
+                print(f"[Fallback] search_parallel 실패: {search_out}")
+                news_res = {
+                    "hits": [],
+                    "latency_ms": 0.0,
+                    "error": f"검색 실패: {str(search_out)}",
+                    "search_strategy": "fallback",
+                    "search_confidence": 0.1,
+                    "query_used": search_query
+                }
+                graph_res = {
+                    "rows": [],
+                    "latency_ms": 0.0,
+                    "error": f"검색 실패: {str(search_out)}"
+                }
+                error_handler.record_error("opensearch", search_out)
+                error_handler.record_error("neo4j", search_out)
+            else:
+                news_hits, graph_rows, _, search_time, graph_time, news_time = search_out
 
                 print(f"[DEBUG] Fallback 수신: graph_rows={len(graph_rows)}개, news_hits={len(news_hits)}개")
 
@@ -1936,36 +2099,16 @@ class ChatService:
                 error_handler.record_success("opensearch")
                 error_handler.record_success("neo4j")
 
-            except Exception as e:
-                print(f"[Fallback] search_parallel 실패: {e}")
-                news_res = {
-                    "hits": [],
-                    "latency_ms": 0.0,
-                    "error": f"검색 실패: {str(e)}",
-                    "search_strategy": "fallback",
-                    "search_confidence": 0.1,
-                    "query_used": search_query
-                }
-                graph_res = {
-                    "rows": [],
-                    "latency_ms": 0.0,
-                    "error": f"검색 실패: {str(e)}"
-                }
-                error_handler.record_error("opensearch", e)
-                error_handler.record_error("neo4j", e)
-
-            # 주가 조회는 별도 처리
-            stock_res: Dict[str, Any] = {}
-            try:
-                services_attempted.append("stock_api")
-                price, ms, err = await self._get_stock(symbol)
-                stock_res.update({"price": price, "latency_ms": ms, "error": err})
+            # 주가 조회 결과
+            if isinstance(stock_out, BaseException):
+                error_handler.record_error("stock_api", stock_out)
+                stock_res = {"price": None, "latency_ms": 0.0, "error": f"주가 조회 실패: {str(stock_out)}"}
+            else:
+                price, ms, err = stock_out
+                stock_res = {"price": price, "latency_ms": ms, "error": err}
 
                 if not err:
                     error_handler.record_success("stock_api")
-            except Exception as e:
-                error_handler.record_error("stock_api", e)
-                stock_res.update({"price": None, "latency_ms": 0.0, "error": f"주가 조회 실패: {str(e)}"})
 
             # 검색 메타데이터 준비
             search_meta = {
@@ -0,0 +1,165 @@
+"""
+Redis 기반 공유 cache-aside 레이어
+여러 워커/파드가 검색·그래프·시세 조회 결과를 함께 사용하도록 Redis에 저장
+"""
+import hashlib
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+import redis.asyncio as redis
+
+from api.config import settings
+from api.logging import setup_logging
+logger = setup_logging()
+
+# 연결 실패 후 Redis를 다시 시도하기까지 대기 시간 (요청마다 연결 지연을 내지 않도록)
+_RETRY_AFTER_SECONDS = 30.0
+# Redis가 멈춰도 요청이 막히지 않고 곧바로 백엔드로 넘어가도록 소켓 타임아웃 지정
+_SOCKET_CONNECT_TIMEOUT_SECONDS = 0.5
+_SOCKET_TIMEOUT_SECONDS = 0.5
+# 키 접두사: 앱 이름 + 캐시 스키마 버전.
+# 캐시되는 반환값 형태(_search_news, _msearch_news, _query_graph, _get_stock 등)가
+# 바뀌면 버전을 올려 롤링 배포 중 구/신 워커가 서로의 값을 읽지 않도록 함
+_KEY_PREFIX = "ontology_chat"
+CACHE_SCHEMA_VERSION = 1
+
+
+class RedisCache:
+    """연결 풀을 공유하는 Redis cache-aside 클라이언트"""
+
+    def __init__(self, redis_url: str, max_connections: int = 32):
+        self.redis_url = redis_url
+        self.max_connections = max_connections
+        self._client: Optional[redis.Redis] = None
+        self._unavailable_until = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _get_client(self) -> Optional[redis.Redis]:
+        """연결 풀 기반 클라이언트 (최근 실패 후 대기 중이면 None)"""
+        if time.monotonic() < self._unavailable_until:
+            return None
+        if self._client is None:
+            pool = redis.ConnectionPool.from_url(
+                self.redis_url,
+                max_connections=self.max_connections,
+                socket_connect_timeout=_SOCKET_CONNECT_TIMEOUT_SECONDS,
+                socket_timeout=_SOCKET_TIMEOUT_SECONDS,
+            )
+            self._client = redis.Redis(connection_pool=pool)
+        return self._client
+
+    def _mark_failed(self, e: Exception) -> None:
+        """오류 기록 후 잠시 Redis 사용 중단"""
+        self.errors += 1
+        self._unavailable_until = time.monotonic() + _RETRY_AFTER_SECONDS
+        logger.warning("Redis 캐시 사용 불가 ({}초 후 재시도): {}", _RETRY_AFTER_SECONDS, e)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (미스·오류·역직렬화 실패 시 None)"""
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            data = await client.get(key)
+        except Exception as e:
+            self._mark_failed(e)
+            return None
+        if data is None:
+            self.misses += 1
+            return None
+        try:
+            value = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            # 손상·구형·외부 값은 미스로 처리하고, nx 저장이 막히지 않도록 삭제
+            self.misses += 1
+            self.errors += 1
+            logger.debug("Redis 캐시 값 역직렬화 실패, 미스로 처리 {}: {}", key, e)
+            try:
+                await client.delete(key)
+            except Exception as delete_error:
+                self._mark_failed(delete_error)
+            return None
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> bool:
+        """캐시 저장 (이미 있으면 덮어쓰지 않음)"""
+        client = self._get_client()
+        if client is None:
+            return False
+        try:
+            payload = orjson.dumps(value)
+        except TypeError as e:
+            logger.debug("Redis 캐시 직렬화 불가, 저장 생략 {}: {}", key, e)
+            return False
+        try:
+            await client.set(key, payload, ex=ttl, nx=True)
+            return True
+        except Exception as e:
+            self._mark_failed(e)
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """히트/미스 통계"""
+        total = self.hits + self.misses
+        return {
+            "enabled": settings.search_cache_enabled,
+            "available": time.monotonic() >= self._unavailable_until,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+        }
+
+
+def _normalize(value: Any) -> Any:
+    """문자열 인자는 공백을 정규화해 같은 질의가 같은 키가 되도록 함"""
+    return " ".join(value.split()) if isinstance(value, str) else value
+
+
+def redis_cached(
+    namespace: str,
+    ttl: int,
+    condition: Optional[Callable[[Any], bool]] = None
+):
+    """
+    메서드 결과를 Redis에 cache-aside로 저장하는 데코레이터
+
+    키는 앱 접두사·스키마 버전·namespace와 (self를 제외한) 인자의 blake2b 해시로 구성.
+    condition이 주어지면 참인 결과만 저장하고, 결과는 orjson으로 직렬화되므로
+    튜플은 조회 시 리스트로 돌아옴.
+    """
+    key_prefix = f"{_KEY_PREFIX}:v{CACHE_SCHEMA_VERSION}:{namespace}:"
+
+    def decorator(func: Callable):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if not settings.search_cache_enabled:
+                return await func(self, *args, **kwargs)
+
+            key_data = repr((
+                tuple(_normalize(a) for a in args),
+                sorted((k, _normalize(v)) for k, v in kwargs.items())
+            ))
+            key = key_prefix + hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+
+            cached = await redis_cache.get(key)
+            if cached is not None:
+                return cached
+
+            result = await func(self, *args, **kwargs)
+            if condition is None or condition(result):
+                await redis_cache.set(key, result, ttl)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# 전역 인스턴스
+redis_cache = RedisCache(settings.redis_url)
@@ -32,6 +32,8 @@ from .graceful_degradation import (
     force_degrade_service
 )
 
+from .error_responses import wrap_errors
+
 __all__ = [
     # Circuit Breaker
     "CircuitBreaker",
@@ -60,5 +62,8 @@ __all__ = [
     "degradation_manager",
     "get_system_health",
     "recover_service",
-    "force_degrade_service"
+    "force_degrade_service",
+
+    # Error Responses
+    "wrap_errors"
 ]
\ No newline at end of file
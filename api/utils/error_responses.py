@@ -0,0 +1,36 @@
+"""Uniform error handling for API route handlers."""
+
+import logging
+from functools import wraps
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+
+logger = logging.getLogger(__name__)
+
+
+def wrap_errors(
+    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+    detail: Any = "Internal server error"
+) -> Callable:
+    """
+    Decorator that turns unexpected handler errors into a static HTTPException.
+
+    The exception is logged with its traceback under the handler name, and
+    clients only receive ``detail``, so internals are never echoed back.
+    HTTPExceptions raised by the handler pass through unchanged.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception:
+                logger.exception("Handler %s failed", func.__name__)
+                raise HTTPException(status_code=status_code, detail=detail)
+
+        return wrapper
+
+    return decorator
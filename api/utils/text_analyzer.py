@@ -46,6 +46,41 @@ HIGH_IMPORTANCE_NOUNS = {
     "기업": 2.5, "회사": 2.3, "스타트업": 2.3, "연구개발": 2.3
 }
 
+# 조사 패턴 (앞에서부터 순서대로 시도)
+PARTICLE_SUFFIXES = (
+    "에서", "에게", "한테", "로부터", "으로", "로",
+    "은", "는", "이", "가", "을", "를", "의",
+    "와", "과", "도", "만", "까지", "부터"
+)
+
+_NUM_RE = re.compile(r'^\\d+')
+_ENG_RE = re.compile(r'^[a-zA-Z]+$')
+
+# 품사 추정 패턴
+COMPANY_PATTERNS = ('전자', '시스템', '그룹', '홍딩스', '코퍼레이션', '비즈니스')
+TECH_PATTERNS = ('시스템', '기술', '장비', '솔루션', '플랫폼')
+FINANCE_PATTERNS = ('투자', '수익', '매출', '실적', '주가', '시장')
+
+# 품사별 가중치
+POS_WEIGHTS = {
+    'COMPANY': 2.5,
+    'TECH': 2.0,
+    'FINANCE': 2.2,
+    'NUM': 1.5,
+    'ENG': 1.8,
+    'NOUN': 1.0
+}
+
+# 도메인별 연관어 사전 (범용적)
+RELATED_TERMS = {
+    "수출": ["해외", "국제", "무역", "글로벌", "해외진출"],
+    "투자": ["주식", "종목", "증권", "시장", "포트폴리오"],
+    "기술": ["혁신", "연구개발", "R&D", "디지털", "인공지능"],
+    "산업": ["제조", "생산", "바이오", "IT", "에너지"],
+    "성장": ["전망", "기대", "잠재력", "발전", "확장"],
+    "제품": ["서비스", "솔루션", "플랫폼", "시스템", "애플리케이션"]
+}
+
 def simple_korean_tokenize(text: str) -> List[Token]:
     """간단한 한국어 토큰화"""
     text = text.lower().strip()
@@ -72,43 +107,34 @@ def simple_korean_tokenize(text: str) -> List[Token]:
 
 def _remove_particles(word: str) -> str:
     """조사 제거"""
-    # 일반적인 조사 패턴들
-    particle_patterns = [
-        r'에서$', r'에게$', r'한테$', r'로부터$', r'으로$', r'로$',
-        r'은$', r'는$', r'이$', r'가$', r'을$', r'를$', r'의$',
-        r'와$', r'과$', r'도$', r'만$', r'까지$', r'부터$'
-    ]
-    
-    for pattern in particle_patterns:
-        result = re.sub(pattern, '', word)
-        if result != word and len(result) >= 2:
-            return result
+    for suffix in PARTICLE_SUFFIXES:
+        if word.endswith(suffix):
+            result = word[:-len(suffix)]
+            if len(result) >= 2:
+                return result
     
     return word
 
 def _estimate_pos(word: str) -> str:
     """간단한 품사 추정"""
     # 숫자 패턴
-    if re.match(r'^\\d+', word):
+    if _NUM_RE.match(word):
         return 'NUM'
     
     # 영어 패턴
-    if re.match(r'^[a-zA-Z]+$', word):
+    if _ENG_RE.match(word):
         return 'ENG'
     
     # 회사명 패턴 (일반적 패턴)
-    company_patterns = ['전자', '시스템', '그룹', '홍딩스', '코퍼레이션', '비즈니스']
-    if any(pattern in word for pattern in company_patterns):
+    if any(pattern in word for pattern in COMPANY_PATTERNS):
         return 'COMPANY'
     
     # 기술/산업 용어
-    tech_patterns = ['시스템', '기술', '장비', '솔루션', '플랫폼']
-    if any(pattern in word for pattern in tech_patterns):
+    if any(pattern in word for pattern in TECH_PATTERNS):
         return 'TECH'
     
     # 경제/금융 용어
-    finance_patterns = ['투자', '수익', '매출', '실적', '주가', '시장']
-    if any(pattern in word for pattern in finance_patterns):
+    if any(pattern in word for pattern in FINANCE_PATTERNS):
         return 'FINANCE'
     
     # 기본적으로 명사로 분류
@@ -123,16 +149,7 @@ def _calculate_importance(word: str, pos: str) -> float:
         base_importance = HIGH_IMPORTANCE_NOUNS[word]
     
     # 2. 품사별 가중치
-    pos_weights = {
-        'COMPANY': 2.5,
-        'TECH': 2.0,
-        'FINANCE': 2.2,
-        'NUM': 1.5,
-        'ENG': 1.8,
-        'NOUN': 1.0
-    }
-    
-    pos_weight = pos_weights.get(pos, 1.0)
+    pos_weight = POS_WEIGHTS.get(pos, 1.0)
     
     # 3. 길이별 가중치 (너무 짧거나 긴 단어는 낮은 중요도)
     length = len(word)
@@ -158,8 +175,10 @@ def _calculate_importance(word: str, pos: str) -> float:
 
 def extract_key_phrases(text: str, max_phrases: int = 10) -> List[Tuple[str, float]]:
     """핵심 구문 추출"""
-    tokens = simple_korean_tokenize(text)
-    
+    return _key_phrases_from_tokens(simple_korean_tokenize(text), max_phrases)
+
+def _key_phrases_from_tokens(tokens: List[Token], max_phrases: int = 10) -> List[Tuple[str, float]]:
+    """이미 토큰화된 결과에서 핵심 구문 추출"""
     # 중요도 기준 정렬
     sorted_tokens = sorted(tokens, key=lambda x: -x.importance)
     
@@ -174,7 +193,7 @@ def extract_key_phrases(text: str, max_phrases: int = 10) -> List[Tuple[str, flo
 def enhance_query_with_morphology(query: str) -> Dict[str, any]:
     """형태소 분석을 통한 쿼리 강화"""
     tokens = simple_korean_tokenize(query)
-    key_phrases = extract_key_phrases(query)
+    key_phrases = _key_phrases_from_tokens(tokens)
     
     # 품사별 분류
     companies = [t.text for t in tokens if t.pos == 'COMPANY']
@@ -199,17 +218,7 @@ def suggest_related_terms(word: str) -> List[str]:
     word = word.lower()
     suggestions = []
     
-    # 도메인별 연관어 사전 (범용적)
-    related_terms = {
-        "수출": ["해외", "국제", "무역", "글로벌", "해외진출"],
-        "투자": ["주식", "종목", "증권", "시장", "포트폴리오"],
-        "기술": ["혁신", "연구개발", "R&D", "디지털", "인공지능"],
-        "산업": ["제조", "생산", "바이오", "IT", "에너지"],
-        "성장": ["전망", "기대", "잠재력", "발전", "확장"],
-        "제품": ["서비스", "솔루션", "플랫폼", "시스템", "애플리케이션"]
-    }
-    
-    for key, terms in related_terms.items():
+    for key, terms in RELATED_TERMS.items():
         if key in word or word in key:
             suggestions.extend(terms)
     
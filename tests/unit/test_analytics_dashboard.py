@@ -1,9 +1,15 @@
 """Unit tests for analytics dashboard functionality."""
 
 import pytest
+import asyncio
 import json
+from datetime import datetime
 from unittest.mock import Mock, patch, AsyncMock
+
+from fastapi import Response
+
 from api.routers.analytics_router import (
+    DashboardResponse,
     get_analytics_dashboard,
     get_performance_snapshot,
     get_performance_history,
@@ -11,7 +17,13 @@ from api.routers.analytics_router import (
     get_quality_analysis,
     _calculate_cache_efficiency,
     _get_l1_recommendation,
-    _get_active_alerts
+    _get_active_alerts,
+    _generate_historical_performance_data,
+    _get_dashboard_history,
+    _history_snapshot,
+    _iter_dashboard_sections,
+    start_history_refresh_task,
+    stop_history_refresh_task
 )
 
 
@@ -58,16 +70,16 @@ class TestAnalyticsRouter:
             result = await get_analytics_dashboard()
 
             # Verify response structure
-            assert "summary" in result
-            assert "real_time_metrics" in result
-            assert "cache_analytics" in result
-            assert "performance_trends" in result
-            assert "system_health" in result
+            assert isinstance(result, DashboardResponse)
+            assert result.summary.status == "operational"
+            assert result.cache_analytics.overall_stats["hit_rate"] == 0.85
+            assert isinstance(result.performance_trends.last_24h, list)
+            assert isinstance(result.system_health.alerts, list)
 
             # Verify real-time metrics
-            real_time = result["real_time_metrics"]
-            assert real_time["response_time_ms"] == 45.0
-            assert real_time["cache_hit_rate"] == 0.85
+            real_time = result.real_time_metrics
+            assert real_time.response_time_ms == 45.0
+            assert real_time.cache_hit_rate == 0.85
 
     @pytest.mark.asyncio
     async def test_get_performance_snapshot(self):
@@ -102,7 +114,7 @@ class TestAnalyticsRouter:
     @pytest.mark.asyncio
     async def test_get_performance_history(self):
         """Test performance history endpoint."""
-        result = await get_performance_history(period="24h")
+        result = await get_performance_history(Response(), period="24h")
 
         # Verify response structure
         assert "period" in result
@@ -184,6 +196,71 @@ class TestAnalyticsRouter:
             assert result["grade"] == "A"
             assert result["target_threshold"] == 0.900
 
+    @pytest.mark.asyncio
+    async def test_get_performance_history_etag(self):
+        """Test that a matching If-None-Match is answered with 304."""
+        response = Response()
+        result = await get_performance_history(response, period="1h", metric=None, if_none_match=None)
+        etag = response.headers["etag"]
+
+        assert response.headers["cache-control"] == "max-age=30"
+        assert result["period"] == "1h"
+
+        not_modified = await get_performance_history(
+            Response(), period="1h", metric=None, if_none_match=etag
+        )
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_generate_historical_data_requested_windows(self):
+        """Test that only the requested history windows are generated."""
+        data = await _generate_historical_performance_data(("last_24h", "last_7d"))
+
+        assert len(data["last_24h"]) == 24
+        assert len(data["last_7d"]) == 28
+        assert "last_30d" not in data
+        assert data["quality_trend"] == "stable"
+
+        data = await _generate_historical_performance_data()
+        assert len(data["last_1h"]) == 12
+        assert len(data["last_30d"]) == 30
+
+    @pytest.mark.asyncio
+    async def test_history_refresh_task_publishes_snapshot(self):
+        """Test that dashboard history is served from the background snapshot."""
+        await start_history_refresh_task()
+        try:
+            await asyncio.sleep(0.05)
+            snapshot = _history_snapshot["hist"]
+
+            assert await _get_dashboard_history() is snapshot
+            assert len(snapshot["last_24h"]) == 24
+            assert "last_30d" not in snapshot
+        finally:
+            await stop_history_refresh_task()
+            _history_snapshot.clear()
+
+    @pytest.mark.asyncio
+    async def test_iter_dashboard_sections(self):
+        """Test that static sections are emitted before I/O-bound ones."""
+        with patch('api.routers.analytics_router.multi_level_cache') as mock_cache, \
+             patch('api.routers.analytics_router.cached_chat_service') as mock_service:
+
+            mock_cache.get_all_stats = AsyncMock(return_value={
+                "overall": {"hit_rate": 0.85, "avg_response_time_ms": 45.0},
+                "l2": {"connected": True}
+            })
+            mock_service.get_cache_metrics = AsyncMock(return_value={})
+
+            keys = [key async for key, _ in _iter_dashboard_sections(datetime.now())]
+
+            assert keys[:3] == ["summary", "quality_analysis", "usage_patterns"]
+            assert set(keys[3:]) == {
+                "real_time_metrics", "cache_analytics",
+                "performance_trends", "system_health"
+            }
+
     def test_calculate_cache_efficiency(self):
         """Test cache efficiency calculation."""
         # Test memory cache efficiency
@@ -267,6 +344,36 @@ class TestAnalyticsRouter:
             assert "memory_pressure" in alert_ids
             assert "redis_disconnected" in alert_ids
 
+    @pytest.mark.asyncio
+    async def test_get_active_alerts_reuses_timestamp(self):
+        """Test that all alerts share the request timestamp."""
+        with patch('api.routers.analytics_router.multi_level_cache') as mock_cache:
+            mock_cache.get_all_stats = AsyncMock(return_value={
+                "overall": {"hit_rate": 0.25},
+                "l1": {"memory_usage_percent": 95},
+                "l2": {"connected": False}
+            })
+
+            now_iso = "2025-01-01T00:00:00"
+            alerts = await _get_active_alerts(now_iso=now_iso)
+
+            assert len(alerts) == 3
+            assert all(alert["timestamp"] == now_iso for alert in alerts)
+
+    @pytest.mark.asyncio
+    async def test_get_active_alerts_uses_caller_stats(self):
+        """Test that caller-provided stats skip the cache stats fetch."""
+        with patch('api.routers.analytics_router.multi_level_cache') as mock_cache:
+            mock_cache.get_all_stats = AsyncMock()
+
+            alerts = await _get_active_alerts({
+                "overall": {"hit_rate": 0.9},
+                "l2": {"connected": False}
+            })
+
+            assert [alert["id"] for alert in alerts] == ["redis_disconnected"]
+            mock_cache.get_all_stats.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_alerts_endpoint(self):
         """Test alerts endpoint."""
@@ -352,29 +459,23 @@ class TestAnalyticsDashboardIntegration:
 
             # Comprehensive validation
             assert result is not None
-            assert isinstance(result, dict)
+            assert isinstance(result, DashboardResponse)
 
-            # Validate all major sections exist
+            # Validate all major sections exist, in response order
             required_sections = [
                 "summary", "real_time_metrics", "cache_analytics",
                 "performance_trends", "system_health", "quality_analysis", "usage_patterns"
             ]
-
-            for section in required_sections:
-                assert section in result, f"Missing section: {section}"
+            assert list(result.model_dump()) == required_sections
 
             # Validate cache analytics detail
-            cache_analytics = result["cache_analytics"]
-            assert "overall_stats" in cache_analytics
-            assert "level_breakdown" in cache_analytics
-
-            level_breakdown = cache_analytics["level_breakdown"]
+            level_breakdown = result.cache_analytics.level_breakdown
             assert "l1_memory" in level_breakdown
             assert "l2_redis" in level_breakdown
             assert "l3_disk" in level_breakdown
 
             # Validate quality analysis
-            quality_analysis = result["quality_analysis"]
+            quality_analysis = result.quality_analysis
             assert "a_grade_maintenance" in quality_analysis
             assert quality_analysis["a_grade_maintenance"]["current_score"] == 0.949
 
@@ -384,7 +485,7 @@ class TestAnalyticsDashboardIntegration:
         periods = ["1h", "6h", "24h", "7d", "30d"]
 
         for period in periods:
-            result = await get_performance_history(period=period)
+            result = await get_performance_history(Response(), period=period)
 
             assert result["period"] == period
             assert isinstance(result["data_points"], list)
@@ -0,0 +1,70 @@
+"""Unit tests for the cache management invalidation endpoint."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.cache import CacheLevel
+from api.routers import cache_management_router
+from api.services import cached_chat_service as ccs_module
+
+
+@pytest.fixture
+def mlc():
+    """Multi-level cache stand-in seen by the cached chat service."""
+    cache = Mock()
+    cache.clear = AsyncMock()
+    cache.delete_pattern = AsyncMock(return_value=0)
+    with patch.object(ccs_module, "multi_level_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def local_tier():
+    """Process-local context entries of the shared cached chat service."""
+    l1 = ccs_module.cached_chat_service._l1
+    saved = dict(l1)
+    l1.clear()
+    l1["chat_context:stale"] = Mock()
+    yield l1
+    l1.clear()
+    l1.update(saved)
+
+
+@pytest.fixture
+def client():
+    """Client for an app that mounts only the cache management router."""
+    app = FastAPI()
+    app.include_router(cache_management_router.router)
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestInvalidateCache:
+    """Test suite for POST /cache/invalidate."""
+
+    def test_l1_level_clears_local_tier(self, client, mlc, local_tier):
+        """A levels-only invalidation of L1 also drops the service's local contexts."""
+        response = client.post("/cache/invalidate", json={"levels": ["l1"]})
+
+        assert response.status_code == 200
+        assert local_tier == {}
+        mlc.clear.assert_awaited_once_with([CacheLevel.L1_MEMORY])
+
+    def test_other_levels_keep_local_tier(self, client, mlc, local_tier):
+        """Invalidating only L2 leaves the local tier in place."""
+        response = client.post("/cache/invalidate", json={"levels": ["l2"]})
+
+        assert response.status_code == 200
+        assert "chat_context:stale" in local_tier
+        mlc.clear.assert_awaited_once_with([CacheLevel.L2_REDIS])
+
+    def test_no_levels_clears_everything(self, client, mlc, local_tier):
+        """An empty request clears all levels and the local tier."""
+        response = client.post("/cache/invalidate", json={})
+
+        assert response.status_code == 200
+        assert response.json()["message"] == "All cache levels cleared"
+        assert local_tier == {}
+        mlc.clear.assert_awaited_once_with(None)
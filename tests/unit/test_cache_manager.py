@@ -0,0 +1,296 @@
+"""Unit tests for the in-process cache manager and its decorator."""
+
+import asyncio
+import time
+import pytest
+
+from api.services.cache_manager import _SHARD_COUNT, AdvancedCacheManager, CacheDecorator
+
+
+@pytest.fixture
+def manager():
+    """Small cache manager per test."""
+    return AdvancedCacheManager(max_size=64, default_ttl=60.0, max_memory_mb=10)
+
+
+@pytest.fixture
+def decorator(manager):
+    """Cache decorator bound to the per-test manager."""
+    return CacheDecorator(manager)
+
+
+def _shard_keys(shard, count):
+    """Integer keys that all land in the given shard."""
+    return [shard + i * _SHARD_COUNT for i in range(count)]
+
+
+@pytest.mark.unit
+class TestAdvancedCacheManager:
+    """Test suite for AdvancedCacheManager storage, eviction and expiry."""
+
+    def test_set_and_get(self, manager):
+        """Values round-trip under the same prefix and key arguments."""
+        manager.set("news_search", {"hits": [1]}, "삼성전자", size=5)
+
+        assert manager.get("news_search", "삼성전자", size=5) == {"hits": [1]}
+        assert manager.get("news_search", "삼성전자", size=10) is None
+        assert manager.get("graph_query", "삼성전자", size=5) is None
+
+    def test_keys_are_ints_sharded_by_low_bits(self, manager):
+        """Generated keys are ints and select their shard from the low bits."""
+        key = manager._generate_cache_key("news_search", "삼성전자")
+
+        assert isinstance(key, int)
+        assert key == manager._generate_cache_key("news_search", "삼성전자")
+        assert manager._shard_index(key) == key % _SHARD_COUNT
+
+        manager.set("news_search", "value", "삼성전자")
+        assert key in manager._shards[manager._shard_index(key)]
+
+    def test_expired_entry_is_a_miss(self, manager):
+        """An entry past its TTL is removed on lookup."""
+        manager.set("news_search", "value", "q", ttl=0.01)
+        time.sleep(0.02)
+
+        assert manager.get("news_search", "q") is None
+        stats = manager.get_stats()
+        assert stats.cache_misses == 1
+        assert stats.total_size_bytes == 0
+
+    def test_expiry_heap_removes_due_entries(self, manager):
+        """Due entries are dropped by the expiry heap without a lookup."""
+        manager.set("news_search", "short", "a", ttl=0.01)
+        manager.set("news_search", "long", "b", ttl=60.0)
+        time.sleep(0.02)
+
+        manager._expire_due()
+
+        assert sum(len(shard) for shard in manager._shards) == 1
+        assert manager.get("news_search", "b") == "long"
+
+    def test_expiry_heap_skips_overwritten_entries(self, manager):
+        """A stale heap item does not remove an entry stored again with a longer TTL."""
+        manager.set("news_search", "old", "a", ttl=0.01)
+        manager.set("news_search", "new", "a", ttl=60.0)
+        time.sleep(0.02)
+
+        manager._expire_due()
+
+        assert manager.get("news_search", "a") == "new"
+
+    def test_full_capacity_is_usable(self, manager):
+        """Evenly spread keys fill max_size entries without eviction."""
+        per_shard = manager.max_size // _SHARD_COUNT
+        for shard in range(_SHARD_COUNT):
+            for key in _shard_keys(shard, per_shard):
+                manager._set_by_key(key, "news_search", key)
+
+        assert sum(len(shard) for shard in manager._shards) == manager.max_size
+        assert manager.get_stats().evictions == 0
+
+    def test_shard_capacity_rounds_up(self):
+        """Shard limits never add up to less than max_size."""
+        manager = AdvancedCacheManager(max_size=100)
+
+        assert manager._shard_max_size * _SHARD_COUNT >= 100
+        assert manager._shard_max_size == 7
+
+    def test_shard_is_bounded(self, manager):
+        """Overfilling one shard evicts down to its limit."""
+        limit = manager._shard_max_size
+        for key in _shard_keys(3, limit + 5):
+            manager._set_by_key(key, "news_search", key)
+
+        assert len(manager._shards[3]) == limit
+        assert manager.get_stats().evictions == 5
+
+    def test_clock_gives_referenced_entries_a_second_chance(self, manager):
+        """A recently read entry survives eviction in favour of an unread one."""
+        limit = manager._shard_max_size
+        keys = _shard_keys(0, limit + 1)
+        for key in keys[:limit]:
+            manager._set_by_key(key, "news_search", key)
+        manager._get_by_key(keys[0], "news_search")
+
+        manager._set_by_key(keys[limit], "news_search", keys[limit])
+
+        shard = manager._shards[0]
+        assert keys[0] in shard
+        assert keys[1] not in shard
+        assert keys[limit] in shard
+
+    def test_clock_compaction_keeps_the_inserted_key(self, manager):
+        """A key whose insert compacts the CLOCK stays evictable."""
+        limit = manager._shard_max_size
+        keys = _shard_keys(5, 2 * limit + limit + 1)
+        churn, pinned, rest = keys[:2 * limit], keys[2 * limit], keys[2 * limit + 1:]
+        for key in churn:
+            manager._set_by_key(key, "news_search", key)
+            manager._remove_entry(5, key)
+
+        manager._set_by_key(pinned, "news_search", pinned)
+
+        assert pinned in manager._clocks[5]
+        for key in rest:
+            manager._set_by_key(key, "news_search", key)
+        assert pinned not in manager._shards[5]
+        assert len(manager._shards[5]) == limit
+
+    def test_invalidate_pattern_removes_only_that_prefix(self):
+        """Invalidation by prefix uses the prefix index and keeps other categories."""
+        manager = AdvancedCacheManager(max_size=1000)
+        for i in range(20):
+            manager.set("news_search", i, i)
+            manager.set("graph_query", i, i)
+
+        manager.invalidate_pattern("news_search")
+
+        assert all(manager.get("news_search", i) is None for i in range(20))
+        assert all(manager.get("graph_query", i) == i for i in range(20))
+        assert all("news_search" not in by_prefix for by_prefix in manager._by_prefix)
+
+    def test_invalidate_single_entry(self, manager):
+        """invalidate() removes one entry and its prefix index slot."""
+        manager.set("news_search", "value", "a")
+        manager.set("news_search", "value", "b")
+
+        manager.invalidate("news_search", "a")
+
+        assert manager.get("news_search", "a") is None
+        assert manager.get("news_search", "b") == "value"
+        assert sum(len(by_prefix.get("news_search", ())) for by_prefix in manager._by_prefix) == 1
+
+    def test_stats_sum_request_counters_across_shards(self, manager):
+        """Requests, hits and misses are counted per shard and summed."""
+        for i in range(10):
+            manager.set("news_search", i, i)
+        for i in range(15):
+            manager.get("news_search", i)
+
+        stats = manager.get_stats()
+        assert stats.total_requests == 15
+        assert stats.cache_hits == 10
+        assert stats.cache_misses == 5
+        assert stats.hit_ratio == pytest.approx(10 / 15)
+
+    def test_expiry_heap_compaction_does_not_spin(self):
+        """With a small max_size the cleanup thread compacts a bounded number of times."""
+        manager = AdvancedCacheManager(max_size=4)
+        compactions = []
+        compact = manager._compact_expiry_heap
+
+        def counting_compact():
+            compactions.append(1)
+            compact()
+
+        manager._compact_expiry_heap = counting_compact
+        for i in range(200):
+            manager.set("news_search", i, i)
+        time.sleep(0.2)
+        settled = len(compactions)
+        time.sleep(0.3)
+
+        assert 0 < settled < 50
+        assert len(compactions) == settled
+        assert len(manager._expiry_heap) <= manager._heap_compact_threshold
+
+    def test_clear_resets_entries_and_stats(self, manager):
+        """clear() empties every shard and resets counters."""
+        manager.set("news_search", "value", "a")
+        manager.get("news_search", "a")
+
+        manager.clear()
+
+        stats = manager.get_stats()
+        assert manager.get("news_search", "a") is None
+        assert stats.total_requests == 0
+        assert stats.total_size_bytes == 0
+
+
+@pytest.mark.unit
+class TestCacheDecoratorCoalescing:
+    """Test suite for concurrent misses in CacheDecorator.cached."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_call_once(self, decorator, manager):
+        """Concurrent callers with the same key share one call and cache its result."""
+        release = asyncio.Event()
+        calls = []
+
+        @decorator.cached("news_search")
+        async def search(query):
+            calls.append(query)
+            await release.wait()
+            return {"hits": [query]}
+
+        callers = [asyncio.create_task(search("반도체")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert calls == ["반도체"]
+        assert all(r == {"hits": ["반도체"]} for r in results)
+        assert await search("반도체") == {"hits": ["반도체"]}
+        assert calls == ["반도체"]
+        assert decorator._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_coalesced(self, decorator):
+        """Callers with different arguments each run the function."""
+        calls = []
+
+        @decorator.cached("news_search")
+        async def search(query):
+            calls.append(query)
+            await asyncio.sleep(0)
+            return query
+
+        await asyncio.gather(search("a"), search("b"))
+
+        assert sorted(calls) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_leader_cancellation_does_not_cancel_followers(self, decorator):
+        """Cancelling the first caller leaves the call running for the others."""
+        release = asyncio.Event()
+        calls = []
+
+        @decorator.cached("graph_query")
+        async def query(cypher):
+            calls.append(cypher)
+            await release.wait()
+            return "rows"
+
+        leader = asyncio.create_task(query("MATCH (n)"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(query("MATCH (n)"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == "rows"
+        assert leader.cancelled()
+        assert calls == ["MATCH (n)"]
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_waiter(self, decorator):
+        """A failing call raises in all coalesced callers and is not cached."""
+        calls = []
+
+        @decorator.cached("news_search")
+        async def search(query):
+            calls.append(query)
+            await asyncio.sleep(0)
+            raise RuntimeError("backend down")
+
+        results = await asyncio.gather(search("x"), search("x"), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert calls == ["x"]
+        assert decorator._inflight == {}
+
+        with pytest.raises(RuntimeError):
+            await search("x")
+        assert calls == ["x", "x"]
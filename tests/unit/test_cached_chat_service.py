@@ -0,0 +1,131 @@
+"""Unit tests for the cached chat service context path."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from api.services import cached_chat_service as ccs_module
+from api.services.cached_chat_service import CachedChatService
+
+
+@pytest.fixture
+def mlc():
+    """Multi-level cache stand-in; misses unless a test sets get.return_value."""
+    cache = Mock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock(return_value=True)
+    cache.l1_cache.peek_victim.return_value = None
+    with patch.object(ccs_module, "multi_level_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def service(mlc):
+    """CachedChatService with cache initialisation skipped."""
+    svc = CachedChatService()
+    svc._ensure_cache_initialized = AsyncMock()
+    return svc
+
+
+@pytest.mark.unit
+class TestLocalContextCache:
+    """Test suite for results served from the service's local L1."""
+
+    @pytest.mark.asyncio
+    async def test_local_hits_return_fresh_copies(self, service, mlc):
+        """Cache metadata and caller mutations never leak into the stored entry."""
+        mlc.get.return_value = {"context": ["doc"], "metadata": {}}
+
+        first = await service.get_context("삼성전자 실적")
+        assert first["_cache_hit"] is True
+        first["context"] = ["mutated"]
+        first["extra"] = True
+
+        second = await service.get_context("삼성전자 실적")
+        third = await service.get_context("삼성전자 실적")
+
+        assert mlc.get.await_count == 1
+        assert second == {"context": ["doc"], "metadata": {}, "_cache_hit": True, "_cache_latency_ms": 0.0}
+        assert second is not third
+        entry = next(iter(service._l1.values()))
+        assert "_cache_hit" not in entry.response
+
+    @pytest.mark.asyncio
+    async def test_computed_result_stored_clean(self, service, mlc):
+        """A freshly computed result is stored without response metadata."""
+        service._parent_get_context = AsyncMock(return_value={"context": ["doc"], "metadata": {"quality_score": 0.9}})
+
+        first = await service.get_context("한화 방산")
+        second = await service.get_context("한화 방산")
+
+        assert first["_cache_hit"] is False
+        assert second["_cache_hit"] is True
+        service._parent_get_context.assert_awaited_once()
+        entry = next(iter(service._l1.values()))
+        assert set(entry.response) == {"context", "metadata"}
+
+
+@pytest.mark.unit
+class TestContextSingleFlight:
+    """Test suite for coalescing concurrent misses on the same key."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, service, mlc):
+        """Concurrent callers for the same query trigger a single computation."""
+        release = asyncio.Event()
+
+        async def slow_context(query, **kwargs):
+            await release.wait()
+            return {"context": ["doc"], "metadata": {}}
+
+        service._parent_get_context = AsyncMock(side_effect=slow_context)
+
+        callers = [asyncio.create_task(service.get_context("반도체 전망")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        service._parent_get_context.assert_awaited_once()
+        assert all(r["context"] == ["doc"] for r in results)
+        assert len({id(r) for r in results}) == 3
+        assert service._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_leader_cancellation_does_not_cancel_followers(self, service, mlc):
+        """Cancelling the first caller leaves the load running for the others."""
+        release = asyncio.Event()
+
+        async def slow_context(query, **kwargs):
+            await release.wait()
+            return {"context": ["doc"], "metadata": {}}
+
+        service._parent_get_context = AsyncMock(side_effect=slow_context)
+
+        leader = asyncio.create_task(service.get_context("원전 수출"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(service.get_context("원전 수출"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        result = await follower
+        assert result["context"] == ["doc"]
+        assert leader.cancelled()
+        service._parent_get_context.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_load_error_reaches_every_waiter(self, service, mlc):
+        """A failing load raises in all coalesced callers and is not kept in flight."""
+        service._parent_get_context = AsyncMock(side_effect=RuntimeError("backend down"))
+
+        results = await asyncio.gather(
+            service.get_context("금융 지주"),
+            service.get_context("금융 지주"),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        service._parent_get_context.assert_awaited_once()
+        assert service._inflight == {}
@@ -8,6 +8,8 @@ from unittest.mock import Mock, AsyncMock, patch
 from api.utils.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
 from api.utils.retry_handler import RetryHandler, RetryConfig, BackoffStrategy
 from api.utils.graceful_degradation import GracefulDegradationManager, ServiceLevel
+from api.utils.error_responses import wrap_errors
+from fastapi import HTTPException
 
 
 @pytest.mark.unit
@@ -305,6 +307,37 @@ class TestGracefulDegradation:
             pass
 
 
+@pytest.mark.unit
+class TestWrapErrors:
+    """Test suite for the wrap_errors handler decorator."""
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_becomes_static_http_exception(self):
+        """Test that internal error text is logged but not returned."""
+        @wrap_errors(503, "Service unavailable")
+        async def handler():
+            raise RuntimeError("secret connection string")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await handler()
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.detail == "Service unavailable"
+
+    @pytest.mark.asyncio
+    async def test_http_exception_passes_through(self):
+        """Test that deliberate HTTPExceptions are not rewrapped."""
+        @wrap_errors(500, "Failed")
+        async def handler(value: int):
+            raise HTTPException(status_code=400, detail=f"Bad value {value}")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await handler(7)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Bad value 7"
+
+
 @pytest.mark.integration
 class TestErrorHandlingIntegration:
     """Integration tests for error handling components."""
@@ -0,0 +1,122 @@
+"""Unit tests for the health router readiness probes."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from api.routers import health_router
+
+
+@pytest.fixture
+def client():
+    """Client for an app that mounts only the health router, with a cold readiness cache."""
+    health_router._ready_cache["result"] = None
+    app = FastAPI()
+    app.include_router(health_router.router)
+    yield TestClient(app)
+    health_router._ready_cache["result"] = None
+
+
+@pytest.mark.unit
+class TestReadiness:
+    """Test suite for /health/ready."""
+
+    def test_ready_when_backends_respond(self, client):
+        """Both pings succeeding reports ready."""
+        service = health_router.enhanced_chat_service
+        with patch.object(service.neo, "ping", AsyncMock(return_value={"ok": True, "database": "neo4j"})), \
+                patch.object(service.os, "ping", AsyncMock(return_value=True)):
+            response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["ready"] is True
+        assert set(body["services"]) == {"neo4j_connection", "opensearch_connection"}
+
+    def test_not_ready_when_neo4j_down(self, client):
+        """A failing Neo4j ping makes readiness return 503."""
+        service = health_router.enhanced_chat_service
+        with patch.object(service.neo, "ping", AsyncMock(return_value={"ok": False, "error": "connection refused"})), \
+                patch.object(service.os, "ping", AsyncMock(return_value=True)):
+            response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert "neo4j_connection" in response.json()["detail"]["message"]
+        assert health_router._ready_cache["result"] is None
+
+    def test_not_ready_when_opensearch_ping_raises(self, client):
+        """A probe that raises is treated as a failed critical service."""
+        service = health_router.enhanced_chat_service
+        with patch.object(service.neo, "ping", AsyncMock(return_value={"ok": True})), \
+                patch.object(service.os, "ping", AsyncMock(side_effect=ConnectionError("down"))):
+            response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert "opensearch_connection" in response.json()["detail"]["message"]
+
+    def test_readiness_does_not_run_chat_pipeline(self, client):
+        """Readiness stays on ping-level checks."""
+        service = health_router.enhanced_chat_service
+        with patch.object(service.neo, "ping", AsyncMock(return_value={"ok": True})), \
+                patch.object(service.os, "ping", AsyncMock(return_value=True)), \
+                patch.object(service, "get_context", AsyncMock()) as get_context:
+            client.get("/health/ready")
+
+        get_context.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failing_probers_share_one_probe(self, client):
+        """Probers arriving during a failing probe get its 503 instead of probing again."""
+        release = asyncio.Event()
+
+        async def failing_probes(probes):
+            await release.wait()
+            return {"neo4j_connection": {"healthy": False, "critical": True, "error": "down"}}
+
+        with patch.object(health_router, "_test_critical_services", AsyncMock(side_effect=failing_probes)) as probe:
+            waiters = [asyncio.create_task(health_router.readiness_check()) for _ in range(2)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert probe.await_count == 1
+        assert all(isinstance(r, HTTPException) and r.status_code == 503 for r in results)
+        assert health_router._ready_probe["task"] is None
+        assert health_router._ready_cache["result"] is None
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_cached_after_probe(self, client):
+        """A prober after a failed probe finishes runs a fresh probe."""
+        healthy = {"neo4j_connection": {"healthy": True, "critical": True}}
+        failed = {"neo4j_connection": {"healthy": False, "critical": True, "error": "down"}}
+
+        with patch.object(health_router, "_test_critical_services", AsyncMock(side_effect=[failed, healthy])) as probe:
+            with pytest.raises(HTTPException):
+                await health_router.readiness_check()
+            result = await health_router.readiness_check()
+
+        assert probe.await_count == 2
+        assert result["ready"] is True
+
+
+@pytest.mark.unit
+class TestCriticalServices:
+    """Test suite for probe result classification."""
+
+    @pytest.mark.asyncio
+    async def test_error_status_is_unhealthy(self):
+        """A probe reporting status=error is unhealthy even without raising."""
+        probes = {
+            "backend": {
+                "test_func": AsyncMock(return_value={"status": "error", "error": "down"}),
+                "critical": True,
+                "timeout": 1.0
+            }
+        }
+
+        results = await health_router._test_critical_services(probes)
+
+        assert results["backend"]["healthy"] is False
+        assert results["backend"]["error"] == "down"
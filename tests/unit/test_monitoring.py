@@ -1,11 +1,14 @@
 """Unit tests for monitoring and metrics collection."""
 
+import gzip
 import pytest
 import time
 from unittest.mock import Mock, AsyncMock, patch
 from api.monitoring.metrics import metrics_collector, MetricsCollector
 from api.monitoring.middleware import PrometheusMiddleware, HealthMonitoringMiddleware
+from api.monitoring.rate import RateCounter
 from fastapi import Request, Response
+from prometheus_client import CONTENT_TYPE_LATEST
 from starlette.applications import Starlette
 from starlette.responses import PlainTextResponse
 
@@ -157,6 +160,43 @@ class TestMetricsCollector:
         assert "# HELP" in metrics_output or "# TYPE" in metrics_output or len(metrics_output) >= 0
 
 
+@pytest.mark.unit
+class TestRateCounter:
+    """Test suite for the sliding-window RateCounter."""
+
+    def test_rate_counter_window(self):
+        """Test rpm and success rate over the window."""
+        counter = RateCounter(window_seconds=60)
+
+        with patch('api.monitoring.rate.time.monotonic', return_value=1000.0):
+            assert counter.rpm() == 0
+            assert counter.success_rate() == 1.0
+
+            for _ in range(3):
+                counter.record()
+            counter.record(error=True)
+
+            assert counter.rpm() == 4
+            assert counter.success_rate() == 0.75
+
+        # Buckets older than the window no longer count
+        with patch('api.monitoring.rate.time.monotonic', return_value=1061.0):
+            counter.record()
+            assert counter.rpm() == 1
+            assert counter.success_rate() == 1.0
+
+    def test_rate_counter_reuses_stale_bucket(self):
+        """Test that a bucket is reset when its second comes around again."""
+        counter = RateCounter(window_seconds=10)
+
+        with patch('api.monitoring.rate.time.monotonic', return_value=5.0):
+            counter.record(error=True)
+        with patch('api.monitoring.rate.time.monotonic', return_value=15.0):
+            counter.record()
+            assert counter.rpm() == 6
+            assert counter.success_rate() == 1.0
+
+
 @pytest.mark.unit
 class TestPrometheusMiddleware:
     """Test suite for PrometheusMiddleware."""
@@ -203,6 +243,29 @@ class TestPrometheusMiddleware:
         with pytest.raises(Exception, match="Test error"):
             await middleware.dispatch(request, mock_call_next_error)
 
+    def test_prometheus_middleware_counts_unhandled_errors(self):
+        """Test that a route raising an exception lowers the success rate."""
+        from starlette.routing import Route
+        from starlette.testclient import TestClient
+
+        async def ok(request):
+            return PlainTextResponse("ok")
+
+        async def boom(request):
+            raise RuntimeError("route failed")
+
+        app = Starlette(routes=[Route("/ok", ok), Route("/boom", boom)])
+        app.add_middleware(PrometheusMiddleware)
+        counter = RateCounter()
+
+        with patch('api.monitoring.middleware.request_rate', counter):
+            client = TestClient(app, raise_server_exceptions=False)
+            assert client.get("/ok").status_code == 200
+            assert client.get("/boom").status_code == 500
+
+        assert counter.rpm() == 2
+        assert counter.success_rate() == 0.5
+
 
 @pytest.mark.unit
 class TestHealthMonitoringMiddleware:
@@ -298,6 +361,12 @@ class TestHealthMonitoringMiddleware:
                 mock_update.assert_called_with(expected_healthy, expected_degradation)
 
 
+def _scrape_request(accept_encoding: bytes = b"") -> Request:
+    """Build a bare GET /metrics request."""
+    headers = [(b"accept-encoding", accept_encoding)] if accept_encoding else []
+    return Request({"type": "http", "method": "GET", "path": "/metrics", "headers": headers})
+
+
 @pytest.mark.integration
 class TestMonitoringIntegration:
     """Integration tests for monitoring system."""
@@ -308,12 +377,54 @@ class TestMonitoringIntegration:
         from api.routers.metrics_router import get_prometheus_metrics
 
         # Call metrics endpoint
-        result = await get_prometheus_metrics()
+        result = await get_prometheus_metrics(_scrape_request())
 
-        # Should return string in Prometheus format
-        assert isinstance(result, str)
-        # Basic validation - should contain metric types or help text
-        assert len(result) >= 0
+        # Should return Prometheus exposition bytes
+        assert isinstance(result, Response)
+        assert result.media_type == CONTENT_TYPE_LATEST
+        assert isinstance(result.body, bytes)
+        assert "content-encoding" not in result.headers
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_reuses_recent_scrape(self):
+        """Test that scrapes within the TTL share one stats rebuild."""
+        from api.routers import metrics_router
+
+        with patch.object(metrics_router, 'multi_level_cache') as mock_cache, \
+             patch.dict(metrics_router._METRICS_CACHE, {"ts": 0.0, "body": b"", "body_gz": b""}):
+            mock_cache.get_all_stats = AsyncMock(return_value={})
+
+            first = await metrics_router.get_prometheus_metrics(_scrape_request())
+            second = await metrics_router.get_prometheus_metrics(_scrape_request())
+
+            assert first.body == second.body
+            mock_cache.get_all_stats.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_gzip(self):
+        """Test that gzip-accepting scrapers get the precompressed body."""
+        from api.routers.metrics_router import get_prometheus_metrics
+
+        plain = await get_prometheus_metrics(_scrape_request())
+        compressed = await get_prometheus_metrics(_scrape_request(b"gzip, deflate"))
+
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(compressed.body) == plain.body
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_gzip_refused(self):
+        """Test that scrapers refusing gzip with q=0 get the plain body."""
+        from api.routers.metrics_router import get_prometheus_metrics
+
+        plain = await get_prometheus_metrics(_scrape_request())
+        for header in (b"gzip;q=0", b"identity, gzip;q=0", b"gzip;q=0, *", b"deflate, *;q=0"):
+            result = await get_prometheus_metrics(_scrape_request(header))
+
+            assert "content-encoding" not in result.headers
+            assert result.body == plain.body
+
+        wildcard = await get_prometheus_metrics(_scrape_request(b"identity;q=0.5, *;q=0.1"))
+        assert wildcard.headers["content-encoding"] == "gzip"
 
     @pytest.mark.asyncio
     async def test_health_endpoint_integration(self):
@@ -340,4 +451,33 @@ class TestMonitoringIntegration:
         if "status" not in result or result.get("status") != "error":
             assert "quality_score" in result
             assert "cache_stats" in result
-            assert "performance" in result
\ No newline at end of file
+            assert "performance" in result
+
+    @pytest.mark.asyncio
+    async def test_dashboard_served_from_refresh_snapshot(self):
+        """Test that the dashboard returns the background-serialized snapshot."""
+        import asyncio
+        import orjson
+        from api.routers import metrics_router
+
+        stats = {"overall": {"hit_rate": 0.8, "avg_response_time_ms": 42.0}}
+        with patch.object(metrics_router.multi_level_cache, "get_all_stats",
+                          AsyncMock(return_value=stats)) as mock_stats, \
+             patch.object(metrics_router.cached_chat_service, "get_cache_metrics",
+                          AsyncMock(return_value={})):
+            await metrics_router.start_dashboard_refresh_task()
+            try:
+                await asyncio.sleep(0.05)
+                result = await metrics_router.get_dashboard_metrics()
+
+                assert isinstance(result, Response)
+                body = orjson.loads(result.body)
+                assert body["performance"]["avg_response_time_ms"] == 42.0
+                assert mock_stats.await_count == 1
+
+                # fresh=true bypasses the snapshot
+                fresh = await metrics_router.get_dashboard_metrics(fresh=True)
+                assert fresh["cache_stats"] == stats
+            finally:
+                await metrics_router.stop_dashboard_refresh_task()
+                metrics_router._dashboard_body.clear()
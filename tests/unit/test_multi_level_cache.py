@@ -1,6 +1,7 @@
 """Unit tests for multi-level caching system."""
 
 import asyncio
+import pickle
 import pytest
 import tempfile
 import shutil
@@ -14,7 +15,10 @@ from api.cache.multi_level_cache import (
     MultiLevelCache,
     CacheLevel,
     CacheEntry,
-    cache_key_generator
+    CountMinSketch,
+    cache_key_generator,
+    get_stats_cached,
+    request_stats_scope
 )
 from api.cache.cache_decorators import (
     multi_cache,
@@ -49,22 +53,19 @@ class TestL1MemoryCache:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_l1_lru_eviction(self):
-        """Test LRU eviction in L1 cache."""
+    async def test_l1_clock_eviction(self):
+        """Test CLOCK eviction in L1 cache."""
         cache = L1MemoryCache(max_size=2, max_memory_mb=1)
 
         # Fill cache to capacity
         await cache.set("key1", "value1")
         await cache.set("key2", "value2")
+        assert set(cache.cache) == {"key1", "key2"}
 
-        # Both should be accessible
+        # Access key1 to set its reference bit
         assert await cache.get("key1") == "value1"
-        assert await cache.get("key2") == "value2"
 
-        # Access key1 to make it recently used
-        await cache.get("key1")
-
-        # Add third item - should evict key2 (least recently used)
+        # Add third item - key1 gets a second chance, key2 (unreferenced) is evicted
         await cache.set("key3", "value3")
 
         assert await cache.get("key1") == "value1"  # Still exists
@@ -103,6 +104,72 @@ class TestL1MemoryCache:
         assert len(cache.cache) == 0
         assert await cache.get("key1") is None
 
+    @pytest.mark.asyncio
+    async def test_l1_delete_pattern(self):
+        """Test L1 glob pattern deletion."""
+        cache = L1MemoryCache(max_size=10, max_memory_mb=1)
+
+        await cache.set("chat:1", "value1")
+        await cache.set("chat:2", "value2")
+        await cache.set("report:1", "value3")
+
+        assert await cache.delete_pattern("chat:*") == 2
+        assert list(cache.cache) == ["report:1"]
+        assert cache.current_memory_bytes == cache.cache["report:1"].size_bytes
+
+    @pytest.mark.asyncio
+    async def test_l1_slots_reused_after_delete(self):
+        """Test that deleted entries free their CLOCK slots."""
+        cache = L1MemoryCache(max_size=2, max_memory_mb=1)
+
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        await cache.delete("key1")
+        await cache.set("key3", "value3")
+
+        assert set(cache.cache) == {"key2", "key3"}
+        assert sorted(entry.slot for entry in cache.cache.values()) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_l1_peek_victim(self):
+        """Test that peek_victim names the CLOCK victim without evicting it."""
+        cache = L1MemoryCache(max_size=2, max_memory_mb=1)
+
+        await cache.set("key1", "value1")
+        assert cache.peek_victim() is None
+
+        await cache.set("key2", "value2")
+        await cache.get("key1")
+
+        assert cache.peek_victim() == "key2"
+        assert set(cache.cache) == {"key1", "key2"}
+
+
+@pytest.mark.unit
+class TestCountMinSketch:
+    """Test suite for the admission frequency sketch."""
+
+    def test_estimate_tracks_increments(self):
+        """Test that estimates never undercount before aging."""
+        sketch = CountMinSketch(width=64, depth=4)
+
+        for _ in range(5):
+            sketch.increment("hot")
+        sketch.increment("cold")
+
+        assert sketch.estimate("hot") >= 5
+        assert sketch.estimate("cold") >= 1
+        assert sketch.estimate("hot") > sketch.estimate("cold")
+
+    def test_counters_halve_after_sample(self):
+        """Test that counters are aged after width * 10 increments."""
+        sketch = CountMinSketch(width=16, depth=2)
+
+        for _ in range(160):
+            sketch.increment("key")
+
+        assert sketch.estimate("key") == 80
+
 
 @pytest.mark.unit
 class TestL2RedisCache:
@@ -155,6 +222,24 @@ class TestL2RedisCache:
             success = await cache.delete("key1")
             assert success is True
 
+    @pytest.mark.asyncio
+    async def test_l2_delete_pattern_uses_scan_unlink(self):
+        """Test that pattern deletion walks SCAN cursors and UNLINKs batches."""
+        with patch('redis.asyncio.from_url') as mock_redis:
+            mock_client = AsyncMock()
+            mock_redis.return_value = mock_client
+
+            cache = L2RedisCache(prefix="test:")
+            await cache.connect()
+
+            mock_client.scan.side_effect = [(7, [b"test:chat:1"]), (0, [b"test:chat:2"])]
+            mock_client.unlink.return_value = 1
+
+            assert await cache.delete_pattern("chat:*", batch=50) == 2
+            mock_client.scan.assert_any_await(0, match="test:chat:*", count=50)
+            mock_client.scan.assert_any_await(7, match="test:chat:*", count=50)
+            mock_client.keys.assert_not_awaited()
+
 
 @pytest.mark.unit
 class TestL3DiskCache:
@@ -187,6 +272,19 @@ class TestL3DiskCache:
         result = await cache.get("key1")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_l3_payload_compressed(self, temp_cache_dir):
+        """Test that L3 files are tagged, compressed payloads."""
+        cache = L3DiskCache(cache_dir=temp_cache_dir, max_size_gb=0.01)
+        value = {"context": ["article text"] * 200}
+
+        await cache.set("key1", value, ttl=10.0)
+
+        data = cache._get_cache_file("key1").read_bytes()
+        assert data[0] in (1, 2)
+        assert len(data) < len(pickle.dumps(value))
+        assert await cache.get("key1") == value
+
     @pytest.mark.asyncio
     async def test_l3_ttl_expiration(self, temp_cache_dir):
         """Test TTL expiration in L3 cache."""
@@ -219,6 +317,18 @@ class TestL3DiskCache:
         assert len(cache.index) == 0
         assert await cache.get("key1") is None
 
+    @pytest.mark.asyncio
+    async def test_l3_delete_pattern(self, temp_cache_dir):
+        """Test L3 glob pattern deletion."""
+        cache = L3DiskCache(cache_dir=temp_cache_dir, max_size_gb=0.01)
+
+        await cache.set("chat:1", "value1")
+        await cache.set("report:1", "value2")
+
+        assert await cache.delete_pattern("chat:*") == 1
+        assert list(cache.index) == ["report:1"]
+        assert await cache.get("chat:1") is None
+
 
 @pytest.mark.unit
 class TestMultiLevelCache:
@@ -282,6 +392,47 @@ class TestMultiLevelCache:
         assert stats["overall"]["l3_hits"] >= 1
         assert stats["overall"]["l1_hits"] >= 1
 
+    @pytest.mark.asyncio
+    async def test_mlc_get_restricted_levels(self, temp_cache_dir):
+        """Test that get only consults the requested cache levels."""
+        mlc = MultiLevelCache(
+            l1_config={"max_size": 10, "max_memory_mb": 1},
+            l3_config={"cache_dir": temp_cache_dir},
+            enable_l2=False,
+            enable_l3=True
+        )
+
+        await mlc.initialize()
+        await mlc.set("key1", "value1", cache_levels=[CacheLevel.L3_DISK])
+
+        assert await mlc.get("key1", cache_levels=[CacheLevel.L1_MEMORY]) is None
+        assert mlc.stats.l3_hits == 0
+        assert await mlc.get("key1") == "value1"
+
+    @pytest.mark.asyncio
+    async def test_mlc_batch_get_and_set(self, temp_cache_dir):
+        """Test batched set and get across levels."""
+        mlc = MultiLevelCache(
+            l1_config={"max_size": 10, "max_memory_mb": 1},
+            l3_config={"cache_dir": temp_cache_dir},
+            enable_l2=False,
+            enable_l3=True
+        )
+
+        await mlc.initialize()
+
+        await mlc.mset_many({"key1": ("value1", 10.0)}, cache_levels=[CacheLevel.L1_MEMORY])
+        await mlc.mset_many({"key2": ("value2", 10.0)}, cache_levels=[CacheLevel.L3_DISK])
+
+        found = await mlc.mget_many(["key1", "key2", "missing"])
+        assert found == {"key1": "value1", "key2": "value2"}
+
+        # L3 hit was promoted to L1
+        assert await mlc.l1_cache.get("key2") == "value2"
+        assert mlc.stats.l1_hits == 1
+        assert mlc.stats.l3_hits == 1
+        assert mlc.stats.misses == 1
+
     @pytest.mark.asyncio
     async def test_mlc_different_ttls(self):
         """Test different TTLs for different cache levels."""
@@ -326,6 +477,49 @@ class TestMultiLevelCache:
         assert await mlc.get("key1") is None
         assert await mlc.get("key2") is None
 
+    @pytest.mark.asyncio
+    async def test_get_stats_cached_request_scope(self):
+        """Test that stats are fetched once per request scope."""
+        mlc = Mock()
+        mlc.get_all_stats = AsyncMock(return_value={"overall": {"hit_rate": 0.5}})
+
+        # Outside a scope every call fetches fresh stats
+        await get_stats_cached(mlc)
+        await get_stats_cached(mlc)
+        assert mlc.get_all_stats.await_count == 2
+
+        mlc.get_all_stats.reset_mock()
+        scope = request_stats_scope()
+        await scope.__anext__()
+        try:
+            first = await get_stats_cached(mlc)
+            second = await get_stats_cached(mlc)
+        finally:
+            await scope.aclose()
+
+        assert first is second
+        assert mlc.get_all_stats.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_stats_cached_shares_inflight_fetch(self):
+        """Test that concurrent callers in one scope share a single fetch."""
+        async def slow_stats():
+            await asyncio.sleep(0.01)
+            return {"overall": {"hit_rate": 0.5}}
+
+        mlc = Mock()
+        mlc.get_all_stats = AsyncMock(side_effect=slow_stats)
+
+        scope = request_stats_scope()
+        await scope.__anext__()
+        try:
+            first, second = await asyncio.gather(get_stats_cached(mlc), get_stats_cached(mlc))
+        finally:
+            await scope.aclose()
+
+        assert first is second
+        assert mlc.get_all_stats.await_count == 1
+
 
 @pytest.mark.unit
 class TestCacheDecorators:
@@ -0,0 +1,144 @@
+"""Unit tests for the multi-strategy news search path."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from api.services import chat_service as chat_module
+from api.services import error_handler as error_module
+from api.services import redis_cache as redis_module
+from api.services.chat_service import ChatService, _is_cacheable_msearch
+from api.services.error_handler import CircuitBreaker, ServiceHealth, ServiceStatus
+from api.services.search_strategy import SearchStrategy
+
+
+STRATEGIES = [
+    SearchStrategy(name="exact", query="한화 방산 수출", weight=1.0, priority=1),
+    SearchStrategy(name="broad", query="방산", weight=0.8, priority=2),
+]
+
+# Quality reported by the search engine per strategy name
+QUALITY = {"exact": 0.4, "broad": 0.7}
+
+
+def _hit(doc_id, title):
+    return {"_id": doc_id, "_score": 1.0, "_index": "news", "_source": {"title": title}}
+
+
+def _response(*titles):
+    return {"hits": {"hits": [_hit(f"id-{title}", title) for title in titles]}}
+
+
+@pytest.fixture
+def opensearch_health():
+    """Fresh OpenSearch health and circuit breaker so tests do not share failures."""
+    with patch.dict(error_module.error_handler.service_health, {"opensearch": ServiceHealth(ServiceStatus.HEALTHY)}), \
+            patch.dict(error_module.error_handler.circuit_breakers,
+                       {"opensearch": CircuitBreaker(failure_threshold=3, recovery_timeout=30.0)}):
+        yield error_module.error_handler.service_health["opensearch"]
+
+
+@pytest.fixture
+def service(opensearch_health):
+    """ChatService with a mocked OpenSearch client, fixed strategies and no Redis cache."""
+    engine = Mock()
+    engine.detect_query_domain.return_value = []
+    engine.extract_entities.return_value = {}
+    engine.build_enhanced_queries.return_value = STRATEGIES
+    engine.evaluate_search_quality.side_effect = lambda hits, query, strategy: QUALITY[strategy.name]
+
+    with patch.object(chat_module, "advanced_search_engine", engine), \
+            patch.object(redis_module.settings, "search_cache_enabled", False), \
+            patch.object(error_module.asyncio, "sleep", AsyncMock()):
+        svc = ChatService()
+        svc.os = Mock()
+        svc.os.msearch = AsyncMock()
+        yield svc
+
+
+@pytest.mark.unit
+class TestNewsMultiSearch:
+    """Test suite for _search_news_advanced over _msearch."""
+
+    @pytest.mark.asyncio
+    async def test_responses_map_to_strategies(self, service, opensearch_health):
+        """Each response is scored against its strategy and the best one wins."""
+        service.os.msearch.return_value = {
+            "responses": [_response("A", "A", "B"), _response("C")]
+        }
+
+        result, _, err = await service._search_news_advanced("한화 방산 수출", ["한화"], size=5)
+
+        assert err is None
+        assert result.strategy == "broad"
+        assert result.query_used == "방산"
+        assert [hit["title"] for hit in result.hits] == ["C"]
+        bodies = service.os.msearch.await_args.args[1]
+        assert len(bodies) == len(STRATEGIES)
+        assert opensearch_health.success_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_response_is_skipped(self, service):
+        """A per-search error leaves that strategy out without failing the others."""
+        service.os.msearch.return_value = {
+            "responses": [_response("A", "B"), {"error": {"type": "search_phase_execution_exception"}}]
+        }
+
+        strategy_hits, _, err = await service._msearch_news(("한화 방산 수출", "방산"), 5)
+        result, _, _ = await service._search_news_advanced("한화 방산 수출", ["한화"], size=5)
+
+        assert err is None
+        assert strategy_hits[1] is None
+        assert [hit["title"] for hit in strategy_hits[0]] == ["A", "B"]
+        assert result.strategy == "exact"
+        assert not _is_cacheable_msearch((strategy_hits, 1.0, err))
+
+    @pytest.mark.asyncio
+    async def test_request_failure_retries_then_searches_concurrently(self, service, opensearch_health):
+        """A failing _msearch is retried, recorded, and replaced by per-strategy searches."""
+        service.os.msearch.side_effect = ConnectionError("msearch unavailable")
+        service._search_news = AsyncMock(side_effect=lambda query, size: ([{"title": query}], 1.0, None))
+
+        result, _, err = await service._search_news_advanced("한화 방산 수출", ["한화"], size=5)
+
+        assert service.os.msearch.await_count == 3
+        assert opensearch_health.error_count == 1
+        assert err is None
+        assert result.strategy == "broad"
+        assert service._search_news.await_count == len(STRATEGIES)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_search_stops_on_high_quality(self, service):
+        """A result above the quality bar cancels the strategies still running."""
+        cancelled = asyncio.Event()
+
+        async def search(query, size):
+            if query == "방산":
+                return [{"title": "fast"}], 1.0, None
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        service._search_news = search
+        with patch.dict(QUALITY, {"broad": 0.9}):
+            result = await service._search_strategies_concurrently("한화 방산 수출", STRATEGIES, 5)
+
+        assert result.strategy == "broad"
+        assert cancelled.is_set()
+
+
+@pytest.mark.unit
+class TestMultiSearchCacheCondition:
+    """Test suite for which _msearch results are shared through Redis."""
+
+    def test_complete_results_are_cached(self):
+        """Results without failed searches and with some hits are cached."""
+        assert _is_cacheable_msearch(([[{"title": "A"}], []], 1.0, None))
+
+    def test_empty_or_failed_results_are_not_cached(self):
+        """Empty, partially failed or fallback results are not cached."""
+        assert not _is_cacheable_msearch(([[], []], 1.0, None))
+        assert not _is_cacheable_msearch(([[{"title": "A"}], None], 1.0, None))
+        assert not _is_cacheable_msearch(([], 0.0, "OpenSearch 서비스 사용 불가"))
@@ -0,0 +1,130 @@
+"""Unit tests for the shared Redis cache-aside layer."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from api.services import redis_cache as redis_cache_module
+from api.services.redis_cache import RedisCache, redis_cached
+
+
+class _Service:
+    """Minimal service whose lookups count backend calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @redis_cached("test_search", ttl=60, condition=lambda result: result[2] is None)
+    async def search(self, query: str, size: int = 5):
+        self.calls += 1
+        if query == "broken":
+            return [], 1.0, "backend error"
+        return [{"title": query}], 1.0, None
+
+
+@pytest.fixture
+def fake_client():
+    """RedisCache wired to an in-memory fake client."""
+    store = {}
+    client = AsyncMock()
+    client.get.side_effect = lambda key: store.get(key)
+
+    async def fake_set(key, value, ex=None, nx=False):
+        if nx and key in store:
+            return None
+        store[key] = value
+        return True
+
+    client.set.side_effect = fake_set
+    cache = RedisCache("redis://localhost:6379")
+    cache._client = client
+    with patch.object(redis_cache_module, "redis_cache", cache):
+        yield cache, client, store
+
+
+@pytest.mark.unit
+class TestRedisCached:
+    """Test suite for the redis_cached decorator."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, fake_client):
+        """Second call with an equivalent query is served from Redis."""
+        cache, client, store = fake_client
+        service = _Service()
+
+        first = await service.search("한화  방산")
+        second = await service.search("한화 방산")
+
+        assert service.calls == 1
+        assert first == ([{"title": "한화  방산"}], 1.0, None)
+        assert second == [[{"title": "한화  방산"}], 1.0, None]
+        assert cache.hits == 1 and cache.misses == 1
+        key, = store
+        assert key.startswith(f"ontology_chat:v{redis_cache_module.CACHE_SCHEMA_VERSION}:test_search:")
+        assert client.set.call_args.kwargs == {"ex": 60, "nx": True}
+
+    @pytest.mark.asyncio
+    async def test_condition_skips_error_results(self, fake_client):
+        """Results rejected by the condition are not stored."""
+        _, _, store = fake_client
+        service = _Service()
+
+        await service.search("broken")
+        await service.search("broken")
+
+        assert service.calls == 2
+        assert store == {}
+
+    @pytest.mark.asyncio
+    async def test_disabled_setting_bypasses_redis(self, fake_client):
+        """With the shared cache disabled, every call reaches the backend."""
+        _, client, _ = fake_client
+        service = _Service()
+
+        with patch.object(redis_cache_module.settings, "search_cache_enabled", False):
+            await service.search("query")
+            await service.search("query")
+
+        assert service.calls == 2
+        client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_connection_error_backs_off(self):
+        """A failing Redis is skipped until the retry window passes."""
+        cache = RedisCache("redis://localhost:6379")
+        cache._client = AsyncMock()
+        cache._client.get.side_effect = ConnectionError("down")
+
+        assert await cache.get("key") is None
+        assert await cache.get("key") is None
+
+        assert cache._client.get.await_count == 1
+        assert cache.get_stats()["available"] is False
+        assert cache.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_undecodable_value_is_a_miss(self, fake_client):
+        """A corrupt cached value falls back to the backend and is replaced."""
+        cache, client, store = fake_client
+        service = _Service()
+        await service.search("query")
+        key, = store
+        store[key] = b"\x80not json"
+        client.delete.side_effect = lambda key: store.pop(key, None)
+
+        result = await service.search("query")
+
+        assert result == ([{"title": "query"}], 1.0, None)
+        assert service.calls == 2
+        assert cache.misses == 2 and cache.errors == 1
+        assert cache.get_stats()["available"] is True
+        assert await service.search("query") == [[{"title": "query"}], 1.0, None]
+
+    def test_pool_sets_socket_timeouts(self):
+        """The connection pool fails fast instead of blocking on a stalled Redis."""
+        cache = RedisCache("redis://localhost:6379")
+
+        client = cache._get_client()
+
+        kwargs = client.connection_pool.connection_kwargs
+        assert kwargs["socket_connect_timeout"] == redis_cache_module._SOCKET_CONNECT_TIMEOUT_SECONDS
+        assert kwargs["socket_timeout"] == redis_cache_module._SOCKET_TIMEOUT_SECONDS